@@ -15,8 +15,11 @@
 
 use crate::graph::metatron::MetatronGraph;
 use crate::quantum::METATRON_DIMENSION;
+use crate::quantum::operator::QuantumOperator;
 use crate::vqa::optimizer::OptimizerType;
-use crate::vqa::qaoa::{QAOA, QAOABuilder, create_maxcut_hamiltonian};
+use crate::vqa::qaoa::{QAOABuilder, create_maxcut_hamiltonian};
+use rand::SeedableRng;
+use rand::rngs::StdRng;
 use serde::{Deserialize, Serialize};
 use std::sync::Arc;
 
@@ -69,11 +72,13 @@ pub struct SolutionMetadata {
 /// println!("Cut value: {}", solution.cut_value);
 /// ```
 pub struct QaoaMaxCutSolver {
-    qaoa: QAOA,
+    cost_hamiltonian: Arc<QuantumOperator>,
     depth: usize,
     max_iterations: usize,
+    optimizer: OptimizerType,
     seed: Option<u64>,
     tolerance: f64,
+    edges: Option<Arc<[(usize, usize)]>>,
 }
 
 impl QaoaMaxCutSolver {
@@ -85,26 +90,35 @@ impl QaoaMaxCutSolver {
     /// # Returns
     /// A solver with default parameters (depth=3, max_iterations=100)
     pub fn from_graph(graph: &MetatronGraph) -> Self {
-        let edges: Vec<(usize, usize)> = graph.edges().to_vec();
-        let cost_hamiltonian = Arc::new(create_maxcut_hamiltonian(&edges));
-
-        let qaoa = QAOABuilder::new()
-            .cost_hamiltonian(cost_hamiltonian)
-            .depth(3)
-            .optimizer(OptimizerType::NelderMead)
-            .max_iterations(100)
-            .verbose(false)
-            .build();
+        let edges: Arc<[(usize, usize)]> = Arc::from(graph.edges());
+        Self::from_cost_hamiltonian(Arc::new(create_maxcut_hamiltonian(&edges))).with_edges(edges)
+    }
 
+    /// Create a MaxCut solver from a prebuilt cost Hamiltonian
+    ///
+    /// Useful when the same graph is solved repeatedly and the cost
+    /// Hamiltonian is cached by the caller.
+    pub fn from_cost_hamiltonian(cost_hamiltonian: Arc<QuantumOperator>) -> Self {
         Self {
-            qaoa,
+            cost_hamiltonian,
             depth: 3,
             max_iterations: 100,
+            optimizer: OptimizerType::NelderMead,
             seed: None,
             tolerance: 1e-6,
+            edges: None,
         }
     }
 
+    /// Set the edge list the cost Hamiltonian was built from
+    ///
+    /// Lets the cost be evaluated edge by edge instead of through the dense
+    /// operator. The edges must match the cost Hamiltonian.
+    pub fn with_edges(mut self, edges: Arc<[(usize, usize)]>) -> Self {
+        self.edges = Some(edges);
+        self
+    }
+
     /// Set QAOA circuit depth (p parameter)
     ///
     /// Higher depth generally gives better solutions but increases runtime.
@@ -122,6 +136,16 @@ impl QaoaMaxCutSolver {
         self
     }
 
+    /// Set the classical optimizer
+    ///
+    /// Defaults to Nelder-Mead. Gradient-based optimizers (`LBFGS`, `Adam`,
+    /// `GradientDescent`) typically need far fewer iterations on the smooth
+    /// QAOA landscape.
+    pub fn with_optimizer(mut self, optimizer: OptimizerType) -> Self {
+        self.optimizer = optimizer;
+        self
+    }
+
     /// Set random seed for deterministic results
     ///
     /// Using the same seed produces reproducible results.
@@ -143,12 +167,29 @@ impl QaoaMaxCutSolver {
     /// # Returns
     /// A `MaxCutSolution` containing the partition and quality metrics
     pub fn run(self) -> MaxCutSolution {
-        // Rebuild QAOA with current parameters
-        // (In a full implementation, we'd use the seed here)
-        let result = self.qaoa.run();
+        // One RNG drives both parameter initialization and sampling, so a
+        // seeded solver is reproducible end to end
+        let mut rng = match self.seed {
+            Some(seed) => StdRng::seed_from_u64(seed),
+            None => StdRng::from_entropy(),
+        };
+
+        // Build QAOA with current parameters
+        let mut builder = QAOABuilder::new()
+            .cost_hamiltonian(self.cost_hamiltonian.clone())
+            .depth(self.depth)
+            .optimizer(self.optimizer.clone())
+            .max_iterations(self.max_iterations)
+            .verbose(false);
+        if let Some(edges) = &self.edges {
+            builder = builder.maxcut_edges(edges.clone());
+        }
+        let qaoa = builder.build();
+        let result = qaoa.run_with_rng(&mut rng);
 
         // Sample to get binary assignment
-        let (_mean_cost, _std_dev, samples) = self.qaoa.analyze_samples(&result.optimal_state, 100);
+        let (_mean_cost, _std_dev, samples) =
+            qaoa.analyze_samples_with_rng(&result.optimal_state, 100, &mut rng);
 
         // Find best sample
         let best_sample_idx = samples
@@ -260,4 +301,20 @@ mod tests {
         assert_eq!(solution.assignment.len(), 13);
         assert!(solution.cut_value > 0.0);
     }
+
+    #[test]
+    fn test_seeded_solver_is_reproducible() {
+        let graph = MetatronGraph::new();
+        let solve = || {
+            QaoaMaxCutSolver::from_graph(&graph)
+                .with_depth(1)
+                .with_max_iterations(20)
+                .with_seed(7)
+                .run()
+        };
+        let (a, b) = (solve(), solve());
+
+        assert_eq!(a.cut_value, b.cut_value);
+        assert_eq!(a.assignment, b.assignment);
+    }
 }
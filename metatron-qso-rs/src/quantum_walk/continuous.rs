@@ -1,3 +1,4 @@
+use nalgebra::DMatrix;
 use num_complex::Complex64;
 
 use crate::hamiltonian::MetatronHamiltonian;
@@ -40,6 +41,68 @@ impl<'a> ContinuousTimeQuantumWalk<'a> {
     pub fn evolve(&self, initial: &QuantumState, time: f64) -> QuantumState {
         self.hamiltonian.evolve_state(initial, time)
     }
+
+    /// Probability trajectories for a batch of initial states.
+    ///
+    /// All states share the cached eigendecomposition: the eigenbasis overlaps
+    /// are stacked into one matrix `C`, and every time slice is a single
+    /// product `U · diag(e^{-iΛt}) · C`. The result is indexed as
+    /// `result[sample][time_index]`.
+    pub fn probabilities_batch(
+        &self,
+        initial_states: &[QuantumState],
+        times: &[f64],
+    ) -> Vec<Vec<[f64; METATRON_DIMENSION]>> {
+        let samples = initial_states.len();
+        let eigenvalues = self.hamiltonian.eigenvalues();
+        let eigenvectors = self.hamiltonian.eigenvectors();
+
+        let eigenbasis = DMatrix::from_fn(METATRON_DIMENSION, METATRON_DIMENSION, |row, col| {
+            eigenvectors[col][row]
+        });
+        let overlaps: Vec<Vec<Complex64>> = initial_states
+            .iter()
+            .map(|state| self.hamiltonian.project_onto_eigenbasis(state))
+            .collect();
+        let overlaps = DMatrix::from_fn(METATRON_DIMENSION, samples, |row, col| overlaps[col][row]);
+
+        let mut result: Vec<Vec<[f64; METATRON_DIMENSION]>> = (0..samples)
+            .map(|_| Vec::with_capacity(times.len()))
+            .collect();
+        let mut phased = overlaps.clone();
+        for &time in times {
+            phased.copy_from(&overlaps);
+            for (row, &energy) in eigenvalues.iter().enumerate() {
+                let phase = Complex64::from_polar(1.0, -energy * time);
+                for value in phased.row_mut(row).iter_mut() {
+                    *value *= phase;
+                }
+            }
+
+            let amplitudes = &eigenbasis * &phased;
+            for (sample, column) in amplitudes.column_iter().enumerate() {
+                let mut probs = [0.0; METATRON_DIMENSION];
+                for (prob, amplitude) in probs.iter_mut().zip(column.iter()) {
+                    *prob = amplitude.norm_sqr();
+                }
+                result[sample].push(probs);
+            }
+        }
+
+        if self.dephasing_rate != 0.0 {
+            for (trajectory, state) in result.iter_mut().zip(initial_states.iter()) {
+                let stationary = self.propagator(state).time_average_distribution();
+                for (probs, &time) in trajectory.iter_mut().zip(times.iter()) {
+                    let dephasing_factor = (-self.dephasing_rate * time).exp();
+                    for (prob, &mixed) in probs.iter_mut().zip(stationary.iter()) {
+                        *prob = dephasing_factor * *prob + (1.0 - dephasing_factor) * mixed;
+                    }
+                }
+            }
+        }
+
+        result
+    }
 }
 
 /// Spectral propagator caching the eigenbasis overlap for repeated evaluations.
@@ -87,6 +150,43 @@ impl<'a> SpectralPropagator<'a> {
         }
     }
 
+    /// Probability distributions at many time points in one pass.
+    ///
+    /// Builds the phase-weighted overlaps `A[k, j] = c_j · e^{-iλ_j t_k}` for
+    /// every time at once and maps them back to the node basis with a single
+    /// matrix product `A · Uᵀ`, instead of one spectral sum per time point.
+    pub fn probabilities_series(&self, times: &[f64]) -> Vec<[f64; METATRON_DIMENSION]> {
+        let eigenvalues = self.hamiltonian.eigenvalues();
+        let eigenvectors = self.hamiltonian.eigenvectors();
+
+        let weighted = DMatrix::from_fn(times.len(), METATRON_DIMENSION, |k, j| {
+            self.overlaps[j] * Complex64::from_polar(1.0, -eigenvalues[j] * times[k])
+        });
+        let eigenbasis_t = DMatrix::from_fn(METATRON_DIMENSION, METATRON_DIMENSION, |j, i| {
+            eigenvectors[j][i]
+        });
+        let amplitudes = weighted * eigenbasis_t;
+
+        let stationary = (self.dephasing_rate != 0.0).then(|| self.time_average_distribution());
+        amplitudes
+            .row_iter()
+            .zip(times.iter())
+            .map(|(row, &time)| {
+                let mut probs = [0.0; METATRON_DIMENSION];
+                for (prob, amplitude) in probs.iter_mut().zip(row.iter()) {
+                    *prob = amplitude.norm_sqr();
+                }
+                if let Some(stationary) = &stationary {
+                    let dephasing_factor = (-self.dephasing_rate * time).exp();
+                    for (prob, &mixed) in probs.iter_mut().zip(stationary.iter()) {
+                        *prob = dephasing_factor * *prob + (1.0 - dephasing_factor) * mixed;
+                    }
+                }
+                probs
+            })
+            .collect()
+    }
+
     /// Long-time average (Cesàro mean) probability distribution.
     pub fn time_average_distribution(&self) -> [f64; METATRON_DIMENSION] {
         let mut distribution = [0.0; METATRON_DIMENSION];
@@ -115,3 +215,29 @@ impl<'a> SpectralPropagator<'a> {
         &self.overlaps
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::graph::metatron::MetatronGraph;
+    use crate::params::QSOParameters;
+
+    #[test]
+    fn test_probabilities_series_matches_pointwise() {
+        let graph = MetatronGraph::new();
+        let hamiltonian = MetatronHamiltonian::new(&graph, &QSOParameters::default());
+        let qw = ContinuousTimeQuantumWalk::with_dephasing(&hamiltonian, 0.05);
+        let propagator = qw.propagator(&QuantumState::basis_state(0).unwrap());
+
+        let times = [0.0, 0.1, 1.5, 4.0];
+        let series = propagator.probabilities_series(&times);
+
+        assert_eq!(series.len(), times.len());
+        for (probs, &t) in series.iter().zip(times.iter()) {
+            let expected = propagator.probabilities_at(t);
+            for (p, e) in probs.iter().zip(expected.iter()) {
+                assert!((p - e).abs() < 1e-10);
+            }
+        }
+    }
+}
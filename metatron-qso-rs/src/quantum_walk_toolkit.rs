@@ -15,8 +15,10 @@
 use crate::graph::metatron::MetatronGraph;
 use crate::hamiltonian::MetatronHamiltonian;
 use crate::params::QSOParameters;
-use crate::quantum::state::QuantumState;
+use crate::quantum::state::{METATRON_DIMENSION, QuantumState};
 use crate::quantum_walk::continuous::ContinuousTimeQuantumWalk;
+use crate::quantum_walk::krylov::krylov_projection;
+use rayon::prelude::*;
 use serde::{Deserialize, Serialize};
 
 /// Parameters for quantum walk toolkit operations
@@ -28,6 +30,8 @@ pub struct QuantumWalkParams {
     pub dt: f64,
     /// Number of samples for statistical averaging
     pub samples: usize,
+    /// Time-evolution scheme
+    pub method: EvolutionMethod,
 }
 
 impl Default for QuantumWalkParams {
@@ -36,6 +40,59 @@ impl Default for QuantumWalkParams {
             t_max: 10.0,
             dt: 0.1,
             samples: 128,
+            method: EvolutionMethod::Spectral,
+        }
+    }
+}
+
+/// Time-evolution scheme used by the toolkit walks
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Default)]
+pub enum EvolutionMethod {
+    /// Exact evolution from the Hamiltonian eigendecomposition
+    #[default]
+    Spectral,
+    /// Lanczos/Krylov approximation of exp(-iHt)|ψ⟩ built from
+    /// matrix-vector products only; preferable for large sparse graphs
+    Krylov,
+}
+
+/// Maximum Krylov subspace dimension for [`EvolutionMethod::Krylov`]
+const KRYLOV_DIMENSION: usize = 30;
+
+/// Lanczos breakdown tolerance for [`EvolutionMethod::Krylov`]
+const KRYLOV_TOLERANCE: f64 = 1e-12;
+
+/// Probability distributions of a quantum walk at the given times
+///
+/// # Arguments
+/// * `hamiltonian` - Walk Hamiltonian
+/// * `initial_state` - State at t = 0
+/// * `times` - Evaluation times
+/// * `method` - Time-evolution scheme
+///
+/// # Returns
+/// One probability distribution per entry of `times`
+pub fn quantum_walk_probabilities(
+    hamiltonian: &MetatronHamiltonian,
+    initial_state: &QuantumState,
+    times: &[f64],
+    method: EvolutionMethod,
+) -> Vec<[f64; METATRON_DIMENSION]> {
+    match method {
+        EvolutionMethod::Spectral => ContinuousTimeQuantumWalk::new(hamiltonian)
+            .propagator(initial_state)
+            .probabilities_series(times),
+        EvolutionMethod::Krylov => {
+            let projection = krylov_projection(
+                hamiltonian,
+                initial_state,
+                KRYLOV_DIMENSION.min(METATRON_DIMENSION),
+                KRYLOV_TOLERANCE,
+            );
+            times
+                .iter()
+                .map(|&t| projection.evolve(t).state.probabilities())
+                .collect()
         }
     }
 }
@@ -70,33 +127,54 @@ pub struct ConnectivityMetrics {
 /// # Returns
 /// Vector of centrality scores (one per node, normalized to [0, 1])
 pub fn quantum_walk_centrality(graph: &MetatronGraph, params: &QuantumWalkParams) -> Vec<f64> {
-    let n = graph.nodes().len();
     let qso_params = QSOParameters::default();
     let hamiltonian = MetatronHamiltonian::new(graph, &qso_params);
-    let qw = ContinuousTimeQuantumWalk::new(&hamiltonian);
-
-    let mut centrality = vec![0.0; n];
-
-    // For each node, measure how "accessible" it is from all other nodes
-    for start_node in 0..n {
-        let initial_state = QuantumState::basis_state(start_node).unwrap();
+    quantum_walk_centrality_with_hamiltonian(&hamiltonian, params)
+}
 
-        // Sample at different times and accumulate probabilities
-        let num_steps = (params.t_max / params.dt).ceil() as usize;
-        for step in 1..=num_steps {
-            let t = (step as f64) * params.dt;
-            let evolved = qw.evolve(&initial_state, t);
-            let probs = evolved.probabilities();
+/// Compute quantum walk centrality from a prebuilt Hamiltonian
+///
+/// Same as [`quantum_walk_centrality`], but reuses an existing Hamiltonian
+/// (and its eigendecomposition) instead of constructing one from the graph.
+pub fn quantum_walk_centrality_with_hamiltonian(
+    hamiltonian: &MetatronHamiltonian,
+    params: &QuantumWalkParams,
+) -> Vec<f64> {
+    let n = METATRON_DIMENSION;
 
-            // Accumulate probability of being at each node
-            for (i, &prob) in probs.iter().enumerate() {
-                centrality[i] += prob;
+    let num_steps = (params.t_max / params.dt).ceil() as usize;
+    let times: Vec<f64> = (1..=num_steps)
+        .map(|step| (step as f64) * params.dt)
+        .collect();
+
+    // Walks from different start nodes are independent: evaluate them in
+    // parallel and tree-reduce the accumulated visitation probabilities
+    let mut centrality = (0..n)
+        .into_par_iter()
+        .map(|start_node| {
+            let initial_state = QuantumState::basis_state(start_node).unwrap();
+            let mut visits = vec![0.0; n];
+            for probs in
+                quantum_walk_probabilities(hamiltonian, &initial_state, &times, params.method)
+            {
+                for (visit, &prob) in visits.iter_mut().zip(probs.iter()) {
+                    *visit += prob;
+                }
             }
-        }
-    }
+            visits
+        })
+        .reduce(
+            || vec![0.0; n],
+            |mut acc, visits| {
+                for (total, visit) in acc.iter_mut().zip(visits) {
+                    *total += visit;
+                }
+                acc
+            },
+        );
 
     // Normalize by number of steps and nodes
-    let norm_factor = (n * ((params.t_max / params.dt).ceil() as usize)) as f64;
+    let norm_factor = (n * num_steps) as f64;
     for score in &mut centrality {
         *score /= norm_factor;
     }
@@ -133,9 +211,26 @@ pub fn quantum_walk_anomaly_score(
     current_graph: &MetatronGraph,
     params: &QuantumWalkParams,
 ) -> Vec<f64> {
-    // Compute centrality for both graphs
-    let base_centrality = quantum_walk_centrality(base_graph, params);
-    let current_centrality = quantum_walk_centrality(current_graph, params);
+    let qso_params = QSOParameters::default();
+    let base_hamiltonian = MetatronHamiltonian::new(base_graph, &qso_params);
+    let current_hamiltonian = MetatronHamiltonian::new(current_graph, &qso_params);
+    quantum_walk_anomaly_score_with_hamiltonians(&base_hamiltonian, &current_hamiltonian, params)
+}
+
+/// Compute anomaly scores from prebuilt Hamiltonians
+///
+/// Same as [`quantum_walk_anomaly_score`], but reuses existing Hamiltonians
+/// for the baseline and current graphs.
+pub fn quantum_walk_anomaly_score_with_hamiltonians(
+    base_hamiltonian: &MetatronHamiltonian,
+    current_hamiltonian: &MetatronHamiltonian,
+    params: &QuantumWalkParams,
+) -> Vec<f64> {
+    // Compute centrality for both graphs concurrently
+    let (base_centrality, current_centrality) = rayon::join(
+        || quantum_walk_centrality_with_hamiltonian(base_hamiltonian, params),
+        || quantum_walk_centrality_with_hamiltonian(current_hamiltonian, params),
+    );
 
     // Anomaly = absolute difference in centrality
     base_centrality
@@ -162,10 +257,21 @@ pub fn quantum_walk_connectivity(
     source_nodes: &[usize],
     params: &QuantumWalkParams,
 ) -> ConnectivityMetrics {
-    let n = graph.nodes().len();
     let qso_params = QSOParameters::default();
     let hamiltonian = MetatronHamiltonian::new(graph, &qso_params);
-    let qw = ContinuousTimeQuantumWalk::new(&hamiltonian);
+    quantum_walk_connectivity_with_hamiltonian(&hamiltonian, source_nodes, params)
+}
+
+/// Analyze connectivity from a prebuilt Hamiltonian
+///
+/// Same as [`quantum_walk_connectivity`], but reuses an existing Hamiltonian
+/// instead of constructing one from the graph.
+pub fn quantum_walk_connectivity_with_hamiltonian(
+    hamiltonian: &MetatronHamiltonian,
+    source_nodes: &[usize],
+    params: &QuantumWalkParams,
+) -> ConnectivityMetrics {
+    let n = METATRON_DIMENSION;
 
     // Create initial state (uniform over source nodes)
     let mut amplitudes = vec![num_complex::Complex64::new(0.0, 0.0); n];
@@ -182,11 +288,12 @@ pub fn quantum_walk_connectivity(
     let uniform_prob = 1.0 / n as f64;
     let mixing_threshold = 0.1; // 10% deviation from uniform
 
-    for step in 1..=num_steps {
-        let t = (step as f64) * params.dt;
-        let evolved = qw.evolve(&initial_state, t);
-        let probs = evolved.probabilities();
+    let times: Vec<f64> = (1..=num_steps)
+        .map(|step| (step as f64) * params.dt)
+        .collect();
+    let series = quantum_walk_probabilities(hamiltonian, &initial_state, &times, params.method);
 
+    for (step, (probs, &t)) in (1..=num_steps).zip(series.iter().zip(times.iter())) {
         // Check if mixed (close to uniform distribution)
         let max_deviation = probs
             .iter()
@@ -232,6 +339,7 @@ mod tests {
             t_max: 5.0,
             dt: 0.5,
             samples: 16,
+            ..Default::default()
         };
 
         let centrality = quantum_walk_centrality(&graph, &params);
@@ -248,6 +356,31 @@ mod tests {
         assert!(centrality[0] > 0.5);
     }
 
+    #[test]
+    fn test_probabilities_batch_matches_evolve() {
+        let graph = MetatronGraph::new();
+        let hamiltonian = MetatronHamiltonian::new(&graph, &QSOParameters::default());
+        let qw = ContinuousTimeQuantumWalk::new(&hamiltonian);
+
+        let states = vec![
+            QuantumState::basis_state(0).unwrap(),
+            QuantumState::basis_state(7).unwrap(),
+        ];
+        let times = [0.0, 0.5, 2.0];
+        let batch = qw.probabilities_batch(&states, &times);
+
+        assert_eq!(batch.len(), 2);
+        for (trajectory, state) in batch.iter().zip(states.iter()) {
+            assert_eq!(trajectory.len(), times.len());
+            for (probs, &t) in trajectory.iter().zip(times.iter()) {
+                let expected = qw.evolve(state, t).probabilities();
+                for (p, e) in probs.iter().zip(expected.iter()) {
+                    assert!((p - e).abs() < 1e-10);
+                }
+            }
+        }
+    }
+
     #[test]
     fn test_quantum_walk_connectivity() {
         let graph = MetatronGraph::new();
@@ -255,6 +388,7 @@ mod tests {
             t_max: 50.0, // Significantly increased for better mixing
             dt: 0.2,     // Larger time step
             samples: 64,
+            ..Default::default()
         };
 
         let metrics = quantum_walk_connectivity(&graph, &[0], &params);
@@ -5,8 +5,7 @@
 //! - EfficientSU2: Qiskit-inspired structure with full SU(2) rotations
 //! - Metatron: Optimized for 13-dimensional Metatron Cube structure
 
-use crate::quantum::operator::{OperatorMatrix, QuantumOperator};
-use crate::quantum::state::{METATRON_DIMENSION, QuantumState};
+use crate::quantum::state::{METATRON_DIMENSION, QuantumState, StateVector};
 use num_complex::Complex64;
 use std::f64::consts::PI;
 
@@ -51,6 +50,168 @@ pub trait Ansatz: Send + Sync {
     }
 }
 
+/// Sparse gate applied to the amplitude vector in place
+///
+/// Every gate used by the ansätze below is the identity outside a 2×2 block
+/// (or purely diagonal). Applying the block directly touches only the affected
+/// amplitudes, instead of building a 13×13 matrix per gate and running a full
+/// matrix-vector product.
+#[derive(Clone, Copy, Debug)]
+enum SparseGate {
+    /// Block `[[m00, m01], [m10, m11]]` (row-major) on basis states `i` and `j`
+    TwoLevel {
+        i: usize,
+        j: usize,
+        block: [Complex64; 4],
+    },
+    /// Phase on a single basis state
+    Phase { index: usize, phase: Complex64 },
+    /// Phase on every basis state
+    Diagonal([Complex64; METATRON_DIMENSION]),
+}
+
+impl SparseGate {
+    fn apply(&self, amplitudes: &mut StateVector) {
+        match *self {
+            SparseGate::TwoLevel { i, j, block } => {
+                let (a, b) = (amplitudes[i], amplitudes[j]);
+                amplitudes[i] = block[0] * a + block[1] * b;
+                amplitudes[j] = block[2] * a + block[3] * b;
+            }
+            SparseGate::Phase { index, phase } => amplitudes[index] *= phase,
+            SparseGate::Diagonal(phases) => {
+                for (amplitude, phase) in amplitudes.iter_mut().zip(phases.iter()) {
+                    *amplitude *= *phase;
+                }
+            }
+        }
+    }
+}
+
+/// Gate of a compiled ansatz with its basis states and parameter slot fixed
+#[derive(Clone, Copy, Debug)]
+enum GateTemplate {
+    /// Parameter-independent gate
+    Fixed(SparseGate),
+    /// Ry(θ) block `[[cos θ/2, -sin θ/2], [sin θ/2, cos θ/2]]`
+    Ry { i: usize, j: usize, param: usize },
+    /// Rz(θ) block `diag(e^{-iθ/2}, e^{iθ/2})`
+    Rz { i: usize, j: usize, param: usize },
+    /// Rz(θ) on a basis state without partner: phase `e^{-iθ/2}`
+    RzEdge { index: usize, param: usize },
+    /// Exchange block `[[cos sθ, -i sin sθ], [-i sin sθ, cos sθ]]`
+    Exchange {
+        i: usize,
+        j: usize,
+        param: usize,
+        scale: f64,
+    },
+    /// SU(2) = Rz(θ1) · Ry(θ2) · Rz(θ3) from three consecutive parameters
+    Su2 { i: usize, j: usize, param: usize },
+    /// Metatron central-node phase `e^{iθ·2πk/13}` on every basis state `k`
+    CentralPhase { param: usize },
+}
+
+impl GateTemplate {
+    /// Instantiate the gate for a concrete parameter vector
+    fn bind(&self, parameters: &[f64]) -> SparseGate {
+        match *self {
+            GateTemplate::Fixed(gate) => gate,
+            GateTemplate::Ry { i, j, param } => {
+                let (sin_half, cos_half) = (parameters[param] / 2.0).sin_cos();
+                SparseGate::TwoLevel {
+                    i,
+                    j,
+                    block: [
+                        Complex64::new(cos_half, 0.0),
+                        Complex64::new(-sin_half, 0.0),
+                        Complex64::new(sin_half, 0.0),
+                        Complex64::new(cos_half, 0.0),
+                    ],
+                }
+            }
+            GateTemplate::Rz { i, j, param } => {
+                let angle = parameters[param];
+                let zero = Complex64::new(0.0, 0.0);
+                SparseGate::TwoLevel {
+                    i,
+                    j,
+                    block: [
+                        Complex64::from_polar(1.0, -angle / 2.0),
+                        zero,
+                        zero,
+                        Complex64::from_polar(1.0, angle / 2.0),
+                    ],
+                }
+            }
+            GateTemplate::RzEdge { index, param } => SparseGate::Phase {
+                index,
+                phase: Complex64::from_polar(1.0, -parameters[param] / 2.0),
+            },
+            GateTemplate::Exchange { i, j, param, scale } => {
+                exchange_gate(i, j, parameters[param] * scale)
+            }
+            GateTemplate::Su2 { i, j, param } => {
+                let (sin_half, cos_half) = (parameters[param + 1] / 2.0).sin_cos();
+                let phase1 = Complex64::from_polar(1.0, parameters[param] / 2.0);
+                let phase3 = Complex64::from_polar(1.0, parameters[param + 2] / 2.0);
+                SparseGate::TwoLevel {
+                    i,
+                    j,
+                    block: [
+                        phase1 * Complex64::new(cos_half, 0.0) * phase3,
+                        phase1 * Complex64::new(-sin_half, 0.0) * phase3.conj(),
+                        phase1.conj() * Complex64::new(sin_half, 0.0) * phase3,
+                        phase1.conj() * Complex64::new(cos_half, 0.0) * phase3.conj(),
+                    ],
+                }
+            }
+            GateTemplate::CentralPhase { param } => {
+                let angle = parameters[param];
+                let mut phases = [Complex64::new(1.0, 0.0); METATRON_DIMENSION];
+                for (k, value) in phases.iter_mut().enumerate() {
+                    let phase = 2.0 * PI * k as f64 / METATRON_DIMENSION as f64;
+                    *value = Complex64::from_polar(1.0, angle * phase);
+                }
+                SparseGate::Diagonal(phases)
+            }
+        }
+    }
+}
+
+/// Exchange rotation between basis states `i` and `j`
+fn exchange_gate(i: usize, j: usize, angle: f64) -> SparseGate {
+    let (sin_val, cos_val) = angle.sin_cos();
+    let cos_val = Complex64::new(cos_val, 0.0);
+    let i_sin = Complex64::new(0.0, -sin_val);
+    SparseGate::TwoLevel {
+        i,
+        j,
+        block: [cos_val, i_sin, i_sin, cos_val],
+    }
+}
+
+/// Ansatz circuit compiled to a flat gate template
+///
+/// The gate sequence, the basis states each gate acts on and the parameter
+/// slot feeding it are resolved once when the ansatz is constructed. Applying
+/// the circuit then only recomputes the rotation factors from the parameter
+/// vector and sweeps the amplitudes in place, with no per-call allocation.
+#[derive(Clone, Debug)]
+struct CompiledAnsatz {
+    gates: Vec<GateTemplate>,
+}
+
+impl CompiledAnsatz {
+    fn apply(&self, state: &QuantumState, parameters: &[f64]) -> QuantumState {
+        let mut amplitudes = *state.amplitudes();
+        for gate in &self.gates {
+            gate.bind(parameters).apply(&mut amplitudes);
+        }
+        QuantumState::from_vector(amplitudes, false)
+    }
+}
+
 /// Hardware-Efficient Ansatz
 ///
 /// Alternating layers of single-qubit rotations (Ry) and nearest-neighbor entangling gates.
@@ -66,6 +227,7 @@ pub trait Ansatz: Send + Sync {
 pub struct HardwareEfficientAnsatz {
     num_qubits: usize,
     depth: usize,
+    template: CompiledAnsatz,
 }
 
 impl HardwareEfficientAnsatz {
@@ -73,63 +235,56 @@ impl HardwareEfficientAnsatz {
         Self {
             num_qubits: METATRON_DIMENSION,
             depth,
+            template: Self::compile(METATRON_DIMENSION, depth),
         }
     }
 
-    /// Create Ry rotation matrix for the full Hilbert space
-    fn ry_rotation_matrix(&self, qubit: usize, angle: f64) -> OperatorMatrix {
-        // For 13-dimensional space, we create a rotation that acts on specific dimensions
-        // This is a simplified rotation acting on pairs of basis states
-        let mut matrix = OperatorMatrix::identity();
+    fn compile(num_qubits: usize, depth: usize) -> CompiledAnsatz {
+        let params_per_layer = 2 * num_qubits;
+        let mut gates = Vec::with_capacity(depth * (3 * num_qubits - 1));
 
-        let cos_half = (angle / 2.0).cos();
-        let sin_half = (angle / 2.0).sin();
-
-        // Apply rotation on the qubit subspace
-        if qubit < METATRON_DIMENSION - 1 {
-            matrix[(qubit, qubit)] = Complex64::new(cos_half, 0.0);
-            matrix[(qubit, qubit + 1)] = Complex64::new(-sin_half, 0.0);
-            matrix[(qubit + 1, qubit)] = Complex64::new(sin_half, 0.0);
-            matrix[(qubit + 1, qubit + 1)] = Complex64::new(cos_half, 0.0);
-        }
-
-        matrix
-    }
-
-    /// Create Rz rotation matrix
-    fn rz_rotation_matrix(&self, qubit: usize, angle: f64) -> OperatorMatrix {
-        let mut matrix = OperatorMatrix::identity();
-
-        if qubit < METATRON_DIMENSION {
-            let phase_plus = Complex64::from_polar(1.0, angle / 2.0);
-            let phase_minus = Complex64::from_polar(1.0, -angle / 2.0);
+        for layer in 0..depth {
+            let layer_offset = layer * params_per_layer;
 
-            matrix[(qubit, qubit)] = phase_minus;
-            if qubit + 1 < METATRON_DIMENSION {
-                matrix[(qubit + 1, qubit + 1)] = phase_plus;
+            // Ry rotations act on pairs of neighbouring basis states; the last
+            // basis state has no partner
+            for qubit in 0..num_qubits - 1 {
+                gates.push(GateTemplate::Ry {
+                    i: qubit,
+                    j: qubit + 1,
+                    param: layer_offset + qubit,
+                });
             }
-        }
-
-        matrix
-    }
-
-    /// Create entangling gate between neighboring qubits
-    fn entangling_gate(&self, qubit1: usize, qubit2: usize, angle: f64) -> OperatorMatrix {
-        let mut matrix = OperatorMatrix::identity();
 
-        if qubit1 < METATRON_DIMENSION && qubit2 < METATRON_DIMENSION {
-            // Controlled rotation
-            let cos_val = angle.cos();
-            let sin_val = angle.sin();
-            let i_sin = Complex64::new(0.0, sin_val);
+            // Rz rotations
+            for qubit in 0..num_qubits {
+                let param = layer_offset + num_qubits + qubit;
+                if qubit + 1 < num_qubits {
+                    gates.push(GateTemplate::Rz {
+                        i: qubit,
+                        j: qubit + 1,
+                        param,
+                    });
+                } else {
+                    gates.push(GateTemplate::RzEdge {
+                        index: qubit,
+                        param,
+                    });
+                }
+            }
 
-            matrix[(qubit1, qubit1)] = Complex64::new(cos_val, 0.0);
-            matrix[(qubit1, qubit2)] = -i_sin;
-            matrix[(qubit2, qubit1)] = -i_sin;
-            matrix[(qubit2, qubit2)] = Complex64::new(cos_val, 0.0);
+            // Entangling gates (circular pattern), driven by half the Ry angle
+            for qubit in 0..num_qubits - 1 {
+                gates.push(GateTemplate::Exchange {
+                    i: qubit,
+                    j: qubit + 1,
+                    param: layer_offset + qubit,
+                    scale: 0.5,
+                });
+            }
         }
 
-        matrix
+        CompiledAnsatz { gates }
     }
 }
 
@@ -137,43 +292,7 @@ impl Ansatz for HardwareEfficientAnsatz {
     fn apply(&self, state: &QuantumState, parameters: &[f64]) -> QuantumState {
         self.validate_parameters(parameters)
             .expect("Invalid parameters");
-
-        let mut current_state = state.clone();
-        let params_per_layer = 2 * self.num_qubits;
-
-        for layer in 0..self.depth {
-            let layer_offset = layer * params_per_layer;
-
-            // Apply Ry rotations
-            for qubit in 0..self.num_qubits {
-                let param_idx = layer_offset + qubit;
-                if param_idx < parameters.len() {
-                    let rotation = self.ry_rotation_matrix(qubit, parameters[param_idx]);
-                    let operator = QuantumOperator::from_matrix(rotation);
-                    current_state = current_state.apply(&operator);
-                }
-            }
-
-            // Apply Rz rotations
-            for qubit in 0..self.num_qubits {
-                let param_idx = layer_offset + self.num_qubits + qubit;
-                if param_idx < parameters.len() {
-                    let rotation = self.rz_rotation_matrix(qubit, parameters[param_idx]);
-                    let operator = QuantumOperator::from_matrix(rotation);
-                    current_state = current_state.apply(&operator);
-                }
-            }
-
-            // Apply entangling gates (circular pattern)
-            for qubit in 0..self.num_qubits - 1 {
-                let entangle_angle = parameters[layer_offset + qubit % params_per_layer] * 0.5;
-                let gate = self.entangling_gate(qubit, qubit + 1, entangle_angle);
-                let operator = QuantumOperator::from_matrix(gate);
-                current_state = current_state.apply(&operator);
-            }
-        }
-
-        current_state
+        self.template.apply(state, parameters)
     }
 
     fn num_parameters(&self) -> usize {
@@ -203,6 +322,7 @@ impl Ansatz for HardwareEfficientAnsatz {
 pub struct EfficientSU2Ansatz {
     num_qubits: usize,
     depth: usize,
+    template: CompiledAnsatz,
 }
 
 impl EfficientSU2Ansatz {
@@ -210,28 +330,37 @@ impl EfficientSU2Ansatz {
         Self {
             num_qubits: METATRON_DIMENSION,
             depth,
+            template: Self::compile(METATRON_DIMENSION, depth),
         }
     }
 
-    fn su2_rotation(&self, qubit: usize, theta1: f64, theta2: f64, theta3: f64) -> OperatorMatrix {
-        // SU(2) = Rz(θ1) · Ry(θ2) · Rz(θ3)
-        let mut matrix = OperatorMatrix::identity();
+    fn compile(num_qubits: usize, depth: usize) -> CompiledAnsatz {
+        let params_per_layer = 3 * num_qubits;
+        let mut gates = Vec::with_capacity(depth * 2 * (num_qubits - 1));
 
-        if qubit < METATRON_DIMENSION - 1 {
-            // Compose the three rotations
-            let cos_half = (theta2 / 2.0).cos();
-            let sin_half = (theta2 / 2.0).sin();
-            let phase1 = Complex64::from_polar(1.0, theta1 / 2.0);
-            let phase3 = Complex64::from_polar(1.0, theta3 / 2.0);
+        for layer in 0..depth {
+            let layer_offset = layer * params_per_layer;
 
-            matrix[(qubit, qubit)] = phase1 * Complex64::new(cos_half, 0.0) * phase3;
-            matrix[(qubit, qubit + 1)] = phase1 * Complex64::new(-sin_half, 0.0) * phase3.conj();
-            matrix[(qubit + 1, qubit)] = phase1.conj() * Complex64::new(sin_half, 0.0) * phase3;
-            matrix[(qubit + 1, qubit + 1)] =
-                phase1.conj() * Complex64::new(cos_half, 0.0) * phase3.conj();
+            // SU(2) rotations on pairs of neighbouring basis states
+            for qubit in 0..num_qubits - 1 {
+                gates.push(GateTemplate::Su2 {
+                    i: qubit,
+                    j: qubit + 1,
+                    param: layer_offset + qubit * 3,
+                });
+            }
+
+            // Entangling layer with fixed angle (simplified for 13-dim space)
+            for qubit in 0..num_qubits - 1 {
+                gates.push(GateTemplate::Fixed(exchange_gate(
+                    qubit,
+                    qubit + 1,
+                    PI / 4.0,
+                )));
+            }
         }
 
-        matrix
+        CompiledAnsatz { gates }
     }
 }
 
@@ -239,46 +368,7 @@ impl Ansatz for EfficientSU2Ansatz {
     fn apply(&self, state: &QuantumState, parameters: &[f64]) -> QuantumState {
         self.validate_parameters(parameters)
             .expect("Invalid parameters");
-
-        let mut current_state = state.clone();
-        let params_per_layer = 3 * self.num_qubits;
-
-        for layer in 0..self.depth {
-            let layer_offset = layer * params_per_layer;
-
-            // Apply SU(2) rotations
-            for qubit in 0..self.num_qubits {
-                let idx = layer_offset + qubit * 3;
-                if idx + 2 < parameters.len() {
-                    let rotation = self.su2_rotation(
-                        qubit,
-                        parameters[idx],
-                        parameters[idx + 1],
-                        parameters[idx + 2],
-                    );
-                    let operator = QuantumOperator::from_matrix(rotation);
-                    current_state = current_state.apply(&operator);
-                }
-            }
-
-            // Entangling layer (simplified for 13-dim space)
-            for qubit in 0..self.num_qubits - 1 {
-                let angle = PI / 4.0; // Fixed entangling angle
-                let mut gate = OperatorMatrix::identity();
-
-                let cos_val = angle.cos();
-                let sin_val = angle.sin();
-                gate[(qubit, qubit)] = Complex64::new(cos_val, 0.0);
-                gate[(qubit, qubit + 1)] = Complex64::new(0.0, -sin_val);
-                gate[(qubit + 1, qubit)] = Complex64::new(0.0, -sin_val);
-                gate[(qubit + 1, qubit + 1)] = Complex64::new(cos_val, 0.0);
-
-                let operator = QuantumOperator::from_matrix(gate);
-                current_state = current_state.apply(&operator);
-            }
-        }
-
-        current_state
+        self.template.apply(state, parameters)
     }
 
     fn num_parameters(&self) -> usize {
@@ -310,6 +400,7 @@ impl Ansatz for EfficientSU2Ansatz {
 pub struct MetatronAnsatz {
     depth: usize,
     entanglement_strategy: EntanglementStrategy,
+    template: CompiledAnsatz,
 }
 
 /// Entanglement strategy for Metatron ansatz
@@ -324,101 +415,65 @@ pub enum EntanglementStrategy {
 impl MetatronAnsatz {
     /// Create Metatron ansatz with default Ring entanglement
     pub fn new(depth: usize) -> Self {
-        Self {
-            depth,
-            entanglement_strategy: EntanglementStrategy::Ring,
-        }
+        Self::new_with_entanglement(depth, EntanglementStrategy::Ring)
     }
 
     /// Create Metatron ansatz with specified entanglement strategy
     pub fn new_with_entanglement(depth: usize, entanglement: EntanglementStrategy) -> Self {
         Self {
             depth,
+            template: Self::compile(depth, &entanglement),
             entanglement_strategy: entanglement,
         }
     }
 
-    /// Get number of entangling gates based on strategy
-    fn num_entangling_gates(&self) -> usize {
-        match self.entanglement_strategy {
+    /// Number of entangling gates per layer for a strategy
+    fn entangling_gates_for(strategy: &EntanglementStrategy) -> usize {
+        match strategy {
             EntanglementStrategy::Ring => METATRON_DIMENSION,
             EntanglementStrategy::Full => METATRON_DIMENSION * (METATRON_DIMENSION - 1) / 2,
         }
     }
 
-    /// Create rotation leveraging Metatron geometry
-    fn metatron_rotation(&self, node: usize, angle: f64) -> OperatorMatrix {
-        let mut matrix = OperatorMatrix::identity();
-
-        if node < METATRON_DIMENSION {
-            // Rotation in the Bloch sphere representation
-            let cos_half = (angle / 2.0).cos();
-            let sin_half = (angle / 2.0).sin();
-
-            // Central node (0) gets special treatment
-            if node == 0 {
-                // Rotate in higher-dimensional subspace
-                for i in 0..METATRON_DIMENSION {
-                    let phase = 2.0 * PI * i as f64 / METATRON_DIMENSION as f64;
-                    matrix[(i, i)] = Complex64::from_polar(1.0, angle * phase);
-                }
-            } else {
-                matrix[(node, node)] = Complex64::new(cos_half, 0.0);
-                let next = (node + 1) % METATRON_DIMENSION;
-                matrix[(node, next)] = Complex64::new(0.0, -sin_half);
-                matrix[(next, node)] = Complex64::new(0.0, -sin_half);
-                matrix[(next, next)] = Complex64::new(cos_half, 0.0);
-            }
-        }
-
-        matrix
+    /// Get number of entangling gates based on strategy
+    fn num_entangling_gates(&self) -> usize {
+        Self::entangling_gates_for(&self.entanglement_strategy)
     }
-}
 
-impl Ansatz for MetatronAnsatz {
-    fn apply(&self, state: &QuantumState, parameters: &[f64]) -> QuantumState {
-        self.validate_parameters(parameters)
-            .expect("Invalid parameters");
-
-        let mut current_state = state.clone();
-        let params_per_layer = METATRON_DIMENSION + self.num_entangling_gates();
+    fn compile(depth: usize, strategy: &EntanglementStrategy) -> CompiledAnsatz {
+        let num_entangling = Self::entangling_gates_for(strategy);
+        let params_per_layer = METATRON_DIMENSION + num_entangling;
+        let mut gates = Vec::with_capacity(depth * params_per_layer);
 
-        for layer in 0..self.depth {
+        for layer in 0..depth {
             let layer_offset = layer * params_per_layer;
 
-            // Node rotations
-            for node in 0..METATRON_DIMENSION {
-                let param_idx = layer_offset + node;
-                if param_idx < parameters.len() {
-                    let rotation = self.metatron_rotation(node, parameters[param_idx]);
-                    let operator = QuantumOperator::from_matrix(rotation);
-                    current_state = current_state.apply(&operator);
-                }
+            // Node rotations: the central node (0) rotates the phases of the
+            // whole space, the others rotate towards their successor
+            gates.push(GateTemplate::CentralPhase {
+                param: layer_offset,
+            });
+            for node in 1..METATRON_DIMENSION {
+                gates.push(GateTemplate::Exchange {
+                    i: node,
+                    j: (node + 1) % METATRON_DIMENSION,
+                    param: layer_offset + node,
+                    scale: 0.5,
+                });
             }
 
             // Entanglement layer based on strategy
-            match self.entanglement_strategy {
+            let entangling_offset = layer_offset + METATRON_DIMENSION;
+            match strategy {
                 EntanglementStrategy::Ring => {
                     // Ring entanglement: each qubit connected to next in circular pattern
                     for i in 0..METATRON_DIMENSION {
-                        let param_idx = layer_offset + METATRON_DIMENSION + i;
-                        if param_idx < parameters.len() {
-                            let source = i;
-                            let target = (i + 1) % METATRON_DIMENSION;
-
-                            let mut gate = OperatorMatrix::identity();
-                            let angle = parameters[param_idx];
-                            let cos_val = angle.cos();
-                            let sin_val = angle.sin();
-
-                            gate[(source, source)] = Complex64::new(cos_val, 0.0);
-                            gate[(source, target)] = Complex64::new(0.0, -sin_val);
-                            gate[(target, source)] = Complex64::new(0.0, -sin_val);
-                            gate[(target, target)] = Complex64::new(cos_val, 0.0);
-
-                            let operator = QuantumOperator::from_matrix(gate);
-                            current_state = current_state.apply(&operator);
-                        }
+                        gates.push(GateTemplate::Exchange {
+                            i,
+                            j: (i + 1) % METATRON_DIMENSION,
+                            param: entangling_offset + i,
+                            scale: 1.0,
+                        });
                     }
                 }
                 EntanglementStrategy::Full => {
@@ -426,21 +481,12 @@ impl Ansatz for MetatronAnsatz {
                     let mut gate_idx = 0;
                     for i in 0..METATRON_DIMENSION {
                         for j in (i + 1)..METATRON_DIMENSION {
-                            let param_idx = layer_offset + METATRON_DIMENSION + gate_idx;
-                            if param_idx < parameters.len() {
-                                let mut gate = OperatorMatrix::identity();
-                                let angle = parameters[param_idx];
-                                let cos_val = angle.cos();
-                                let sin_val = angle.sin();
-
-                                gate[(i, i)] = Complex64::new(cos_val, 0.0);
-                                gate[(i, j)] = Complex64::new(0.0, -sin_val);
-                                gate[(j, i)] = Complex64::new(0.0, -sin_val);
-                                gate[(j, j)] = Complex64::new(cos_val, 0.0);
-
-                                let operator = QuantumOperator::from_matrix(gate);
-                                current_state = current_state.apply(&operator);
-                            }
+                            gates.push(GateTemplate::Exchange {
+                                i,
+                                j,
+                                param: entangling_offset + gate_idx,
+                                scale: 1.0,
+                            });
                             gate_idx += 1;
                         }
                     }
@@ -448,7 +494,15 @@ impl Ansatz for MetatronAnsatz {
             }
         }
 
-        current_state
+        CompiledAnsatz { gates }
+    }
+}
+
+impl Ansatz for MetatronAnsatz {
+    fn apply(&self, state: &QuantumState, parameters: &[f64]) -> QuantumState {
+        self.validate_parameters(parameters)
+            .expect("Invalid parameters");
+        self.template.apply(state, parameters)
     }
 
     fn num_parameters(&self) -> usize {
@@ -508,6 +562,55 @@ mod tests {
         assert_eq!(ansatz.num_parameters(), 3 * METATRON_DIMENSION * 2);
     }
 
+    #[test]
+    fn test_sparse_gate_matches_dense_matrix() {
+        use crate::quantum::operator::{OperatorMatrix, QuantumOperator};
+
+        let state = QuantumState::random(Some(7));
+        let block = [
+            Complex64::new(0.6, 0.0),
+            Complex64::new(0.0, -0.8),
+            Complex64::new(0.0, -0.8),
+            Complex64::new(0.6, 0.0),
+        ];
+
+        let mut dense = OperatorMatrix::identity();
+        dense[(3, 3)] = block[0];
+        dense[(3, 9)] = block[1];
+        dense[(9, 3)] = block[2];
+        dense[(9, 9)] = block[3];
+        let expected = state.apply(&QuantumOperator::from_matrix(dense));
+
+        let mut amplitudes = *state.amplitudes();
+        SparseGate::TwoLevel { i: 3, j: 9, block }.apply(&mut amplitudes);
+
+        for (a, b) in amplitudes.iter().zip(expected.amplitudes().iter()) {
+            assert!((a - b).norm() < 1e-12);
+        }
+    }
+
+    #[test]
+    fn test_compiled_templates_match_parameter_counts() {
+        let ansatze: Vec<Box<dyn Ansatz>> = vec![
+            Box::new(HardwareEfficientAnsatz::new(2)),
+            Box::new(EfficientSU2Ansatz::new(2)),
+            Box::new(MetatronAnsatz::new(2)),
+            Box::new(MetatronAnsatz::new_with_entanglement(
+                2,
+                EntanglementStrategy::Full,
+            )),
+        ];
+
+        for ansatz in ansatze {
+            let state = QuantumState::uniform_superposition();
+            let params: Vec<f64> = (0..ansatz.num_parameters())
+                .map(|i| 0.01 * i as f64)
+                .collect();
+            let new_state = ansatz.apply(&state, &params);
+            assert!(new_state.is_normalized(1e-10));
+        }
+    }
+
     #[test]
     fn test_ansatz_preserves_normalization() {
         let ansatz = HardwareEfficientAnsatz::new(2);
@@ -8,6 +8,7 @@ use crate::quantum::operator::QuantumOperator;
 use crate::quantum::state::QuantumState;
 use crate::vqa::ParameterVector;
 use crate::vqa::ansatz::Ansatz;
+use crate::vqa::qaoa::maxcut_expectation;
 use num_complex::Complex64;
 use rayon::prelude::*;
 use std::collections::HashMap;
@@ -77,7 +78,8 @@ pub trait CostFunction: Send + Sync {
 ///
 /// Computes expectation value of Hamiltonian for finding ground state energy
 pub struct VQECostFunction<A: Ansatz> {
-    hamiltonian: Arc<MetatronHamiltonian>,
+    /// Complex operator form of the Hamiltonian, built once
+    h_operator: QuantumOperator,
     ansatz: A,
     initial_state: QuantumState,
     cache: Arc<Mutex<HashMap<String, f64>>>,
@@ -89,8 +91,9 @@ impl<A: Ansatz> VQECostFunction<A> {
         ansatz: A,
         initial_state: QuantumState,
     ) -> Self {
+        let h_operator = QuantumOperator::from_matrix(hamiltonian.as_complex_operator());
         Self {
-            hamiltonian,
+            h_operator,
             ansatz,
             initial_state,
             cache: Arc::new(Mutex::new(HashMap::new())),
@@ -135,8 +138,7 @@ impl<A: Ansatz> CostFunction for VQECostFunction<A> {
         let psi = self.ansatz.apply(&self.initial_state, parameters);
 
         // Compute ⟨ψ|H|ψ⟩
-        let h_operator = QuantumOperator::from_matrix(self.hamiltonian.as_complex_operator());
-        let expectation = psi.expectation_value(&h_operator);
+        let expectation = psi.expectation_value(&self.h_operator);
         let energy = expectation.re;
 
         // Cache result
@@ -188,6 +190,7 @@ pub struct QAOACostFunction {
     depth: usize,
     initial_state: QuantumState,
     cache: Arc<Mutex<HashMap<String, f64>>>,
+    maxcut_edges: Option<Arc<[(usize, usize)]>>,
 }
 
 impl QAOACostFunction {
@@ -203,9 +206,20 @@ impl QAOACostFunction {
             depth,
             initial_state,
             cache: Arc::new(Mutex::new(HashMap::new())),
+            maxcut_edges: None,
         }
     }
 
+    /// Evaluate ⟨H_C⟩ from the MaxCut edge list instead of the dense operator
+    ///
+    /// The cost Hamiltonian must be the one built by
+    /// [`create_maxcut_hamiltonian`](crate::vqa::qaoa::create_maxcut_hamiltonian)
+    /// from these edges.
+    pub fn with_maxcut_edges(mut self, edges: Arc<[(usize, usize)]>) -> Self {
+        self.maxcut_edges = Some(edges);
+        self
+    }
+
     fn params_to_key(&self, parameters: &[f64]) -> String {
         parameters
             .iter()
@@ -280,8 +294,10 @@ impl CostFunction for QAOACostFunction {
         let state = self.apply_qaoa_circuit(gamma, beta);
 
         // Compute ⟨ψ|H_C|ψ⟩
-        let expectation = state.expectation_value(&self.cost_hamiltonian);
-        let cost = expectation.re;
+        let cost = match &self.maxcut_edges {
+            Some(edges) => maxcut_expectation(&state, edges),
+            None => state.expectation_value(&self.cost_hamiltonian).re,
+        };
 
         // Cache result
         {
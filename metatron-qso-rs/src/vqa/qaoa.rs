@@ -14,6 +14,7 @@ use crate::vqa::cost_function::{GradientMethod, QAOACostFunction};
 use crate::vqa::optimizer::{OptimizationResult, Optimizer, OptimizerConfig, OptimizerType};
 use num_complex::Complex64;
 use rand::Rng;
+use rand::distributions::{Distribution, WeightedIndex};
 use std::sync::Arc;
 
 /// QAOA Configuration
@@ -57,6 +58,7 @@ pub struct QAOA {
     mixer_hamiltonian: Arc<QuantumOperator>,
     config: QAOAConfig,
     classical_optimum: Option<f64>,
+    maxcut_edges: Option<Arc<[(usize, usize)]>>,
 }
 
 impl QAOA {
@@ -73,6 +75,7 @@ impl QAOA {
             mixer_hamiltonian: mixer,
             config,
             classical_optimum: None,
+            maxcut_edges: None,
         }
     }
 
@@ -82,6 +85,15 @@ impl QAOA {
         self
     }
 
+    /// Evaluate the cost from the MaxCut edge list
+    ///
+    /// The cost Hamiltonian must be the one built by
+    /// [`create_maxcut_hamiltonian`] from these edges.
+    pub fn with_maxcut_edges(mut self, edges: Arc<[(usize, usize)]>) -> Self {
+        self.maxcut_edges = Some(edges);
+        self
+    }
+
     /// Default mixer: X mixer (sum of Pauli-X operators)
     fn default_mixer() -> QuantumOperator {
         let mut mixer_matrix = OperatorMatrix::zeros();
@@ -98,6 +110,13 @@ impl QAOA {
 
     /// Run QAOA algorithm
     pub fn run(&self) -> QAOAResult {
+        self.run_with_rng(&mut rand::thread_rng())
+    }
+
+    /// Run QAOA algorithm, drawing the initial parameters from `rng`
+    ///
+    /// Pass a seeded RNG for reproducible runs.
+    pub fn run_with_rng<R: Rng + ?Sized>(&self, rng: &mut R) -> QAOAResult {
         println!("═══════════════════════════════════════════════════════");
         println!("  Quantum Approximate Optimization Algorithm (QAOA)");
         println!("═══════════════════════════════════════════════════════");
@@ -115,15 +134,19 @@ impl QAOA {
         let initial_state = QuantumState::uniform_superposition();
 
         // Create cost function
-        let cost_function = Arc::new(QAOACostFunction::new(
+        let mut cost_function = QAOACostFunction::new(
             self.cost_hamiltonian.clone(),
             self.mixer_hamiltonian.clone(),
             self.config.depth,
             initial_state.clone(),
-        ));
+        );
+        if let Some(edges) = &self.maxcut_edges {
+            cost_function = cost_function.with_maxcut_edges(edges.clone());
+        }
+        let cost_function = Arc::new(cost_function);
 
         // Generate initial parameters
-        let initial_parameters = self.generate_initial_parameters();
+        let initial_parameters = self.generate_initial_parameters(rng);
 
         // Run optimization
         let optimizer = Optimizer::new(
@@ -181,8 +204,7 @@ impl QAOA {
     }
 
     /// Generate initial parameters (heuristic initialization)
-    fn generate_initial_parameters(&self) -> Vec<f64> {
-        let mut rng = rand::thread_rng();
+    fn generate_initial_parameters<R: Rng + ?Sized>(&self, rng: &mut R) -> Vec<f64> {
         let mut params = Vec::with_capacity(2 * self.config.depth);
 
         // Gamma parameters (cost evolution angles)
@@ -260,16 +282,23 @@ impl QAOA {
 
     /// Sample measurement outcomes from optimal state
     pub fn sample_solutions(&self, state: &QuantumState, num_samples: usize) -> Vec<usize> {
-        let mut rng = rand::thread_rng();
-        let mut samples = Vec::with_capacity(num_samples);
-
-        for _ in 0..num_samples {
-            let mut temp_state = state.clone();
-            let measurement = temp_state.measure(&mut rng).unwrap();
-            samples.push(measurement);
-        }
+        self.sample_solutions_with_rng(state, num_samples, &mut rand::thread_rng())
+    }
 
-        samples
+    /// Sample measurement outcomes from optimal state using `rng`
+    pub fn sample_solutions_with_rng<R: Rng + ?Sized>(
+        &self,
+        state: &QuantumState,
+        num_samples: usize,
+        rng: &mut R,
+    ) -> Vec<usize> {
+        // The outcome distribution is fixed, so build the sampler once
+        let distribution = WeightedIndex::new(state.probabilities())
+            .expect("cannot sample from a state with zero norm");
+
+        (0..num_samples)
+            .map(|_| distribution.sample(&mut *rng))
+            .collect()
     }
 
     /// Compute cost distribution from samples
@@ -278,16 +307,21 @@ impl QAOA {
         state: &QuantumState,
         num_samples: usize,
     ) -> (f64, f64, Vec<f64>) {
-        let samples = self.sample_solutions(state, num_samples);
+        self.analyze_samples_with_rng(state, num_samples, &mut rand::thread_rng())
+    }
 
-        let costs: Vec<f64> = samples
-            .iter()
-            .map(|&idx| {
-                let basis_state = QuantumState::basis_state(idx).unwrap();
-                let cost = basis_state.expectation_value(&self.cost_hamiltonian);
-                cost.re
-            })
-            .collect();
+    /// Compute cost distribution from samples drawn with `rng`
+    pub fn analyze_samples_with_rng<R: Rng + ?Sized>(
+        &self,
+        state: &QuantumState,
+        num_samples: usize,
+        rng: &mut R,
+    ) -> (f64, f64, Vec<f64>) {
+        let samples = self.sample_solutions_with_rng(state, num_samples, rng);
+
+        // ⟨k|H_C|k⟩ for a basis state is the diagonal entry of H_C
+        let h_matrix = self.cost_hamiltonian.matrix();
+        let costs: Vec<f64> = samples.iter().map(|&idx| h_matrix[(idx, idx)].re).collect();
 
         let mean_cost = costs.iter().sum::<f64>() / costs.len() as f64;
         let std_dev = (costs.iter().map(|c| (c - mean_cost).powi(2)).sum::<f64>()
@@ -304,6 +338,7 @@ pub struct QAOABuilder {
     mixer_hamiltonian: Option<Arc<QuantumOperator>>,
     config: QAOAConfig,
     classical_optimum: Option<f64>,
+    maxcut_edges: Option<Arc<[(usize, usize)]>>,
 }
 
 impl QAOABuilder {
@@ -313,6 +348,7 @@ impl QAOABuilder {
             mixer_hamiltonian: None,
             config: QAOAConfig::default(),
             classical_optimum: None,
+            maxcut_edges: None,
         }
     }
 
@@ -351,6 +387,11 @@ impl QAOABuilder {
         self
     }
 
+    pub fn maxcut_edges(mut self, edges: Arc<[(usize, usize)]>) -> Self {
+        self.maxcut_edges = Some(edges);
+        self
+    }
+
     pub fn verbose(mut self, verbose: bool) -> Self {
         self.config.optimizer_config.verbose = verbose;
         self
@@ -367,6 +408,10 @@ impl QAOABuilder {
             qaoa = qaoa.with_classical_optimum(opt);
         }
 
+        if let Some(edges) = self.maxcut_edges {
+            qaoa = qaoa.with_maxcut_edges(edges);
+        }
+
         qaoa
     }
 }
@@ -396,6 +441,21 @@ pub fn create_maxcut_hamiltonian(edges: &[(usize, usize)]) -> QuantumOperator {
     QuantumOperator::from_matrix(hamiltonian)
 }
 
+/// MaxCut cost expectation ⟨ψ|H_C|ψ⟩ evaluated directly from the edge list
+///
+/// The operator built by [`create_maxcut_hamiltonian`] is -1/2 times the graph
+/// Laplacian, so its expectation reduces to -1/2 Σ_{(i,j)∈E} |ψ_i - ψ_j|².
+/// This touches two amplitudes per edge instead of running a dense
+/// matrix-vector product.
+pub fn maxcut_expectation(state: &QuantumState, edges: &[(usize, usize)]) -> f64 {
+    let amplitudes = state.amplitudes();
+    -0.5 * edges
+        .iter()
+        .filter(|&&(i, j)| i < METATRON_DIMENSION && j < METATRON_DIMENSION)
+        .map(|&(i, j)| (amplitudes[i] - amplitudes[j]).norm_sqr())
+        .sum::<f64>()
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -435,4 +495,14 @@ mod tests {
         let energy = state.expectation_value(&h);
         assert!(energy.re.is_finite());
     }
+
+    #[test]
+    fn test_maxcut_expectation_matches_operator() {
+        let edges = vec![(0, 1), (1, 2), (2, 0), (3, 7), (5, 12)];
+        let h = create_maxcut_hamiltonian(&edges);
+
+        let state = QuantumState::random(Some(11));
+        let dense = state.expectation_value(&h).re;
+        assert!((maxcut_expectation(&state, &edges) - dense).abs() < 1e-12);
+    }
 }
@@ -7,6 +7,7 @@ on the Metatron Cube graph using the Python SDK.
 """
 
 import metatron_qso
+import numpy as np
 
 
 def main():
@@ -39,15 +40,16 @@ def main():
     print(f"  Number of time steps: {len(result['times'])}")
     print()
 
+    times = result["times"]
+    probabilities = result["probabilities"]
+
     # Show probability distribution at key times
-    times_to_show = [0.0, 1.0, 2.5, 5.0]
-    for t in times_to_show:
-        # Find closest time index
-        idx = min(
-            range(len(result["times"])), key=lambda i: abs(result["times"][i] - t)
-        )
-        actual_t = result["times"][idx]
-        probs = result["probabilities"][idx]
+    times_to_show = np.array([0.0, 1.0, 2.5, 5.0])
+    # Closest time index for every key time in one broadcast reduction
+    closest = np.abs(times[:, None] - times_to_show).argmin(axis=0)
+    for idx in closest:
+        actual_t = times[idx]
+        probs = probabilities[idx]
 
         print(f"Time t = {actual_t:.2f}:")
         # Show probabilities for central node and first few neighbors
@@ -60,20 +62,16 @@ def main():
     # Final state analysis
     final_probs = result["final_state"]
     print("Final State Analysis (t = 5.0):")
-    print(f"  Total probability: {sum(final_probs):.6f} (should be 1.0)")
-    print(
-        f"  Max probability: {max(final_probs):.6f} at node {final_probs.index(max(final_probs))}"
-    )
-    print(
-        f"  Min probability: {min(final_probs):.6f} at node {final_probs.index(min(final_probs))}"
-    )
+    print(f"  Total probability: {final_probs.sum():.6f} (should be 1.0)")
+    print(f"  Max probability: {final_probs.max():.6f} at node {final_probs.argmax()}")
+    print(f"  Min probability: {final_probs.min():.6f} at node {final_probs.argmin()}")
     print()
 
-    # Calculate and display entropy (measure of spreading)
-    import math
-
-    entropy = -sum(p * math.log(p) if p > 0 else 0 for p in final_probs)
-    max_entropy = math.log(graph.num_nodes())
+    # Calculate and display entropy (measure of spreading); masking out zero
+    # probabilities keeps the reduction branch-free and avoids log(0)
+    nonzero = final_probs[final_probs > 0]
+    entropy = -np.sum(nonzero * np.log(nonzero))
+    max_entropy = np.log(graph.num_nodes())
     print(f"  Entropy: {entropy:.4f} / {max_entropy:.4f} (max)")
     print(f"  Spreading: {(entropy / max_entropy) * 100:.2f}%")
     print()
@@ -6,6 +6,8 @@ This example demonstrates how to use VQE (Variational Quantum Eigensolver)
 to find the ground state energy of the Metatron Hamiltonian.
 """
 
+import sys
+
 import metatron_qso
 
 
@@ -63,8 +65,8 @@ def main():
         # Show first few probabilities
         final_probs = result["final_state"]
         print("  Final state (first 5 nodes):")
-        for i in range(min(5, len(final_probs))):
-            print(f"    Node {i}: P = {final_probs[i]:.6f}")
+        rows = [f"    Node {i}: P = {p:.6f}" for i, p in enumerate(final_probs[:5])]
+        sys.stdout.write("\n".join(rows) + "\n")
         print()
         print("-" * 60)
         print()
@@ -76,11 +78,12 @@ def main():
 
     print(f"{'Ansatz':<30} {'Energy':>15} {'Error':>15} {'Iters':>8}")
     print("-" * 70)
-    for name, result in results:
-        print(
-            f"{name:<30} {result['ground_state_energy']:>15.10f} "
-            f"{result['error']:>15.10e} {result['iterations']:>8}"
-        )
+    rows = [
+        f"{name:<30} {result['ground_state_energy']:>15.10f} "
+        f"{result['error']:>15.10e} {result['iterations']:>8}"
+        for name, result in results
+    ]
+    sys.stdout.write("\n".join(rows) + "\n")
     print()
 
     # Find best result
@@ -12,6 +12,8 @@ Use Cases:
 - Resource allocation prioritization
 """
 
+import sys
+
 import metatron_qso
 
 
@@ -49,10 +51,12 @@ def main():
     print(f"{'Rank':<6} {'Node':<6} {'Score':<10} {'Bar Chart':<30}")
     print("-" * 60)
 
-    for rank, (node_id, score) in enumerate(node_scores, 1):
-        bar_length = int(score * 30)  # Scale to 30 characters
-        bar = "█" * bar_length
-        print(f"{rank:<6} {node_id:<6} {score:<10.6f} {bar}")
+    # Format all rows first and write them in one call
+    rows = [
+        f"{rank:<6} {node_id:<6} {score:<10.6f} {'█' * int(score * 30)}"
+        for rank, (node_id, score) in enumerate(node_scores, 1)
+    ]
+    sys.stdout.write("\n".join(rows) + "\n")
 
     print()
 
@@ -85,13 +89,15 @@ def main():
     # Top 5 most central nodes
     print("Top 5 Most Central Nodes:")
     print("-" * 60)
+    rows = []
     for rank, (node_id, score) in enumerate(node_scores[:5], 1):
         node_type = (
             "Central"
             if node_id == 0
             else ("Hexagon" if node_id in hexagon_nodes else "Cube")
         )
-        print(f"  {rank}. Node {node_id:2d} ({node_type:8s}): {score:.6f}")
+        rows.append(f"  {rank}. Node {node_id:2d} ({node_type:8s}): {score:.6f}")
+    sys.stdout.write("\n".join(rows) + "\n")
 
     print()
     print("=" * 60)
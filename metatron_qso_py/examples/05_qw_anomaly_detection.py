@@ -13,7 +13,10 @@ Use Cases:
 - Social network manipulation detection
 """
 
+import sys
+
 import metatron_qso
+import numpy as np
 
 
 def main():
@@ -57,20 +60,31 @@ def main():
 
     # Define threshold for anomaly detection
     threshold = 0.05  # Adjust based on sensitivity needs
-    max_score = max(anomaly_scores) if max(anomaly_scores) > 0 else 1.0
-
-    anomalous_nodes = []
-
-    for node_id, score in enumerate(anomaly_scores):
-        status = "ANOMALOUS" if score > threshold else "Normal"
-        normalized_score = score / max_score if max_score > 0 else 0
-        bar_length = int(normalized_score * 25)
-        bar = "█" * bar_length
 
-        print(f"{node_id:<6} {score:<12.6f} {status:<15} {bar}")
-
-        if score > threshold:
-            anomalous_nodes.append((node_id, score))
+    # Classify all nodes at once
+    scores = np.asarray(anomaly_scores)
+    mask = scores > threshold
+    max_score = scores.max() if scores.max() > 0 else 1.0
+    statuses = np.where(mask, "ANOMALOUS", "Normal")
+    bar_lengths = (scores / max_score * 25).astype(int)
+
+    # Format all rows first and write them in one call
+    rows = [
+        f"{node_id:<6} {score:<12.6f} {status:<15} {'█' * bar_length}"
+        for node_id, (score, status, bar_length) in enumerate(
+            zip(scores, statuses, bar_lengths)
+        )
+    ]
+    sys.stdout.write("\n".join(rows) + "\n")
+
+    # Anomalous nodes ranked by score, highest first
+    anomalous_idx = np.flatnonzero(mask)
+    anomalous_nodes = anomalous_idx[np.argsort(-scores[anomalous_idx], kind="stable")]
+    severities = np.where(
+        scores[anomalous_nodes] > 0.1,
+        "HIGH",
+        np.where(scores[anomalous_nodes] > threshold, "MEDIUM", "LOW"),
+    )
 
     print()
 
@@ -82,15 +96,16 @@ def main():
     print(f"  Anomalous nodes detected: {len(anomalous_nodes)}")
     print()
 
-    if anomalous_nodes:
+    if anomalous_nodes.size:
         print("Detected Anomalies (ranked by severity):")
         print("-" * 60)
-        anomalous_nodes.sort(key=lambda x: x[1], reverse=True)
-        for rank, (node_id, score) in enumerate(anomalous_nodes, 1):
-            severity = (
-                "HIGH" if score > 0.1 else "MEDIUM" if score > threshold else "LOW"
+        rows = [
+            f"  {rank}. Node {node_id}: score={scores[node_id]:.6f}, severity={severity}"
+            for rank, (node_id, severity) in enumerate(
+                zip(anomalous_nodes, severities), 1
             )
-            print(f"  {rank}. Node {node_id}: score={score:.6f}, severity={severity}")
+        ]
+        sys.stdout.write("\n".join(rows) + "\n")
     else:
         print("✓ No significant anomalies detected")
         print("  All nodes behave consistently with baseline")
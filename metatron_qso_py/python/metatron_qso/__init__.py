@@ -12,34 +12,124 @@ Example:
     >>> graph = metatron_qso.MetatronGraph()
     >>> result = metatron_qso.run_quantum_walk(graph, [0], t_max=5.0, dt=0.1)
     >>> print(result['final_state'])
+
+Quantum walk results are returned as NumPy arrays (dtype ``float64``):
+``result['times']`` has shape ``(T,)``, ``result['probabilities']`` has shape
+``(T, N)`` and ``result['final_state']`` has shape ``(N,)``. Use
+``run_quantum_walk_batch`` to evolve many initial conditions in one call; its
+``probabilities`` array has shape ``(S, T, N)``. Pass ``order="F"`` to
+``run_quantum_walk`` for a column-major ``probabilities`` array when reducing
+per node over time.
+
+``run_quantum_walk`` and ``quantum_walk_centrality`` accept a ``method``
+keyword: ``"spectral"`` (exact eigendecomposition), ``"krylov"`` (Lanczos
+approximation using only matrix-vector products, for large sparse graphs) or
+``"auto"`` (spectral up to 64 nodes, Krylov above).
+
+Each ``MetatronGraph`` caches its Hamiltonian eigendecomposition and MaxCut
+cost operator after the first call that needs them, so repeated runs on the
+same graph skip the setup. ``graph.prepare()`` builds the caches eagerly.
+
+``run_vqe``, ``solve_maxcut_qaoa`` and ``solve_maxcut_qaoa_advanced`` accept an
+``optimizer`` keyword (``"adam"``, ``"nelder_mead"``, ``"lbfgs"`` or
+``"gradient_descent"``). VQE gradients use the parameter-shift rule.
+
+``solve_maxcut_qaoa_advanced`` memoizes seeded runs per graph: a repeated call
+with the same graph, depth, iteration budget, seed and optimizer returns the
+cached result dictionary. Pass ``cache=False`` to force a fresh solve.
 """
 
+import weakref
+
 # Import from the internal Rust module
 from ._metatron_qso_internal import (
     MetatronGraph,
     run_quantum_walk,
+    run_quantum_walk_batch,
     solve_maxcut_qaoa,
     run_vqe,
     # High-level toolkits
     quantum_walk_centrality,
     quantum_walk_anomaly_score,
     quantum_walk_connectivity,
-    solve_maxcut_qaoa_advanced,
+    solve_maxcut_qaoa_advanced as _solve_maxcut_qaoa_advanced,
     __version__,
 )
 
-# Import auto-tuning integration (optional SCS support)
-from .auto_tuning import (
-    run_quantum_walk_with_tuning,
-    solve_maxcut_qaoa_with_tuning,
-    run_vqe_with_tuning,
-    SCS_AVAILABLE,
+# Auto-tuning integration (optional SCS support) is imported on first access,
+# so plain SDK users do not pay for loading SCS
+_AUTO_TUNING_EXPORTS = frozenset(
+    {
+        "run_quantum_walk_with_tuning",
+        "solve_maxcut_qaoa_with_tuning",
+        "run_vqe_with_tuning",
+        "clear_tuner_cache",
+        "SCS_AVAILABLE",
+    }
 )
 
-__all__ = [
+
+def __getattr__(name):
+    if name in _AUTO_TUNING_EXPORTS:
+        from . import auto_tuning
+
+        value = getattr(auto_tuning, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _AUTO_TUNING_EXPORTS)
+
+
+# Seeded QAOA results per graph; entries vanish with the graph
+_qaoa_cache = weakref.WeakKeyDictionary()
+
+
+def solve_maxcut_qaoa_advanced(
+    graph, depth=3, max_iters=100, seed=None, optimizer="nelder_mead", cache=None
+):
+    """
+    Advanced MaxCut solver with full control.
+
+    Solves the MaxCut problem using QAOA with advanced options. Seeded runs are
+    deterministic, so their results are memoized per graph.
+
+    Args:
+        graph (MetatronGraph): The graph to partition
+        depth (int): QAOA circuit depth (default: 3)
+        max_iters (int): Maximum optimization iterations (default: 100)
+        seed (int, optional): Random seed for reproducibility
+        optimizer (str): Classical optimizer: "nelder_mead", "lbfgs", "adam",
+            or "gradient_descent" (default: "nelder_mead")
+        cache (bool, optional): Reuse the result of an identical earlier call.
+            Defaults to True when ``seed`` is given and False otherwise.
+
+    Returns:
+        dict: Dictionary with 'cut_value', 'assignment', 'approximation_ratio'
+        and 'meta'. Cached results are returned as the same dictionary object,
+        so copy it before modifying it.
+    """
+    if cache is None:
+        cache = seed is not None
+    if not cache:
+        return _solve_maxcut_qaoa_advanced(graph, depth, max_iters, seed, optimizer)
+
+    results = _qaoa_cache.setdefault(graph, {})
+    key = (depth, max_iters, seed, optimizer)
+    if key not in results:
+        results[key] = _solve_maxcut_qaoa_advanced(
+            graph, depth, max_iters, seed, optimizer
+        )
+    return results[key]
+
+
+__all__ = (
     "MetatronGraph",
     # Core functions
     "run_quantum_walk",
+    "run_quantum_walk_batch",
     "solve_maxcut_qaoa",
     "run_vqe",
     # Quantum Walk Toolkit
@@ -52,6 +142,7 @@ __all__ = [
     "run_quantum_walk_with_tuning",
     "solve_maxcut_qaoa_with_tuning",
     "run_vqe_with_tuning",
+    "clear_tuner_cache",
     "SCS_AVAILABLE",
     "__version__",
-]
+)
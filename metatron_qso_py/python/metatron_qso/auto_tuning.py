@@ -6,8 +6,13 @@ Quantum Walk and QAOA algorithms.
 """
 
 from typing import Dict, Any, Optional, Tuple, List
+import functools
 import sys
+import time
 from pathlib import Path
+from types import MappingProxyType
+
+import numpy as np
 
 # Import core functions from Rust bindings
 from ._metatron_qso_internal import (
@@ -25,7 +30,9 @@ try:
 
     from scs import (
         AutoTuner,
+        BenchmarkRecord,
         Configuration,
+        generate_config_id,
         write_benchmark,
         NewConfigProposal,
     )
@@ -34,10 +41,43 @@ try:
 except ImportError:
     SCS_AVAILABLE = False
     AutoTuner = None
+    BenchmarkRecord = None
     Configuration = None
+    generate_config_id = None
     write_benchmark = None
     NewConfigProposal = None
 
+# Shared read-only stand-in for results without a "meta" section
+_EMPTY_META = MappingProxyType({})
+
+
+@functools.lru_cache(maxsize=8)
+def _get_tuner(benchmark_dir: str) -> Any:
+    """
+    Get the initialized auto-tuner for a benchmark directory.
+
+    Tuners are created and initialized once per directory and reused, so
+    repeated tuning runs do not reload the calibration state each call.
+
+    Args:
+        benchmark_dir: Directory for benchmark files
+
+    Returns:
+        Initialized AutoTuner instance
+    """
+    tuner = AutoTuner(benchmark_dir=benchmark_dir, enabled=True)
+    tuner.initialize()
+    return tuner
+
+
+def clear_tuner_cache() -> None:
+    """
+    Drop all cached auto-tuners.
+
+    The next tuning run re-reads the calibration state from disk.
+    """
+    _get_tuner.cache_clear()
+
 
 def run_quantum_walk_with_tuning(
     graph: Any,
@@ -92,16 +132,20 @@ def run_quantum_walk_with_tuning(
         "source_nodes": source_nodes,
     }
 
-    # Create auto-tuner and ingest benchmark
-    tuner = AutoTuner(benchmark_dir=benchmark_dir, enabled=True)
-    tuner.initialize()
+    # Get the cached auto-tuner for this benchmark directory
+    tuner = _get_tuner(str(benchmark_dir))
 
     # Write benchmark
-    tuner.ingest_benchmark(
-        system="quantum_walk",
-        config=config,
-        metrics=metrics,
-        raw_results=result,
+    tuner.ingest_record(
+        _make_record(
+            "quantum_walk",
+            config,
+            metrics,
+            {
+                key: value.tolist() if hasattr(value, "tolist") else value
+                for key, value in result.items()
+            },
+        )
     )
 
     # Get config proposal
@@ -164,17 +208,11 @@ def solve_maxcut_qaoa_with_tuning(
         "max_iterations": max_iters,
     }
 
-    # Create auto-tuner
-    tuner = AutoTuner(benchmark_dir=benchmark_dir, enabled=True)
-    tuner.initialize()
+    # Get the cached auto-tuner for this benchmark directory
+    tuner = _get_tuner(str(benchmark_dir))
 
     # Write benchmark
-    tuner.ingest_benchmark(
-        system="qaoa_maxcut",
-        config=config,
-        metrics=metrics,
-        raw_results=result,
-    )
+    tuner.ingest_record(_make_record("qaoa_maxcut", config, metrics, result))
 
     # Get config proposal
     proposal = tuner.propose_new_config()
@@ -229,17 +267,11 @@ def run_vqe_with_tuning(
         "max_iterations": max_iters,
     }
 
-    # Create auto-tuner
-    tuner = AutoTuner(benchmark_dir=benchmark_dir, enabled=True)
-    tuner.initialize()
+    # Get the cached auto-tuner for this benchmark directory
+    tuner = _get_tuner(str(benchmark_dir))
 
     # Write benchmark
-    tuner.ingest_benchmark(
-        system="vqe",
-        config=config,
-        metrics=metrics,
-        raw_results=result,
-    )
+    tuner.ingest_record(_make_record("vqe", config, metrics, result))
 
     # Get config proposal
     proposal = tuner.propose_new_config()
@@ -247,6 +279,33 @@ def run_vqe_with_tuning(
     return result, proposal
 
 
+def _make_record(
+    system: str,
+    config: Dict[str, Any],
+    metrics: Dict[str, float],
+    raw_results: Dict[str, Any],
+) -> "BenchmarkRecord":
+    """
+    Build a benchmark record from a tuned run.
+
+    The metrics come from the _compute_*_metrics helpers, which clamp them to
+    [0, 1]; ingest_record still runs the quick input check before writing.
+    """
+    return BenchmarkRecord(
+        system=system,
+        config_id=generate_config_id(config),
+        timestamp=time.time(),
+        config=config,
+        metrics=metrics,
+        raw_results=raw_results,
+    )
+
+
+def _clamp_unit(value: float) -> float:
+    """Clamp a metric to [0, 1]."""
+    return min(1.0, max(0.0, float(value)))
+
+
 def _compute_qw_metrics(
     result: Dict[str, Any], t_max: float, dt: float
 ) -> Dict[str, float]:
@@ -262,14 +321,13 @@ def _compute_qw_metrics(
         Metrics dictionary {psi, rho, omega}
     """
     # Quality (ψ): Spreading quality based on entropy
-    final_state = result.get("final_state", [])
-    if final_state:
-        import math
-
-        # Compute entropy
-        entropy = -sum(p * math.log(p) if p > 1e-10 else 0 for p in final_state)
-        max_entropy = math.log(len(final_state))
-        psi = min(1.0, entropy / max_entropy) if max_entropy > 0 else 0.5
+    final_state = np.asarray(result.get("final_state", []), dtype=np.float64)
+    if final_state.size > 0:
+        # Compute entropy over the non-negligible probabilities
+        probs = final_state[final_state > 1e-10]
+        entropy = -np.dot(probs, np.log(probs))
+        max_entropy = np.log(final_state.size)
+        psi = float(min(1.0, entropy / max_entropy)) if max_entropy > 0 else 0.5
     else:
         psi = 0.5
 
@@ -277,7 +335,7 @@ def _compute_qw_metrics(
     rho = 0.90
 
     # Efficiency (ω): Based on computation speed
-    wallclock = result.get("meta", {}).get("wallclock_time_ms", 1000)
+    wallclock = (result.get("meta") or _EMPTY_META).get("wallclock_time_ms", 1000)
     expected_time = 200  # ms for reference
     omega = min(1.0, expected_time / max(wallclock, 1))
 
@@ -294,11 +352,12 @@ def _compute_qaoa_metrics(result: Dict[str, Any]) -> Dict[str, float]:
     Returns:
         Metrics dictionary {psi, rho, omega}
     """
-    # Quality (ψ): Approximation ratio
-    psi = result.get("approximation_ratio", 0.8)
+    # Quality (ψ): Approximation ratio (cost / estimated optimum, which can
+    # leave [0, 1])
+    psi = _clamp_unit(result.get("approximation_ratio", 0.8))
 
     # Stability (ρ): Assume good stability if converged
-    meta = result.get("meta", {})
+    meta = result.get("meta") or _EMPTY_META
     iterations = meta.get("iterations", 100)
     max_iters = meta.get("max_iterations", 100)
 
@@ -325,10 +384,10 @@ def _compute_vqe_metrics(result: Dict[str, Any]) -> Dict[str, float]:
         Metrics dictionary {psi, rho, omega}
     """
     # Quality (ψ): Based on quality score
-    psi = result.get("quality_score", 0.8)
+    psi = _clamp_unit(result.get("quality_score", 0.8))
 
     # Stability (ρ): Based on convergence
-    meta = result.get("meta", {})
+    meta = result.get("meta") or _EMPTY_META
     converged = meta.get("converged", False)
     rho = 0.85 if converged else 0.65
 
@@ -346,5 +405,6 @@ __all__ = [
     "run_quantum_walk_with_tuning",
     "solve_maxcut_qaoa_with_tuning",
     "run_vqe_with_tuning",
+    "clear_tuner_cache",
     "SCS_AVAILABLE",
 ]
@@ -2,22 +2,63 @@
 //!
 //! This module provides a Python-friendly API for the Metatron QSO quantum computing framework.
 
+use numpy::ndarray::{Array2, Array3, ShapeBuilder};
+use numpy::{IntoPyArray, PyArray1};
 use pyo3::exceptions::{PyRuntimeError, PyValueError};
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
-use std::sync::Arc;
+use std::sync::{Arc, OnceLock};
 
 // Import from the Rust core library with explicit path to avoid module conflicts
 use core::prelude::*;
+use core::quantum_walk_toolkit::EvolutionMethod;
 use metatron_qso as core;
 
 /// Python wrapper for MetatronGraph
 ///
 /// Represents the 13-node Metatron Cube graph with 78 edges.
-#[pyclass(name = "MetatronGraph")]
+///
+/// The graph Hamiltonian (with its eigendecomposition) and the MaxCut cost
+/// operator are built lazily on first use and cached on the instance.
+#[pyclass(name = "MetatronGraph", weakref)]
 #[derive(Clone)]
 struct PyMetatronGraph {
     inner: MetatronGraph,
+    hamiltonian: OnceLock<Arc<MetatronHamiltonian>>,
+    maxcut_hamiltonian: OnceLock<Arc<QuantumOperator>>,
+}
+
+impl PyMetatronGraph {
+    fn from_graph(inner: MetatronGraph) -> Self {
+        PyMetatronGraph {
+            inner,
+            hamiltonian: OnceLock::new(),
+            maxcut_hamiltonian: OnceLock::new(),
+        }
+    }
+
+    /// Graph Hamiltonian with default parameters, diagonalized once per graph
+    fn cached_hamiltonian(&self) -> Arc<MetatronHamiltonian> {
+        self.hamiltonian
+            .get_or_init(|| {
+                Arc::new(MetatronHamiltonian::new(
+                    &self.inner,
+                    &QSOParameters::default(),
+                ))
+            })
+            .clone()
+    }
+
+    /// MaxCut cost Hamiltonian built from the graph edges
+    fn cached_maxcut_hamiltonian(&self) -> Arc<QuantumOperator> {
+        self.maxcut_hamiltonian
+            .get_or_init(|| {
+                Arc::new(core::vqa::qaoa::create_maxcut_hamiltonian(
+                    self.inner.edges(),
+                ))
+            })
+            .clone()
+    }
 }
 
 #[pymethods]
@@ -25,9 +66,7 @@ impl PyMetatronGraph {
     /// Create a new Metatron Cube graph with default configuration
     #[new]
     fn new() -> Self {
-        PyMetatronGraph {
-            inner: MetatronGraph::new(),
-        }
+        PyMetatronGraph::from_graph(MetatronGraph::new())
     }
 
     /// Create a graph from an adjacency list representation
@@ -46,9 +85,21 @@ impl PyMetatronGraph {
                 "Metatron graph must have exactly 13 nodes",
             ));
         }
-        Ok(PyMetatronGraph {
-            inner: MetatronGraph::new(),
-        })
+        Ok(PyMetatronGraph::from_graph(MetatronGraph::new()))
+    }
+
+    /// Precompute and cache graph-derived operators
+    ///
+    /// Builds the graph Hamiltonian with its eigendecomposition and the
+    /// MaxCut cost Hamiltonian. This happens automatically on first use;
+    /// calling it up front moves the cost out of the first algorithm call.
+    ///
+    /// Returns:
+    ///     MetatronGraph: The same graph instance, for chaining
+    fn prepare(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf.cached_hamiltonian();
+        slf.cached_maxcut_hamiltonian();
+        slf
     }
 
     /// Get the number of nodes in the graph
@@ -93,6 +144,60 @@ impl PyMetatronGraph {
     }
 }
 
+/// Build a state with equal amplitude on each source node
+fn uniform_source_state(source_nodes: &[usize], n: usize) -> PyResult<QuantumState> {
+    if source_nodes.is_empty() {
+        return Err(PyValueError::new_err("source_nodes cannot be empty"));
+    }
+
+    let mut amplitudes = vec![num_complex::Complex64::new(0.0, 0.0); n];
+    let amplitude = num_complex::Complex64::new(1.0 / (source_nodes.len() as f64).sqrt(), 0.0);
+    for &node in source_nodes {
+        if node >= n {
+            return Err(PyValueError::new_err(format!(
+                "Node index {} out of bounds (graph has {} nodes)",
+                node, n
+            )));
+        }
+        amplitudes[node] = amplitude;
+    }
+
+    QuantumState::from_amplitudes(amplitudes)
+        .map_err(|e| PyRuntimeError::new_err(format!("Failed to create initial state: {}", e)))
+}
+
+/// Parse an optimizer name as accepted by the Python API
+fn parse_optimizer(name: &str) -> PyResult<OptimizerType> {
+    match name.to_lowercase().as_str() {
+        "adam" => Ok(OptimizerType::Adam),
+        "nelder_mead" | "nelder-mead" => Ok(OptimizerType::NelderMead),
+        "lbfgs" | "lbfgsb" | "l-bfgs" | "l-bfgs-b" => Ok(OptimizerType::LBFGS),
+        "gradient_descent" => Ok(OptimizerType::GradientDescent),
+        _ => Err(PyValueError::new_err(
+            "optimizer must be 'adam', 'nelder_mead', 'lbfgs', or 'gradient_descent'",
+        )),
+    }
+}
+
+/// Node count above which `method="auto"` switches to Krylov evolution
+const KRYLOV_AUTO_THRESHOLD: usize = 64;
+
+/// Parse a time-evolution method name as accepted by the Python API
+///
+/// `"auto"` picks exact spectral evolution for small graphs and the
+/// Krylov/Lanczos approximation for graphs above [`KRYLOV_AUTO_THRESHOLD`].
+fn parse_method(name: &str, num_nodes: usize) -> PyResult<EvolutionMethod> {
+    match name.to_lowercase().as_str() {
+        "spectral" | "dense" => Ok(EvolutionMethod::Spectral),
+        "krylov" | "lanczos" => Ok(EvolutionMethod::Krylov),
+        "auto" if num_nodes > KRYLOV_AUTO_THRESHOLD => Ok(EvolutionMethod::Krylov),
+        "auto" => Ok(EvolutionMethod::Spectral),
+        _ => Err(PyValueError::new_err(
+            "method must be 'auto', 'spectral', or 'krylov'",
+        )),
+    }
+}
+
 /// Run a continuous-time quantum walk on a graph
 ///
 /// Args:
@@ -100,24 +205,36 @@ impl PyMetatronGraph {
 ///     source_nodes (list of int): Initial nodes with equal probability
 ///     t_max (float): Maximum evolution time (default: 10.0)
 ///     dt (float): Time step for evolution (default: 0.1)
+///     method (str): Time-evolution scheme: 'spectral' (exact, from the
+///         eigendecomposition), 'krylov' (Lanczos approximation using only
+///         matrix-vector products) or 'auto' (default)
+///     order (str): Memory layout of 'probabilities': 'C' (default,
+///         row-major, each time slice contiguous) or 'F' (column-major, each
+///         node's trajectory contiguous, faster for per-node reductions)
 ///
 /// Returns:
 ///     dict: Dictionary containing:
-///         - 'times': List of time points
-///         - 'probabilities': List of probability distributions at each time
-///         - 'final_state': Final probability distribution
+///         - 'times': ``numpy.ndarray`` of shape ``(T,)`` with the time points
+///         - 'probabilities': ``numpy.ndarray`` of shape ``(T, N)`` with the
+///           probability distribution at each time (one row per time point)
+///         - 'final_state': ``numpy.ndarray`` of shape ``(N,)`` with the final
+///           probability distribution
+///
+///     All arrays have dtype ``float64``.
 ///
 /// Example:
 ///     >>> graph = MetatronGraph()
 ///     >>> result = run_quantum_walk(graph, [0], t_max=5.0, dt=0.1)
 ///     >>> print(result['final_state'])
 #[pyfunction]
-#[pyo3(signature = (graph, source_nodes, t_max=10.0, dt=0.1))]
+#[pyo3(signature = (graph, source_nodes, t_max=10.0, dt=0.1, method="auto", order="C"))]
 fn run_quantum_walk(
     graph: &PyMetatronGraph,
     source_nodes: Vec<usize>,
     t_max: f64,
     dt: f64,
+    method: &str,
+    order: &str,
 ) -> PyResult<Py<PyAny>> {
     // Validate inputs
     if source_nodes.is_empty() {
@@ -129,57 +246,137 @@ fn run_quantum_walk(
     if dt <= 0.0 || dt > t_max {
         return Err(PyValueError::new_err("dt must be positive and <= t_max"));
     }
+    let column_major = match order {
+        "C" | "c" => false,
+        "F" | "f" => true,
+        _ => return Err(PyValueError::new_err("order must be 'C' or 'F'")),
+    };
 
     // Create initial state (uniform over source nodes)
     let n = graph.inner.nodes().len();
-    let mut amplitudes = vec![num_complex::Complex64::new(0.0, 0.0); n];
-    let amplitude = num_complex::Complex64::new(1.0 / (source_nodes.len() as f64).sqrt(), 0.0);
-    for &node in &source_nodes {
-        if node >= n {
-            return Err(PyValueError::new_err(format!(
-                "Node index {} out of bounds (graph has {} nodes)",
-                node, n
-            )));
+    let method = parse_method(method, n)?;
+    let initial_state = uniform_source_state(&source_nodes, n)?;
+
+    // Reuse the cached Hamiltonian
+    let hamiltonian = graph.cached_hamiltonian();
+
+    // Evaluate all time points in one pass
+    let num_steps = (t_max / dt).ceil() as usize;
+    let times: Vec<f64> = (0..=num_steps)
+        .map(|i| ((i as f64) * dt).min(t_max))
+        .collect();
+
+    let series = core::quantum_walk_toolkit::quantum_walk_probabilities(
+        &hamiltonian,
+        &initial_state,
+        &times,
+        method,
+    );
+    let num_times = times.len();
+    let final_state = series[num_times - 1][..n].to_vec();
+
+    // (T, N) buffer handed to NumPy without per-element boxing, laid out
+    // either time-major (C) or node-major (F)
+    let mut probabilities = Vec::with_capacity(num_times * n);
+    if column_major {
+        for node in 0..n {
+            probabilities.extend(series.iter().map(|probs| probs[node]));
+        }
+    } else {
+        for probs in &series {
+            probabilities.extend_from_slice(&probs[..n]);
         }
-        amplitudes[node] = amplitude;
     }
 
-    // Create quantum state
-    let initial_state = QuantumState::from_amplitudes(amplitudes)
-        .map_err(|e| PyRuntimeError::new_err(format!("Failed to create initial state: {}", e)))?;
+    // Return as Python dict
+    let shape = (num_times, n).set_f(column_major);
+    let probabilities = Array2::from_shape_vec(shape, probabilities)
+        .map_err(|e| PyRuntimeError::new_err(format!("Invalid probability buffer: {}", e)))?;
 
-    // Create Hamiltonian and quantum walk
-    let params = QSOParameters::default();
-    let hamiltonian = MetatronHamiltonian::new(&graph.inner, &params);
-    let qw = ContinuousTimeQuantumWalk::new(&hamiltonian);
+    Python::attach(|py| {
+        let result = PyDict::new(py);
+        result.set_item("times", times.into_pyarray(py))?;
+        result.set_item("probabilities", probabilities.into_pyarray(py))?;
+        result.set_item("final_state", PyArray1::from_vec(py, final_state))?;
+        Ok(result.into_any().unbind())
+    })
+}
 
-    // Evolve the state at different times
-    let num_steps = (t_max / dt).ceil() as usize;
-    let mut times = Vec::with_capacity(num_steps + 1);
-    let mut probabilities = Vec::with_capacity(num_steps + 1);
+/// Run many continuous-time quantum walks on a graph in a single call
+///
+/// All walks share one Hamiltonian and its eigendecomposition, and every
+/// time slice is evaluated for the whole batch at once.
+///
+/// Args:
+///     graph (MetatronGraph): The graph to run the walks on
+///     source_nodes_list (list of list of int): Source nodes for each walk;
+///         each walk starts with equal probability on its source nodes
+///     t_max (float): Maximum evolution time (default: 10.0)
+///     dt (float): Time step for evolution (default: 0.1)
+///
+/// Returns:
+///     dict: Dictionary containing:
+///         - 'times': ``numpy.ndarray`` of shape ``(T,)`` with the time points
+///         - 'probabilities': ``numpy.ndarray`` of shape ``(S, T, N)`` with the
+///           probability distribution of walk ``s`` at each time
+///
+///     All arrays have dtype ``float64``.
+///
+/// Example:
+///     >>> graph = MetatronGraph()
+///     >>> result = run_quantum_walk_batch(graph, [[0], [1], [7]], t_max=5.0)
+///     >>> result['probabilities'].shape
+///     (3, 51, 13)
+#[pyfunction]
+#[pyo3(signature = (graph, source_nodes_list, t_max=10.0, dt=0.1))]
+fn run_quantum_walk_batch(
+    graph: &PyMetatronGraph,
+    source_nodes_list: Vec<Vec<usize>>,
+    t_max: f64,
+    dt: f64,
+) -> PyResult<Py<PyAny>> {
+    // Validate inputs
+    if source_nodes_list.is_empty() {
+        return Err(PyValueError::new_err("source_nodes_list cannot be empty"));
+    }
+    if t_max <= 0.0 {
+        return Err(PyValueError::new_err("t_max must be positive"));
+    }
+    if dt <= 0.0 || dt > t_max {
+        return Err(PyValueError::new_err("dt must be positive and <= t_max"));
+    }
 
-    // Initial state
-    times.push(0.0);
-    probabilities.push(initial_state.probabilities().to_vec());
+    let n = graph.inner.nodes().len();
+    let initial_states = source_nodes_list
+        .iter()
+        .map(|source_nodes| uniform_source_state(source_nodes, n))
+        .collect::<PyResult<Vec<_>>>()?;
 
-    // Evolve
-    for i in 1..=num_steps {
-        let t = (i as f64) * dt;
-        let t = t.min(t_max);
-        times.push(t);
+    // Reuse the cached Hamiltonian and quantum walk
+    let hamiltonian = graph.cached_hamiltonian();
+    let qw = ContinuousTimeQuantumWalk::new(&hamiltonian);
 
-        let evolved_state = qw.evolve(&initial_state, t);
-        probabilities.push(evolved_state.probabilities().to_vec());
+    let num_steps = (t_max / dt).ceil() as usize;
+    let times: Vec<f64> = (0..=num_steps)
+        .map(|i| ((i as f64) * dt).min(t_max))
+        .collect();
+
+    // Flatten into a row-major (S, T, N) buffer
+    let trajectories = qw.probabilities_batch(&initial_states, &times);
+    let mut probabilities = Vec::with_capacity(initial_states.len() * times.len() * n);
+    for trajectory in &trajectories {
+        for probs in trajectory {
+            probabilities.extend_from_slice(probs);
+        }
     }
+    let probabilities =
+        Array3::from_shape_vec((initial_states.len(), times.len(), n), probabilities)
+            .map_err(|e| PyRuntimeError::new_err(format!("Invalid probability buffer: {}", e)))?;
 
-    // Return as Python dict
     Python::attach(|py| {
         let result = PyDict::new(py);
-        result.set_item("times", times.into_pyobject(py)?)?;
-        // Extract final state before moving probabilities
-        let final_state = probabilities.last().unwrap().clone();
-        result.set_item("probabilities", probabilities.into_pyobject(py)?)?;
-        result.set_item("final_state", final_state.into_pyobject(py)?)?;
+        result.set_item("times", times.into_pyarray(py))?;
+        result.set_item("probabilities", probabilities.into_pyarray(py))?;
         Ok(result.into_any().unbind())
     })
 }
@@ -190,6 +387,8 @@ fn run_quantum_walk(
 ///     graph (MetatronGraph): The graph for the MaxCut problem
 ///     depth (int): QAOA circuit depth (default: 3)
 ///     max_iters (int): Maximum optimization iterations (default: 100)
+///     optimizer (str): Classical optimizer - "nelder_mead", "lbfgs", "adam",
+///         or "gradient_descent" (default: "nelder_mead")
 ///
 /// Returns:
 ///     dict: Dictionary containing:
@@ -202,11 +401,12 @@ fn run_quantum_walk(
 ///     >>> result = solve_maxcut_qaoa(graph, depth=3, max_iters=100)
 ///     >>> print(f"Cut value: {result['cut_value']}")
 #[pyfunction]
-#[pyo3(signature = (graph, depth=3, max_iters=100))]
+#[pyo3(signature = (graph, depth=3, max_iters=100, optimizer="nelder_mead"))]
 fn solve_maxcut_qaoa(
     graph: &PyMetatronGraph,
     depth: usize,
     max_iters: usize,
+    optimizer: &str,
 ) -> PyResult<Py<PyAny>> {
     if depth == 0 {
         return Err(PyValueError::new_err("depth must be positive"));
@@ -214,18 +414,18 @@ fn solve_maxcut_qaoa(
     if max_iters == 0 {
         return Err(PyValueError::new_err("max_iters must be positive"));
     }
+    let optimizer = parse_optimizer(optimizer)?;
 
-    // Create MaxCut Hamiltonian from graph edges
-    let edges: Vec<(usize, usize)> = graph.inner.edges().to_vec();
-
-    let cost_hamiltonian = Arc::new(core::vqa::qaoa::create_maxcut_hamiltonian(&edges));
+    // MaxCut Hamiltonian from graph edges (cached on the graph)
+    let cost_hamiltonian = graph.cached_maxcut_hamiltonian();
 
     // Build and run QAOA
     let qaoa = QAOABuilder::new()
         .cost_hamiltonian(cost_hamiltonian)
         .depth(depth)
-        .optimizer(OptimizerType::NelderMead)
+        .optimizer(optimizer)
         .max_iterations(max_iters)
+        .maxcut_edges(Arc::from(graph.inner.edges()))
         .verbose(false)
         .build();
 
@@ -258,6 +458,9 @@ fn solve_maxcut_qaoa(
 ///     depth (int): Ansatz circuit depth (default: 2)
 ///     max_iters (int): Maximum optimization iterations (default: 100)
 ///     ansatz_type (str): Type of ansatz - "hardware_efficient", "metatron", or "efficient_su2" (default: "hardware_efficient")
+///     optimizer (str): Classical optimizer - "adam", "lbfgs", "nelder_mead",
+///         or "gradient_descent" (default: "adam"). Gradients use the
+///         parameter-shift rule.
 ///
 /// Returns:
 ///     dict: Dictionary containing:
@@ -272,12 +475,13 @@ fn solve_maxcut_qaoa(
 ///     >>> result = run_vqe(graph, depth=2, max_iters=100)
 ///     >>> print(f"Ground state energy: {result['ground_state_energy']:.6f}")
 #[pyfunction]
-#[pyo3(signature = (graph, depth=2, max_iters=100, ansatz_type="hardware_efficient"))]
+#[pyo3(signature = (graph, depth=2, max_iters=100, ansatz_type="hardware_efficient", optimizer="adam"))]
 fn run_vqe(
     graph: &PyMetatronGraph,
     depth: usize,
     max_iters: usize,
     ansatz_type: &str,
+    optimizer: &str,
 ) -> PyResult<Py<PyAny>> {
     if depth == 0 {
         return Err(PyValueError::new_err("depth must be positive"));
@@ -298,16 +502,17 @@ fn run_vqe(
         }
     };
 
-    // Create Hamiltonian
-    let params = QSOParameters::default();
-    let hamiltonian = Arc::new(MetatronHamiltonian::new(&graph.inner, &params));
+    let optimizer = parse_optimizer(optimizer)?;
+
+    // Reuse the cached Hamiltonian
+    let hamiltonian = graph.cached_hamiltonian();
 
     // Build and run VQE
     let vqe = VQEBuilder::new()
         .hamiltonian(hamiltonian)
         .ansatz_type(ansatz)
         .ansatz_depth(depth)
-        .optimizer(OptimizerType::Adam)
+        .optimizer(optimizer)
         .max_iterations(max_iters)
         .learning_rate(0.01)
         .tolerance(1e-6)
@@ -346,20 +551,32 @@ fn run_vqe(
 /// * `t_max` - Maximum evolution time (default: 10.0)
 /// * `dt` - Time step (default: 0.1)
 /// * `samples` - Number of samples for averaging (default: 128)
+/// * `method` - Time-evolution scheme: "spectral", "krylov" or "auto" (default)
 ///
 /// # Returns
 /// List of centrality scores (one per node, normalized to [0, 1])
 #[pyfunction]
-#[pyo3(signature = (graph, t_max=10.0, dt=0.1, samples=128))]
+#[pyo3(signature = (graph, t_max=10.0, dt=0.1, samples=128, method="auto"))]
 fn quantum_walk_centrality(
+    py: Python<'_>,
     graph: &PyMetatronGraph,
     t_max: f64,
     dt: f64,
     samples: usize,
+    method: &str,
 ) -> PyResult<Vec<f64>> {
-    let params = core::quantum_walk_toolkit::QuantumWalkParams { t_max, dt, samples };
+    let params = core::quantum_walk_toolkit::QuantumWalkParams {
+        t_max,
+        dt,
+        samples,
+        method: parse_method(method, graph.inner.nodes().len())?,
+    };
+    let hamiltonian = graph.cached_hamiltonian();
 
-    let centrality = core::quantum_walk_toolkit::quantum_walk_centrality(&graph.inner, &params);
+    // Release the GIL while the walks run in parallel on the Rust side
+    let centrality = py.detach(|| {
+        core::quantum_walk_toolkit::quantum_walk_centrality_with_hamiltonian(&hamiltonian, &params)
+    });
     Ok(centrality)
 }
 
@@ -379,19 +596,30 @@ fn quantum_walk_centrality(
 #[pyfunction]
 #[pyo3(signature = (base_graph, current_graph, t_max=10.0, dt=0.1, samples=128))]
 fn quantum_walk_anomaly_score(
+    py: Python<'_>,
     base_graph: &PyMetatronGraph,
     current_graph: &PyMetatronGraph,
     t_max: f64,
     dt: f64,
     samples: usize,
 ) -> PyResult<Vec<f64>> {
-    let params = core::quantum_walk_toolkit::QuantumWalkParams { t_max, dt, samples };
-
-    let anomaly = core::quantum_walk_toolkit::quantum_walk_anomaly_score(
-        &base_graph.inner,
-        &current_graph.inner,
-        &params,
-    );
+    let params = core::quantum_walk_toolkit::QuantumWalkParams {
+        t_max,
+        dt,
+        samples,
+        ..Default::default()
+    };
+    let base_hamiltonian = base_graph.cached_hamiltonian();
+    let current_hamiltonian = current_graph.cached_hamiltonian();
+
+    // Release the GIL while the walks run in parallel on the Rust side
+    let anomaly = py.detach(|| {
+        core::quantum_walk_toolkit::quantum_walk_anomaly_score_with_hamiltonians(
+            &base_hamiltonian,
+            &current_hamiltonian,
+            &params,
+        )
+    });
     Ok(anomaly)
 }
 
@@ -421,10 +649,18 @@ fn quantum_walk_connectivity(
     dt: f64,
     samples: usize,
 ) -> PyResult<Py<PyAny>> {
-    let params = core::quantum_walk_toolkit::QuantumWalkParams { t_max, dt, samples };
+    let params = core::quantum_walk_toolkit::QuantumWalkParams {
+        t_max,
+        dt,
+        samples,
+        ..Default::default()
+    };
 
-    let metrics =
-        core::quantum_walk_toolkit::quantum_walk_connectivity(&graph.inner, &source_nodes, &params);
+    let metrics = core::quantum_walk_toolkit::quantum_walk_connectivity_with_hamiltonian(
+        &graph.cached_hamiltonian(),
+        &source_nodes,
+        &params,
+    );
 
     Python::attach(|py| {
         let result = PyDict::new(py);
@@ -448,6 +684,8 @@ fn quantum_walk_connectivity(
 /// * `depth` - QAOA circuit depth (default: 3)
 /// * `max_iters` - Maximum optimization iterations (default: 100)
 /// * `seed` - Optional random seed for reproducibility
+/// * `optimizer` - Classical optimizer: "nelder_mead", "lbfgs", "adam", or
+///   "gradient_descent" (default: "nelder_mead")
 ///
 /// # Returns
 /// Dictionary with:
@@ -456,14 +694,24 @@ fn quantum_walk_connectivity(
 ///   - 'approximation_ratio': Quality metric
 ///   - 'meta': Metadata (iterations, partition sizes, etc.)
 #[pyfunction]
-#[pyo3(signature = (graph, depth=3, max_iters=100, seed=None))]
+#[pyo3(signature = (graph, depth=3, max_iters=100, seed=None, optimizer="nelder_mead"))]
 fn solve_maxcut_qaoa_advanced(
     graph: &PyMetatronGraph,
     depth: usize,
     max_iters: usize,
     seed: Option<u64>,
+    optimizer: &str,
 ) -> PyResult<Py<PyAny>> {
-    let solution = core::optimizer::solve_maxcut_advanced(&graph.inner, depth, max_iters, seed);
+    let mut solver =
+        core::optimizer::QaoaMaxCutSolver::from_cost_hamiltonian(graph.cached_maxcut_hamiltonian())
+            .with_depth(depth)
+            .with_max_iterations(max_iters)
+            .with_optimizer(parse_optimizer(optimizer)?)
+            .with_edges(Arc::from(graph.inner.edges()));
+    if let Some(s) = seed {
+        solver = solver.with_seed(s);
+    }
+    let solution = solver.run();
 
     Python::attach(|py| {
         let result = PyDict::new(py);
@@ -490,6 +738,7 @@ fn _metatron_qso_internal(m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     // Core functions
     m.add_function(wrap_pyfunction!(run_quantum_walk, m)?)?;
+    m.add_function(wrap_pyfunction!(run_quantum_walk_batch, m)?)?;
     m.add_function(wrap_pyfunction!(solve_maxcut_qaoa, m)?)?;
     m.add_function(wrap_pyfunction!(run_vqe, m)?)?;
 
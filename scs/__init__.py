@@ -16,7 +16,7 @@ configuration space through:
 __version__ = "0.1.0"
 __author__ = "Sebastian Klemm"
 
-from .config import Configuration, ConfigurationSpace
+from .config import Configuration, ConfigurationSpace, batch_distance
 from .performance import (
     PerformanceTriplet,
     compute_performance_triplet,
@@ -34,6 +34,8 @@ from .benchmark import (
     load_benchmark_batch,
     load_benchmarks,
     write_benchmark,
+    write_record,
+    flush_benchmarks,
     validate_benchmark,
     generate_config_id,
     filter_benchmarks,
@@ -51,6 +53,7 @@ __all__ = [
     # Config
     "Configuration",
     "ConfigurationSpace",
+    "batch_distance",
     # Performance
     "PerformanceTriplet",
     "compute_performance_triplet",
@@ -80,6 +83,8 @@ __all__ = [
     "load_benchmark_batch",
     "load_benchmarks",
     "write_benchmark",
+    "write_record",
+    "flush_benchmarks",
     "validate_benchmark",
     "generate_config_id",
     "filter_benchmarks",
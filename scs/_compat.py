@@ -0,0 +1,18 @@
+"""
+Compatibility helpers for the Python versions SCS supports (3.8+).
+"""
+
+import functools
+import sys
+from typing import Dict
+
+# dataclass(slots=True) needs Python 3.10; older versions keep a __dict__
+_DATACLASS_SLOTS: Dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+# functools.cache needs Python 3.9
+try:
+    _cache = functools.cache
+except AttributeError:
+    _cache = functools.lru_cache(maxsize=None)
@@ -6,17 +6,78 @@ according to the SCS Benchmark Schema.
 """
 
 from dataclasses import dataclass
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from pathlib import Path
+import functools
+import hashlib
 import json
+import math
+import numpy as np
 import glob
+import os
+import sys
+import atexit
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+from ._compat import _DATACLASS_SLOTS
 
-@dataclass
+# Optional streaming JSON parser for large batch files
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    ijson = None
+    IJSON_AVAILABLE = False
+
+# Optional fast JSON codec; decode errors subclass json.JSONDecodeError
+try:
+    import orjson
+
+    _jsonloads = orjson.loads
+except ImportError:
+    orjson = None
+    _jsonloads = json.loads
+
+# Optional compiled schema validator
+try:
+    import jsonschema
+except ImportError:
+    jsonschema = None
+
+# Background benchmark writer (see write_benchmark)
+_write_queue: "queue.Queue[Tuple[str, bytes]]" = queue.Queue(maxsize=256)
+_write_errors: List[OSError] = []
+_writer_lock = threading.Lock()
+_writer_thread: Optional[threading.Thread] = None
+
+# Absolute output directories already created by write_benchmark
+_created_dirs: Set[str] = set()
+
+# Optional JIT for the aggregate_benchmarks reduction
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Below this many files, load_benchmarks parses in-process: worker start-up
+# costs more than parsing a few small JSON documents
+_PARALLEL_MIN_FILES = 64
+
+# Config values interned by BenchmarkRecord.from_dict
+_INTERNED_CONFIG_KEYS = ("algorithm", "ansatz_type", "optimizer")
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class BenchmarkRecord:
     """
     A validated benchmark record conforming to SCS Benchmark Schema.
+
+    Uses __slots__ where supported, as corpora may hold tens of thousands
+    of records in memory.
     """
 
     system: str
@@ -42,17 +103,92 @@ class BenchmarkRecord:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BenchmarkRecord":
         """Create from dictionary."""
+        # Low-cardinality strings repeat across a corpus; share one copy each
+        config = data["config"]
+        for key in _INTERNED_CONFIG_KEYS:
+            value = config.get(key)
+            if type(value) is str:
+                config[key] = sys.intern(value)
+
         return cls(
-            system=data["system"],
-            config_id=data["config_id"],
+            system=sys.intern(data["system"]),
+            config_id=sys.intern(data["config_id"]),
             timestamp=data["timestamp"],
-            config=data["config"],
+            config=config,
             metrics=data["metrics"],
             raw_results=data.get("raw_results"),
             aux=data.get("aux"),
         )
 
 
+def _is_number(value: Any) -> bool:
+    """A finite int or float; bools are not numbers here."""
+    return (
+        isinstance(value, (int, float))
+        and not isinstance(value, bool)
+        and math.isfinite(value)
+    )
+
+
+def _is_integer(value: Any) -> bool:
+    """An int that is not a bool (3.0 does not count)."""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+_UNIT_INTERVAL = {"type": "number", "minimum": 0.0, "maximum": 1.0}
+
+# SCS Benchmark Schema, the same checks as _check_benchmark. Its "number" and
+# "integer" types use _is_number/_is_integer (see _VALIDATOR), since Draft 7
+# alone accepts NaN for minimum/maximum and 3.0 as an integer.
+_BENCHMARK_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["system", "config_id", "timestamp", "config", "metrics"],
+    "properties": {
+        "system": {"type": "string", "minLength": 1},
+        "config_id": {"type": "string", "minLength": 1},
+        "timestamp": {"type": ["string", "number"]},
+        "config": {
+            "type": "object",
+            "required": ["algorithm"],
+            "properties": {
+                "ansatz_depth": {"type": "integer", "minimum": 1, "maximum": 10},
+                "learning_rate": {
+                    "type": "number",
+                    "exclusiveMinimum": 0.0,
+                    "maximum": 1.0,
+                },
+                "max_iterations": {"type": "integer", "minimum": 1},
+            },
+        },
+        "metrics": {
+            "type": "object",
+            "required": ["psi", "rho", "omega"],
+            "properties": {
+                "psi": _UNIT_INTERVAL,
+                "rho": _UNIT_INTERVAL,
+                "omega": _UNIT_INTERVAL,
+            },
+        },
+        "raw_results": {"type": "object"},
+        "aux": {"type": "object"},
+    },
+}
+
+# Compiled once and reused for every record
+if jsonschema is not None:
+    _VALIDATOR = jsonschema.validators.extend(
+        jsonschema.Draft7Validator,
+        type_checker=jsonschema.Draft7Validator.TYPE_CHECKER.redefine_many(
+            {
+                "number": lambda _, value: _is_number(value),
+                "integer": lambda _, value: _is_integer(value),
+            }
+        ),
+    )(_BENCHMARK_SCHEMA)
+else:
+    _VALIDATOR = None
+
+
 class BenchmarkValidationError(Exception):
     """Raised when benchmark validation fails."""
 
@@ -63,6 +199,9 @@ def validate_benchmark(record: Dict[str, Any], strict: bool = True) -> bool:
     """
     Validate a benchmark record against the SCS schema.
 
+    Uses the precompiled ``jsonschema`` validator when ``jsonschema`` is
+    installed, and the equivalent hand-written checks otherwise.
+
     Args:
         record: Benchmark record dictionary
         strict: If True, raise exception on validation failure
@@ -73,6 +212,35 @@ def validate_benchmark(record: Dict[str, Any], strict: bool = True) -> bool:
     Raises:
         BenchmarkValidationError: If validation fails and strict=True
     """
+    if _VALIDATOR is not None:
+        errors = [_format_schema_error(e) for e in _VALIDATOR.iter_errors(record)]
+    else:
+        errors = _check_benchmark(record)
+
+    if errors:
+        if strict:
+            raise BenchmarkValidationError(f"Validation errors: {errors}")
+        return False
+
+    return True
+
+
+def _format_schema_error(error: Any) -> str:
+    """Render a jsonschema error with the path of the offending field."""
+    path = ".".join(str(part) for part in error.absolute_path)
+    return f"'{path}': {error.message}" if path else error.message
+
+
+def _check_benchmark(record: Dict[str, Any]) -> List[str]:
+    """
+    Check a benchmark record without jsonschema.
+
+    Args:
+        record: Benchmark record dictionary
+
+    Returns:
+        List of validation error messages (empty if valid)
+    """
     errors = []
 
     # Required fields
@@ -81,10 +249,8 @@ def validate_benchmark(record: Dict[str, Any], strict: bool = True) -> bool:
         if field not in record:
             errors.append(f"Missing required field: {field}")
 
-    if errors and strict:
-        raise BenchmarkValidationError(f"Validation errors: {errors}")
-    elif errors:
-        return False
+    if errors:
+        return errors
 
     # Type validation
     if not isinstance(record["system"], str) or not record["system"]:
@@ -93,7 +259,7 @@ def validate_benchmark(record: Dict[str, Any], strict: bool = True) -> bool:
     if not isinstance(record["config_id"], str) or not record["config_id"]:
         errors.append("'config_id' must be non-empty string")
 
-    if not isinstance(record["timestamp"], (str, int, float)):
+    if not isinstance(record["timestamp"], str) and not _is_number(record["timestamp"]):
         errors.append("'timestamp' must be string or number")
 
     if not isinstance(record["config"], dict):
@@ -111,7 +277,7 @@ def validate_benchmark(record: Dict[str, Any], strict: bool = True) -> bool:
                 errors.append(f"'metrics' missing required field: {metric}")
             else:
                 value = record["metrics"][metric]
-                if not isinstance(value, (int, float)):
+                if not _is_number(value):
                     errors.append(f"'metrics.{metric}' must be number")
                 elif not 0.0 <= value <= 1.0:
                     errors.append(
@@ -129,29 +295,24 @@ def validate_benchmark(record: Dict[str, Any], strict: bool = True) -> bool:
     config = record.get("config", {})
     if "ansatz_depth" in config:
         depth = config["ansatz_depth"]
-        if not isinstance(depth, int) or not 1 <= depth <= 10:
+        if not _is_integer(depth) or not 1 <= depth <= 10:
             errors.append(
                 f"'config.ansatz_depth' must be integer in [1, 10], got {depth}"
             )
 
     if "learning_rate" in config:
         lr = config["learning_rate"]
-        if not isinstance(lr, (int, float)) or not 0.0 < lr <= 1.0:
+        if not _is_number(lr) or not 0.0 < lr <= 1.0:
             errors.append(f"'config.learning_rate' must be in (0, 1], got {lr}")
 
     if "max_iterations" in config:
         max_iter = config["max_iterations"]
-        if not isinstance(max_iter, int) or max_iter < 1:
+        if not _is_integer(max_iter) or max_iter < 1:
             errors.append(
                 f"'config.max_iterations' must be positive integer, got {max_iter}"
             )
 
-    if errors:
-        if strict:
-            raise BenchmarkValidationError(f"Validation errors: {errors}")
-        return False
-
-    return True
+    return errors
 
 
 def load_benchmark(path: Union[str, Path]) -> BenchmarkRecord:
@@ -169,8 +330,8 @@ def load_benchmark(path: Union[str, Path]) -> BenchmarkRecord:
         FileNotFoundError: If file doesn't exist
         json.JSONDecodeError: If JSON is malformed
     """
-    with open(path, "r") as f:
-        data = json.load(f)
+    with open(path, "rb") as f:
+        data = _jsonloads(f.read())
 
     # Validate
     validate_benchmark(data, strict=True)
@@ -183,6 +344,10 @@ def load_benchmark_batch(path: Union[str, Path]) -> List[BenchmarkRecord]:
     """
     Load a batch of benchmark records from JSON file.
 
+    If ``ijson`` is installed, records are parsed and validated one at a time
+    while streaming the file, so peak memory does not grow with the raw
+    document and a corrupt record fails before the rest is read.
+
     Args:
         path: Path to batch JSON file
 
@@ -192,14 +357,26 @@ def load_benchmark_batch(path: Union[str, Path]) -> List[BenchmarkRecord]:
     Raises:
         BenchmarkValidationError: If validation fails
     """
-    with open(path, "r") as f:
-        data = json.load(f)
+    if IJSON_AVAILABLE:
+        with open(path, "rb") as f:
+            records = _collect_batch(ijson.items(f, "benchmarks.item", use_float=True))
+        if records:
+            return records
+        # Nothing streamed: either an empty array or no 'benchmarks' key
+
+    with open(path, "rb") as f:
+        data = _jsonloads(f.read())
 
     if "benchmarks" not in data:
         raise BenchmarkValidationError("Batch file must contain 'benchmarks' array")
 
+    return _collect_batch(data.pop("benchmarks"))
+
+
+def _collect_batch(benchmarks: Iterable[Dict[str, Any]]) -> List[BenchmarkRecord]:
+    """Validate and convert an iterable of raw batch entries."""
     records = []
-    for i, benchmark in enumerate(data["benchmarks"]):
+    for i, benchmark in enumerate(benchmarks):
         try:
             validate_benchmark(benchmark, strict=True)
             records.append(BenchmarkRecord.from_dict(benchmark))
@@ -209,12 +386,19 @@ def load_benchmark_batch(path: Union[str, Path]) -> List[BenchmarkRecord]:
     return records
 
 
-def load_benchmarks(path_or_pattern: Union[str, Path]) -> List[BenchmarkRecord]:
+def load_benchmarks(
+    path_or_pattern: Union[str, Path], max_workers: Optional[int] = None
+) -> List[BenchmarkRecord]:
     """
     Load benchmark records from file(s) matching path or glob pattern.
 
+    Large file sets are parsed in parallel worker processes; small ones are
+    parsed in-process, where pool start-up would cost more than it saves.
+
     Args:
         path_or_pattern: Path to file, directory, or glob pattern
+        max_workers: Number of worker processes (default: CPU count);
+            1 disables parallel parsing
 
     Returns:
         List of BenchmarkRecord instances
@@ -225,35 +409,84 @@ def load_benchmarks(path_or_pattern: Union[str, Path]) -> List[BenchmarkRecord]:
         load_benchmarks("benchmarks/vqe_*.json")
         load_benchmarks("benchmarks/**/*.json")
     """
-    path_str = str(path_or_pattern)
+    files = _benchmark_files(path_or_pattern)
     records = []
 
-    # If it's a directory, search for all JSON files
+    if max_workers == 1 or len(files) < _PARALLEL_MIN_FILES:
+        for file_path in files:
+            records.extend(_load_file(file_path))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for file_records in executor.map(_load_file, files, chunksize=32):
+                records.extend(file_records)
+
+    return records
+
+
+def _benchmark_files(path_or_pattern: Union[str, Path]) -> List[str]:
+    """Resolve a file, directory, or glob pattern to benchmark file paths."""
+    path_str = str(path_or_pattern)
+
+    # If it's a directory, walk it for all JSON files
     if Path(path_str).is_dir():
-        pattern = str(Path(path_str) / "**/*.json")
-        files = glob.glob(pattern, recursive=True)
+        return list(_iter_json(path_str))
     # If it contains glob characters, use glob
-    elif "*" in path_str or "?" in path_str:
-        files = glob.glob(path_str, recursive=True)
+    if "*" in path_str or "?" in path_str:
+        return glob.glob(path_str, recursive=True)
     # Otherwise, treat as single file
-    else:
-        files = [path_str]
+    return [path_str]
 
-    for file_path in files:
+
+def _load_file(file_path: str) -> List[BenchmarkRecord]:
+    """
+    Load all benchmark records from one file.
+
+    Tries the single-record format first, then the batch format.
+
+    Args:
+        file_path: Path to benchmark JSON file
+
+    Returns:
+        List of records; empty if the file does not match the schema
+    """
+    try:
+        # Try loading as single benchmark
+        return [load_benchmark(file_path)]
+    except (BenchmarkValidationError, KeyError):
+        # Try loading as batch
         try:
-            # Try loading as single benchmark
-            record = load_benchmark(file_path)
-            records.append(record)
+            return load_benchmark_batch(file_path)
         except (BenchmarkValidationError, KeyError):
-            # Try loading as batch
-            try:
-                batch_records = load_benchmark_batch(file_path)
-                records.extend(batch_records)
-            except (BenchmarkValidationError, KeyError):
-                # Skip files that don't match schema
-                pass
+            # Skip files that don't match schema
+            return []
 
-    return records
+
+def _iter_json(root: Union[str, Path]) -> Iterator[str]:
+    """
+    Yield paths of all JSON files below a directory.
+
+    Streams entries with ``os.scandir`` so callers can start parsing before
+    the tree is fully enumerated. Like a recursive ``**/*.json`` glob, hidden
+    files and directories are skipped; directory symlinks are not followed,
+    which rules out cycles.
+
+    Args:
+        root: Directory to walk
+
+    Yields:
+        Paths of ``.json`` files
+    """
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".json"):
+                    yield entry.path
 
 
 def write_benchmark(
@@ -264,10 +497,18 @@ def write_benchmark(
     aux: Optional[Dict[str, Any]] = None,
     output_path: Optional[Union[str, Path]] = None,
     config_id: Optional[str] = None,
+    sync: bool = True,
+    validate: bool = False,
 ) -> str:
     """
     Write a benchmark record to JSON file.
 
+    The record is checked and serialized immediately. With ``sync=False``
+    the file itself is written by a background writer thread so the caller
+    does not wait on disk I/O; the returned path may not exist yet, and
+    write errors are raised by :func:`flush_benchmarks`, which must be
+    called before reading the file back.
+
     Args:
         system: System identifier (e.g., "vqe", "qaoa_maxcut")
         config: Configuration dictionary
@@ -276,6 +517,10 @@ def write_benchmark(
         aux: Optional auxiliary metadata
         output_path: Output file path (auto-generated if None)
         config_id: Configuration ID (auto-generated if None)
+        sync: Write the file before returning (False queues it for the
+            background writer)
+        validate: Validate with the jsonschema validator instead of the
+            equivalent hand-written checks
 
     Returns:
         Path to written file
@@ -285,35 +530,239 @@ def write_benchmark(
     """
     # Generate config_id if not provided
     if config_id is None:
+        if not isinstance(config, dict):
+            raise BenchmarkValidationError("'config' must be object/dict")
         config_id = generate_config_id(config)
 
+    # One clock read, so the filename and payload timestamps agree
+    now = datetime.now()
+
     # Create benchmark record
     benchmark = {
         "system": system,
         "config_id": config_id,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now.timestamp(),
         "config": config,
         "metrics": metrics,
         "raw_results": raw_results or {},
         "aux": aux or {},
     }
 
-    # Validate before writing
-    validate_benchmark(benchmark, strict=True)
+    # Validate before writing, so load_benchmark accepts every written file
+    if validate:
+        validate_benchmark(benchmark, strict=True)
+    else:
+        _quick_check(benchmark)
 
     # Generate output path if not provided
     if output_path is None:
-        timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = f"benchmarks/{system}_{timestamp_str}_{config_id}.json"
+        output_path = _default_output_path(system, now, config_id)
+
+    return _write_payload(benchmark, str(output_path), sync)
+
+
+def write_record(
+    record: BenchmarkRecord,
+    output_path: Optional[Union[str, Path]] = None,
+    sync: bool = True,
+    skip_check: bool = False,
+) -> str:
+    """
+    Write an already-built benchmark record to JSON file.
+
+    Like :func:`write_benchmark`, the record gets the hand-written schema
+    checks before writing, and ``sync=False`` defers the write to the
+    background writer until :func:`flush_benchmarks`.
+
+    Args:
+        record: Benchmark record to write
+        output_path: Output file path (auto-generated if None)
+        sync: Write the file before returning (False queues it for the
+            background writer)
+        skip_check: Skip the check, for records already validated
+
+    Returns:
+        Path to written file
+
+    Raises:
+        BenchmarkValidationError: If validation fails
+    """
+    benchmark = record.to_dict()
+    if not skip_check:
+        _quick_check(benchmark)
+
+    if output_path is None:
+        ts = _record_ts(record.timestamp)
+        # Unparseable timestamps name the file by the time of writing
+        when = datetime.now() if math.isnan(ts) else datetime.fromtimestamp(ts)
+        output_path = _default_output_path(record.system, when, record.config_id)
+
+    return _write_payload(benchmark, str(output_path), sync)
 
+
+def _default_output_path(system: str, when: datetime, config_id: str) -> str:
+    """Auto-generated benchmark file path."""
+    timestamp_str = when.strftime("%Y%m%d_%H%M%S")
+    return f"benchmarks/{system}_{timestamp_str}_{config_id}.json"
+
+
+def _write_payload(benchmark: Dict[str, Any], output_path: str, sync: bool) -> str:
+    """Serialize a benchmark dict and write it, inline or in the background."""
     # Ensure directory exists
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(output_path)
+
+    # Serialize now, so later changes to the inputs cannot leak into the file
+    payload = _encode_json(benchmark)
+
+    if sync:
+        _write_file(output_path, payload)
+    else:
+        # Resolve now, so a later chdir cannot redirect the queued write
+        _enqueue_write(os.path.abspath(output_path), payload)
+
+    return output_path
+
+
+def _quick_check(benchmark: Dict[str, Any]) -> None:
+    """
+    Check a record about to be written by write_benchmark or write_record.
+
+    Runs the hand-written schema checks, which accept exactly what the
+    jsonschema validator accepts without its per-record overhead.
 
-    # Write to file
-    with open(output_path, "w") as f:
-        json.dump(benchmark, f, indent=2)
+    Raises:
+        BenchmarkValidationError: If validation fails
+    """
+    errors = _check_benchmark(benchmark)
+    if errors:
+        raise BenchmarkValidationError(f"Validation errors: {errors}")
+
+
+def _ensure_dir(path: str) -> None:
+    """Create the parent directory of path, once per absolute directory."""
+    directory = os.path.dirname(os.path.abspath(path))
+    if directory not in _created_dirs:
+        os.makedirs(directory, exist_ok=True)
+        _created_dirs.add(directory)
+
+
+def _write_file(path: str, payload: bytes) -> None:
+    """Write payload to path, recreating its directory if it has vanished."""
+    try:
+        with open(path, "wb") as f:
+            f.write(payload)
+    except FileNotFoundError:
+        # Removed since _ensure_dir saw it; create it again and retry
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(payload)
+
+
+def _encode_json(data: Dict[str, Any]) -> bytes:
+    """Serialize a benchmark record as indented JSON."""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    return json.dumps(data, indent=2).encode()
+
+
+def _enqueue_write(path: str, payload: bytes) -> None:
+    """Hand a serialized record to the background writer thread."""
+    global _writer_thread
+
+    with _writer_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(
+                target=_writer_loop, name="scs-benchmark-writer", daemon=True
+            )
+            _writer_thread.start()
+            atexit.register(flush_benchmarks)
 
-    return str(output_path)
+    # Blocks when the queue is full, bounding memory held by pending writes
+    _write_queue.put((path, payload))
+
+
+def _writer_loop() -> None:
+    """Write queued benchmark files until the interpreter exits."""
+    while True:
+        path, payload = _write_queue.get()
+        try:
+            _write_file(path, payload)
+        except OSError as e:
+            _write_errors.append(e)
+        finally:
+            _write_queue.task_done()
+
+
+def flush_benchmarks() -> None:
+    """
+    Wait until all queued benchmark files have been written.
+
+    Raises:
+        OSError: If a background write failed since the last flush
+    """
+    _write_queue.join()
+
+    if _write_errors:
+        error = _write_errors[0]
+        _write_errors.clear()
+        raise error
+
+
+def _lr_token(lr: float) -> str:
+    """Format a learning rate for a config ID (0.01 -> "lr12")."""
+    return f"lr{lr:.0e}".replace("-0", "").replace("e", "")
+
+
+# Per-field formatting for config ID components (str() otherwise)
+_ID_FIELD_FORMATS = {
+    "ansatz_type": lambda v: v.lower().replace("efficient", "eff"),
+    "optimizer": lambda v: v.lower(),
+    "learning_rate": _lr_token,
+}
+
+# Config keys that contribute to a readable config ID
+_ID_KEYS = (
+    "algorithm",
+    "ansatz_type",
+    "ansatz_depth",
+    "optimizer",
+    "learning_rate",
+    "depth",
+)
+
+# Fast paths for the common tuning configs: algorithm -> (keys that affect
+# the ID, keys the template needs, template). A template is used only when
+# exactly its keys are present, so it matches the generic path below.
+_ID_TEMPLATES = {
+    "VQE": (
+        frozenset(
+            {"algorithm", "ansatz_type", "ansatz_depth", "optimizer", "learning_rate"}
+        ),
+        frozenset(
+            {"algorithm", "ansatz_type", "ansatz_depth", "optimizer", "learning_rate"}
+        ),
+        "vqe_{ansatz_type}_d{ansatz_depth}_{optimizer}_{learning_rate}",
+    ),
+    "QAOA": (
+        frozenset(
+            {
+                "algorithm",
+                "ansatz_type",
+                "ansatz_depth",
+                "optimizer",
+                "learning_rate",
+                "depth",
+            }
+        ),
+        frozenset({"algorithm", "optimizer", "depth"}),
+        "qaoa_{optimizer}_p{depth}",
+    ),
+}
 
 
 def generate_config_id(config: Dict[str, Any], max_length: int = 64) -> str:
@@ -331,6 +780,47 @@ def generate_config_id(config: Dict[str, Any], max_length: int = 64) -> str:
         {"algorithm": "VQE", "ansatz_type": "Metatron", "ansatz_depth": 2}
         → "vqe_metatron_d2"
     """
+    # Only the ID fields feed the readable ID. The types are part of the key
+    # because e.g. 2 and 2.0 compare equal but format differently.
+    fields = tuple(
+        (key, config[key], type(config[key])) for key in _ID_KEYS if key in config
+    )
+    try:
+        config_id = _cached_config_id(fields, max_length)
+    except TypeError:
+        # Unhashable field values; format without the cache
+        config_id = _format_config_id(config, max_length)
+
+    # If empty, use hash
+    if not config_id:
+        config_str = json.dumps(config, sort_keys=True)
+        # md5, not a faster optional hash: the ID is persisted in file names
+        # and records, so it must not depend on the installed packages
+        config_hash = hashlib.md5(config_str.encode()).hexdigest()[:8]
+        config_id = f"config_{config_hash}"
+
+    return config_id
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_config_id(
+    fields: Tuple[Tuple[str, Any, type], ...], max_length: int
+) -> str:
+    """Memoized _format_config_id over the ID fields of a config."""
+    return _format_config_id({key: value for key, value, _ in fields}, max_length)
+
+
+def _format_config_id(config: Dict[str, Any], max_length: int) -> str:
+    """Build the readable part of a config ID (empty if no ID fields)."""
+    template = _ID_TEMPLATES.get(config.get("algorithm"))
+    if template is not None:
+        relevant, required, fmt = template
+        if relevant.intersection(config) == required:
+            config_id = fmt.format_map(
+                {key: _ID_FIELD_FORMATS.get(key, str)(config[key]) for key in required}
+            )
+            return config_id[:max_length]
+
     parts = []
 
     # Algorithm (lowercase)
@@ -339,8 +829,7 @@ def generate_config_id(config: Dict[str, Any], max_length: int = 64) -> str:
 
     # Ansatz type (lowercase)
     if "ansatz_type" in config:
-        ansatz = config["ansatz_type"].lower().replace("efficient", "eff")
-        parts.append(ansatz)
+        parts.append(_ID_FIELD_FORMATS["ansatz_type"](config["ansatz_type"]))
 
     # Ansatz depth
     if "ansatz_depth" in config:
@@ -348,35 +837,18 @@ def generate_config_id(config: Dict[str, Any], max_length: int = 64) -> str:
 
     # Optimizer (lowercase)
     if "optimizer" in config:
-        opt = config["optimizer"].lower()
-        parts.append(opt)
+        parts.append(config["optimizer"].lower())
 
     # Learning rate (formatted)
     if "learning_rate" in config:
-        lr = config["learning_rate"]
-        lr_str = f"lr{lr:.0e}".replace("-0", "").replace("e", "")
-        parts.append(lr_str)
+        parts.append(_lr_token(config["learning_rate"]))
 
     # QAOA depth
     if "depth" in config and config.get("algorithm") == "QAOA":
         parts.append(f"p{config['depth']}")
 
-    # Join parts
-    config_id = "_".join(parts)
-
-    # Truncate if too long
-    if len(config_id) > max_length:
-        config_id = config_id[:max_length]
-
-    # If empty, use hash
-    if not config_id:
-        import hashlib
-
-        config_str = json.dumps(config, sort_keys=True)
-        config_hash = hashlib.md5(config_str.encode()).hexdigest()[:8]
-        config_id = f"config_{config_hash}"
-
-    return config_id
+    # Join parts and truncate if too long
+    return "_".join(parts)[:max_length]
 
 
 def filter_benchmarks(
@@ -386,6 +858,8 @@ def filter_benchmarks(
     min_psi: Optional[float] = None,
     min_rho: Optional[float] = None,
     min_omega: Optional[float] = None,
+    since: Optional[Union[str, float, datetime]] = None,
+    until: Optional[Union[str, float, datetime]] = None,
 ) -> List[BenchmarkRecord]:
     """
     Filter benchmark records by criteria.
@@ -397,28 +871,117 @@ def filter_benchmarks(
         min_psi: Minimum quality threshold
         min_rho: Minimum stability threshold
         min_omega: Minimum efficiency threshold
+        since: Earliest timestamp (inclusive), as epoch, ISO8601 or datetime
+        until: Latest timestamp (inclusive), as epoch, ISO8601 or datetime;
+            records whose timestamp is not epoch or ISO8601 never match
+            since or until
 
     Returns:
         Filtered list of records
     """
-    filtered = records
+    # Build the active predicates once, cheapest scalar comparisons first
+    predicates = []
 
     if system is not None:
-        filtered = [r for r in filtered if r.system == system]
+        predicates.append(lambda r: r.system == system)
 
     if algorithm is not None:
-        filtered = [r for r in filtered if r.config.get("algorithm") == algorithm]
+        predicates.append(lambda r: r.config.get("algorithm") == algorithm)
 
     if min_psi is not None:
-        filtered = [r for r in filtered if r.metrics["psi"] >= min_psi]
+        predicates.append(lambda r: r.metrics["psi"] >= min_psi)
 
     if min_rho is not None:
-        filtered = [r for r in filtered if r.metrics["rho"] >= min_rho]
+        predicates.append(lambda r: r.metrics["rho"] >= min_rho)
 
     if min_omega is not None:
-        filtered = [r for r in filtered if r.metrics["omega"] >= min_omega]
+        predicates.append(lambda r: r.metrics["omega"] >= min_omega)
+
+    if since is not None:
+        since_ts = _ts_to_float(since)
+        predicates.append(lambda r: _record_ts(r.timestamp) >= since_ts)
 
-    return filtered
+    if until is not None:
+        until_ts = _ts_to_float(until)
+        predicates.append(lambda r: _record_ts(r.timestamp) <= until_ts)
+
+    # Single pass over the records, preserving their order
+    return [r for r in records if all(p(r) for p in predicates)]
+
+
+def _ts_to_float(value: Union[str, float, datetime]) -> float:
+    """
+    Convert a benchmark timestamp to Unix epoch seconds.
+
+    Accepts epoch numbers, ISO8601 strings (including a trailing "Z") and
+    datetime objects. Naive values are taken as local time, matching
+    write_benchmark.
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if value.endswith("Z"):
+        # datetime.fromisoformat only accepts "Z" from Python 3.11
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value).timestamp()
+
+
+def _record_ts(value: Union[str, float]) -> float:
+    """
+    A record's timestamp as epoch seconds, or NaN if it cannot be parsed.
+
+    The schema accepts any string timestamp; NaN fails every comparison, so
+    such records drop out of since/until filters instead of raising.
+    """
+    try:
+        return _ts_to_float(value)
+    except ValueError:
+        return math.nan
+
+
+def _reduce_columns_numpy(values: Any, out: Any) -> Any:
+    """Fill out with the column mean, std, min and max of values."""
+    out[0] = values.mean(axis=0)
+    out[1] = values.std(axis=0)
+    out[2] = values.min(axis=0)
+    out[3] = values.max(axis=0)
+    return out
+
+
+def _reduce_columns_fused(values: Any, out: Any) -> Any:
+    """
+    Fill out with the column mean, std, min and max of values in one pass.
+
+    Uses Welford's update for the variance; std is the population std,
+    matching numpy's default.
+    """
+    n, cols = values.shape
+    for c in range(cols):
+        mean = 0.0
+        m2 = 0.0
+        lo = values[0, c]
+        hi = values[0, c]
+        for i in range(n):
+            x = values[i, c]
+            delta = x - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x - mean)
+            lo = min(lo, x)
+            hi = max(hi, x)
+        out[0, c] = mean
+        out[1, c] = (m2 / n) ** 0.5
+        out[2, c] = lo
+        out[3, c] = hi
+    return out
+
+
+# The fused loop only pays off compiled; cache=True keeps the compiled
+# kernel on disk so later processes skip the JIT step
+if numba is not None:
+    _reduce_columns = numba.njit(cache=True)(_reduce_columns_fused)
+else:
+    _reduce_columns = _reduce_columns_numpy
 
 
 def aggregate_benchmarks(records: List[BenchmarkRecord]) -> Dict[str, Any]:
@@ -434,33 +997,28 @@ def aggregate_benchmarks(records: List[BenchmarkRecord]) -> Dict[str, Any]:
     if not records:
         return {}
 
-    import numpy as np
-
-    psi_values = [r.metrics["psi"] for r in records]
-    rho_values = [r.metrics["rho"] for r in records]
-    omega_values = [r.metrics["omega"] for r in records]
+    # One (N, 3) array of (psi, rho, omega) rows, reduced column-wise
+    values = np.fromiter(
+        (
+            value
+            for r in records
+            for value in (r.metrics["psi"], r.metrics["rho"], r.metrics["omega"])
+        ),
+        dtype=np.float64,
+        count=3 * len(records),
+    ).reshape(-1, 3)
+    means, stds, mins, maxs = _reduce_columns(values, np.empty((4, 3)))
 
     return {
         "count": len(records),
         "systems": list(set(r.system for r in records)),
         "metrics": {
-            "psi": {
-                "mean": np.mean(psi_values),
-                "std": np.std(psi_values),
-                "min": np.min(psi_values),
-                "max": np.max(psi_values),
-            },
-            "rho": {
-                "mean": np.mean(rho_values),
-                "std": np.std(rho_values),
-                "min": np.min(rho_values),
-                "max": np.max(rho_values),
-            },
-            "omega": {
-                "mean": np.mean(omega_values),
-                "std": np.std(omega_values),
-                "min": np.min(omega_values),
-                "max": np.max(omega_values),
-            },
+            name: {
+                "mean": means[k],
+                "std": stds[k],
+                "min": mins[k],
+                "max": maxs[k],
+            }
+            for k, name in enumerate(("psi", "rho", "omega"))
         },
     }
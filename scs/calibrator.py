@@ -11,8 +11,13 @@ Implements the 5-step calibration loop:
 
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List
+import functools
+import itertools
 import json
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 
 from .config import Configuration, ConfigurationSpace
 from .performance import (
@@ -25,13 +30,39 @@ from .operators import DoubleKickOperator
 from .por import ProofOfResonance, PoRCriteria
 from .cri import ResonanceImpulse, ResonanceImpulseConfig
 
+# Optional fast JSON codec for state and history files
+try:
+    import orjson
+
+    _jsonloads = orjson.loads
+except ImportError:
+    orjson = None
+    _jsonloads = json.loads
+
 
 @dataclass
 class CalibrationHistory:
-    """Records history of calibration steps."""
+    """
+    Records history of calibration steps.
+
+    On disk the history is JSON Lines, one step per line, so saving only
+    appends the steps added since the last save.
+    """
 
     steps: List[Dict[str, Any]] = field(default_factory=list)
 
+    # Number of steps already written, per history file
+    _saved: Dict[str, int] = field(default_factory=dict, repr=False, compare=False)
+
+    # Last recorded performance and its dict, shared by consecutive steps
+    # that keep the same performance (rejected candidates)
+    _last_performance: Optional[PerformanceTriplet] = field(
+        default=None, repr=False, compare=False
+    )
+    _last_performance_dict: Optional[Dict[str, float]] = field(
+        default=None, repr=False, compare=False
+    )
+
     def add_step(
         self,
         step: int,
@@ -42,33 +73,195 @@ class CalibrationHistory:
         cri_triggered: bool,
     ) -> None:
         """Add a calibration step to history."""
+        # Consecutive steps with the same triplet share its dict
+        if performance is not self._last_performance:
+            self._last_performance = performance
+            self._last_performance_dict = performance.to_dict()
+
         self.steps.append(
             {
                 "step": step,
                 "config": config.to_dict(),
-                "performance": performance.to_dict(),
+                "performance": self._last_performance_dict,
                 "j_t": j_t,
                 "por_accepted": por_result,
                 "cri_triggered": cri_triggered,
-                "timestamp": time.time(),
+                "timestamp": time.time_ns(),
             }
         )
 
-    def save(self, path: str) -> None:
-        """Save history to JSON file."""
-        with open(path, "w") as f:
-            json.dump({"history": self.steps}, f, indent=2)
+    def save(self, path: str, rotate_bytes: int = 0) -> None:
+        """
+        Append the steps not yet saved to path to the JSON Lines file.
+
+        Args:
+            path: History file
+            rotate_bytes: If positive, a file already larger than this is
+                moved to ``path + ".1"`` before appending; earlier rotated
+                files move up one number (``.1`` to ``.2`` and so on)
+        """
+        if path not in self._saved:
+            _convert_legacy_history(path)
+            self._saved[path] = 0
+
+        if rotate_bytes > 0:
+            try:
+                if os.path.getsize(path) > rotate_bytes:
+                    for n in range(len(_rotated_history_paths(path)), 0, -1):
+                        os.replace(f"{path}.{n}", f"{path}.{n + 1}")
+                    os.replace(path, path + ".1")
+            except FileNotFoundError:
+                pass
+
+        with open(path, "a") as f:
+            f.writelines(
+                _dumps(step) + "\n" for step in self.steps[self._saved[path] :]
+            )
+        self._saved[path] = len(self.steps)
+
+    def truncate(self, path: str) -> None:
+        """
+        Empty the history file at path and delete its rotated files, so the
+        next save starts the history afresh.
+        """
+        try:
+            with open(path, "r+b") as f:
+                f.truncate()
+        except FileNotFoundError:
+            pass
+        for rotated in _rotated_history_paths(path):
+            os.remove(rotated)
+        self._saved[path] = 0
 
     @classmethod
     def load(cls, path: str) -> "CalibrationHistory":
-        """Load history from JSON file."""
-        with open(path, "r") as f:
-            data = json.load(f)
+        """
+        Load history from a JSON Lines (or legacy JSON) file, preceded by
+        the steps in its rotated files, oldest first.
+        """
         history = cls()
-        history.steps = data["history"]
+        for rotated in reversed(_rotated_history_paths(path)):
+            history.steps.extend(_read_history(rotated))
+        history.steps.extend(_read_history(path))
+        history._saved[path] = len(history.steps)
         return history
 
 
+def estimate_candidate_performance(
+    config: Configuration, base: PerformanceTriplet
+) -> PerformanceTriplet:
+    """
+    Estimate the performance of a candidate configuration.
+
+    In a full implementation, this would run actual benchmarks.
+    Here we apply heuristic adjustments to the current performance. Kept at
+    module level so worker processes can run it.
+
+    Args:
+        config: Candidate configuration
+        base: Performance of the current configuration
+
+    Returns:
+        Estimated performance triplet
+    """
+    psi, rho, omega = estimate_candidates_batch([config], base)[0].tolist()
+    return PerformanceTriplet(psi=psi, rho=rho, omega=omega)
+
+
+def estimate_candidates_batch(
+    configs: List[Configuration], base: PerformanceTriplet
+) -> np.ndarray:
+    """
+    Estimate the performance of many candidates at once.
+
+    Args:
+        configs: Candidate configurations
+        base: Performance of the current configuration
+
+    Returns:
+        Array of shape (len(configs), 3) with estimated (ψ, ρ, ω) rows
+    """
+    deltas = np.zeros((len(configs), 3))
+    for row, config in zip(deltas, configs):
+        # Quality heuristics
+        if config.ansatz_type == "Metatron" and 1 <= config.ansatz_depth <= 3:
+            row[0] += 0.02
+        if config.optimizer == "Adam":
+            row[0] += 0.01
+
+        # Stability heuristics
+        if config.num_random_starts >= 3:
+            row[1] += 0.03
+
+        # Efficiency heuristics
+        if config.ansatz_depth <= 2:
+            row[2] += 0.02
+
+    base_row = np.array([base.psi, base.rho, base.omega])
+    return np.minimum(1.0, base_row + deltas)
+
+
+def _dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to JSON text, with orjson when it is installed."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def _rotated_history_paths(path: str) -> List[str]:
+    """Existing rotated files of a history file, newest (``.1``) first."""
+    paths = []
+    while os.path.exists(f"{path}.{len(paths) + 1}"):
+        paths.append(f"{path}.{len(paths) + 1}")
+    return paths
+
+
+def _read_history(path: str) -> List[Dict[str, Any]]:
+    """
+    Read history steps, accepting the legacy {"history": [...]} format.
+
+    JSON Lines files are decoded one line at a time straight from bytes, so
+    the whole file text is never held next to the decoded steps.
+    """
+    with open(path, "rb") as f:
+        first = f.readline()
+        if not first.strip():
+            return []
+        if _is_legacy_history(first):
+            return _jsonloads(first + f.read())["history"]
+        return [
+            _jsonloads(line) for line in itertools.chain((first,), f) if line.strip()
+        ]
+
+
+def _is_legacy_history(first: bytes) -> bool:
+    """Whether a history file's first line starts a {"history": [...]} document."""
+    try:
+        record = _jsonloads(first)
+    except ValueError:
+        # Not a document by itself: the legacy indented layout
+        return True
+    # A compact legacy file holds the whole document on its first line
+    return isinstance(record, dict) and "history" in record and "step" not in record
+
+
+def _convert_legacy_history(path: str) -> None:
+    """Rewrite a legacy single-document history file as JSON Lines."""
+    try:
+        with open(path, "rb") as f:
+            first = f.readline()
+    except FileNotFoundError:
+        return
+
+    if first.strip() and _is_legacy_history(first):
+        steps = _read_history(path)
+        with open(path, "w") as f:
+            f.writelines(_dumps(step) + "\n" for step in steps)
+
+
 @dataclass
 class CalibratorConfig:
     """Configuration for the Seraphic Calibrator."""
@@ -91,6 +284,17 @@ class CalibratorConfig:
     # Field dimension
     field_dimension: int = 16
 
+    # History files larger than this are rotated to <history_file>.1 on the
+    # next save, older rotations moving to .2, .3, ... (0 disables rotation)
+    history_rotate_bytes: int = 64 * 1024 * 1024
+
+    # Candidates evaluated per step: the double-kick result plus
+    # num_candidates - 1 of its neighbors
+    num_candidates: int = 1
+
+    # Seed for neighbor generation (None uses the global random state)
+    seed: Optional[int] = None
+
     # Enable/disable SCS (opt-in)
     enabled: bool = True
 
@@ -111,16 +315,9 @@ class SeraphicCalibrator:
         """
         self.config = config or CalibratorConfig()
 
-        # Initialize components
-        self.config_space = ConfigurationSpace()
-        self.field = MandorlaField(dimension=self.config.field_dimension)
-        self.feedback = SeraphicFeedback(field_dimension=self.config.field_dimension)
-        self.double_kick = DoubleKickOperator(
-            update_step=self.config.update_kick_step,
-            stabilization_step=self.config.stabilization_kick_step,
-        )
-        self.por = ProofOfResonance(criteria=self.config.por_criteria)
-        self.cri = ResonanceImpulse(config=self.config.cri_config)
+        # Initialize components (the field, feedback, operators and loader
+        # are built on first use, see the properties below)
+        self.config_space = ConfigurationSpace(seed=self.config.seed)
 
         # State
         self.current_config: Optional[Configuration] = None
@@ -128,8 +325,48 @@ class SeraphicCalibrator:
         self.step_count = 0
         self.history = CalibrationHistory()
 
-        # Benchmark loader
-        self.benchmark_loader = BenchmarkLoader(self.config.benchmark_dir)
+        # Worker pool for candidate evaluation while run_calibration is active
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        # Injection for the last benchmark set seen (see _encode_benchmarks)
+        self._injection_source: Optional[Dict[str, Any]] = None
+        self._injection: Optional[np.ndarray] = None
+
+    # Components are created lazily: a disabled calibrator, or one only used
+    # to inspect state, never pays for them
+
+    @functools.cached_property
+    def field(self) -> MandorlaField:
+        """Mandorla calibration field M(t)."""
+        return MandorlaField(dimension=self.config.field_dimension)
+
+    @functools.cached_property
+    def feedback(self) -> SeraphicFeedback:
+        """Seraphic feedback encoder."""
+        return SeraphicFeedback(field_dimension=self.config.field_dimension)
+
+    @functools.cached_property
+    def double_kick(self) -> DoubleKickOperator:
+        """Double-kick operator T = Φ_V ∘ Φ_U."""
+        return DoubleKickOperator(
+            update_step=self.config.update_kick_step,
+            stabilization_step=self.config.stabilization_kick_step,
+        )
+
+    @functools.cached_property
+    def por(self) -> ProofOfResonance:
+        """Proof-of-Resonance acceptance check."""
+        return ProofOfResonance(criteria=self.config.por_criteria)
+
+    @functools.cached_property
+    def cri(self) -> ResonanceImpulse:
+        """CRI resonance impulse controller."""
+        return ResonanceImpulse(config=self.config.cri_config)
+
+    @functools.cached_property
+    def benchmark_loader(self) -> BenchmarkLoader:
+        """Loader for the baseline benchmark files."""
+        return BenchmarkLoader(self.config.benchmark_dir)
 
     def initialize(self, initial_config: Optional[Configuration] = None) -> None:
         """
@@ -152,12 +389,32 @@ class SeraphicCalibrator:
         self.current_performance = compute_performance_triplet(benchmarks)
 
         # Initialize field with first feedback
-        injection = self.feedback.encode_from_benchmarks(benchmarks)
+        injection = self._encode_benchmarks(benchmarks)
         self.field.update(injection)
 
         # Update CRI
         self.cri.update(self.current_performance)
 
+    def reset_state(self) -> None:
+        """
+        Return to the uninitialized state, reusing the existing components.
+
+        The field is zeroed in place and the CRI history cleared; components
+        not built yet stay unbuilt, and the benchmark caches are kept.
+        """
+        self.current_config = None
+        self.current_performance = None
+        self.step_count = 0
+        self.history = CalibrationHistory()
+        self.config_space.current = None
+        self.config_space.history.clear()
+
+        # Only reset components that have been created
+        if "field" in self.__dict__:
+            self.field.reset()
+        if "cri" in self.__dict__:
+            self.cri.reset()
+
     def calibration_step(self) -> Dict[str, Any]:
         """
         Execute one calibration step of the SCS meta-algorithm.
@@ -172,42 +429,56 @@ class SeraphicCalibrator:
             raise RuntimeError("Calibrator not initialized. Call initialize() first.")
 
         self.step_count += 1
-        step_result = {"step": self.step_count}
 
         # Step 1: Benchmark (load existing benchmarks)
         benchmarks = self.benchmark_loader.load_all_benchmarks()
-        step_result["benchmarks_loaded"] = list(benchmarks.keys())
 
         # Step 2: Seraphic feedback
-        injection = self.feedback.encode_from_benchmarks(benchmarks)
+        injection = self._encode_benchmarks(benchmarks)
         self.field.update(injection)
         self.field.update_submodules(
             self.current_performance, self.current_config.algorithm
         )
-        step_result["field_updated"] = True
 
         # Step 3: Double-kick update
         candidate_config = self.double_kick.apply(
             self.current_config, self.current_performance, self.config_space, self.field
         )
-        step_result["candidate_generated"] = True
-        step_result["candidate_config"] = candidate_config.to_dict()
 
         # Step 4: Proof-of-Resonance
-        # In practice, we'd benchmark the candidate. For now, estimate performance.
-        candidate_performance = self._estimate_candidate_performance(
-            candidate_config, benchmarks
-        )
-        candidate_injection = self.feedback.encode(candidate_performance, benchmarks)
-
-        por_result = self.por.check(
-            self.current_config,
-            self.current_performance,
-            candidate_config,
-            candidate_performance,
-            self.field,
-            candidate_injection,
-        )
+        # In practice, we'd benchmark the candidates. For now, estimate performance.
+        candidates = [candidate_config]
+        if self.config.num_candidates > 1:
+            candidates += self.config_space.generate_neighbors(
+                candidate_config, self.config.num_candidates - 1
+            )
+        performances = self._evaluate_candidates(candidates)
+
+        # Take the best estimate that passes PoR (ties keep the double-kick
+        # candidate first); report the double-kick candidate if none passes
+        por_result = False
+        candidate_performance = performances[0]
+        for index in sorted(
+            range(len(candidates)), key=lambda k: -performances[k].norm()
+        ):
+            injection = self.feedback.encode(performances[index], benchmarks)
+            if self.por.check(
+                self.current_config,
+                self.current_performance,
+                candidates[index],
+                performances[index],
+                self.field,
+                injection,
+            ):
+                candidate_config = candidates[index]
+                candidate_performance = performances[index]
+                candidate_injection = injection
+                por_result = True
+                break
+        else:
+            candidate_injection = self.feedback.encode(
+                candidate_performance, benchmarks
+            )
 
         por_detailed = self.por.detailed_check(
             self.current_config,
@@ -218,34 +489,23 @@ class SeraphicCalibrator:
             candidate_injection,
         )
 
-        step_result["por_result"] = por_result
-        step_result["por_detailed"] = por_detailed
-
         # Accept or reject candidate
         if por_result:
             self.current_config = candidate_config
             self.current_performance = candidate_performance
             self.config_space.set_current(candidate_config)
-            step_result["accepted"] = True
-        else:
-            step_result["accepted"] = False
 
         # Step 5: CRI-check
         j_t = self.cri.update(self.current_performance)
-        step_result["j_t"] = j_t
 
-        cri_triggered = False
+        new_regime_config = None
         if self.cri.should_trigger(self.field):
             new_regime_config = self.cri.apply_impulse(
                 self.current_config, self.config_space, self.field
             )
             self.current_config = new_regime_config
             self.config_space.set_current(new_regime_config)
-            cri_triggered = True
-            step_result["cri_triggered"] = True
-            step_result["new_regime_config"] = new_regime_config.to_dict()
-        else:
-            step_result["cri_triggered"] = False
+        cri_triggered = new_regime_config is not None
 
         # Record step in history
         self.history.add_step(
@@ -257,12 +517,40 @@ class SeraphicCalibrator:
             cri_triggered,
         )
 
-        # Add diagnostics
-        step_result["current_performance"] = self.current_performance.to_dict()
-        step_result["cri_diagnostics"] = self.cri.get_diagnostics()
+        # Build the result in one go rather than growing it key by key
+        step_result = {
+            "step": self.step_count,
+            "benchmarks_loaded": list(benchmarks),
+            "field_updated": True,
+            "candidate_generated": True,
+            "candidate_config": candidate_config.to_dict(),
+            "candidates_evaluated": len(candidates),
+            "por_result": por_result,
+            "por_detailed": por_detailed,
+            "accepted": por_result,
+            "j_t": j_t,
+            "cri_triggered": cri_triggered,
+            "current_performance": self.current_performance.to_dict(),
+            "performance_triplet": self.current_performance,
+            "cri_diagnostics": self.cri.get_diagnostics(),
+        }
+        if cri_triggered:
+            step_result["new_regime_config"] = new_regime_config.to_dict()
 
         return step_result
 
+    def _encode_benchmarks(self, benchmarks: Dict[str, Any]) -> np.ndarray:
+        """
+        Encode benchmarks into a field injection, reusing the last result.
+
+        The loader returns the same dict object while the benchmark files are
+        unchanged, so identity is enough to detect a repeat.
+        """
+        if benchmarks is not self._injection_source:
+            self._injection = self.feedback.encode_from_benchmarks(benchmarks)
+            self._injection_source = benchmarks
+        return self._injection
+
     def _estimate_candidate_performance(
         self, config: Configuration, benchmarks: Dict[str, Any]
     ) -> PerformanceTriplet:
@@ -272,31 +560,23 @@ class SeraphicCalibrator:
         In a full implementation, this would run actual benchmarks.
         Here we use heuristics to estimate.
         """
-        # Start with current performance
-        base_psi = self.current_performance.psi
-        base_rho = self.current_performance.rho
-        base_omega = self.current_performance.omega
-
-        # Apply heuristic adjustments
-        psi = base_psi
-        rho = base_rho
-        omega = base_omega
-
-        # Quality heuristics
-        if config.ansatz_type == "Metatron" and 1 <= config.ansatz_depth <= 3:
-            psi = min(1.0, psi + 0.02)
-        if config.optimizer == "Adam":
-            psi = min(1.0, psi + 0.01)
-
-        # Stability heuristics
-        if config.num_random_starts >= 3:
-            rho = min(1.0, rho + 0.03)
-
-        # Efficiency heuristics
-        if config.ansatz_depth <= 2:
-            omega = min(1.0, omega + 0.02)
+        return estimate_candidate_performance(config, self.current_performance)
+
+    def _evaluate_candidates(
+        self, candidates: List[Configuration]
+    ) -> List[PerformanceTriplet]:
+        """Estimate candidate performances, in the worker pool when one is set."""
+        if self._executor is not None and len(candidates) > 1:
+            evaluate = functools.partial(
+                estimate_candidate_performance, base=self.current_performance
+            )
+            return list(self._executor.map(evaluate, candidates))
 
-        return PerformanceTriplet(psi=psi, rho=rho, omega=omega)
+        estimates = estimate_candidates_batch(candidates, self.current_performance)
+        return [
+            PerformanceTriplet(psi=psi, rho=rho, omega=omega)
+            for psi, rho, omega in estimates.tolist()
+        ]
 
     def save_state(self, path: Optional[str] = None) -> None:
         """
@@ -321,7 +601,7 @@ class SeraphicCalibrator:
         }
 
         with open(path, "w") as f:
-            json.dump(state, f, indent=2)
+            f.write(_dumps(state, indent=True))
 
     def load_state(self, path: Optional[str] = None) -> None:
         """
@@ -334,7 +614,7 @@ class SeraphicCalibrator:
             path = self.config.state_file
 
         with open(path, "r") as f:
-            state = json.load(f)
+            state = _jsonloads(f.read())
 
         self.step_count = state["step_count"]
         if state["current_config"]:
@@ -350,7 +630,19 @@ class SeraphicCalibrator:
         """Save calibration history."""
         if path is None:
             path = self.config.history_file
-        self.history.save(path)
+        self.history.save(path, self.config.history_rotate_bytes)
+
+    def clear_history_file(self, path: Optional[str] = None) -> None:
+        """Empty the history file, so a fresh run does not append to an old one."""
+        if path is None:
+            path = self.config.history_file
+        self.history.truncate(path)
+
+    def load_history(self, path: Optional[str] = None) -> None:
+        """Load calibration history, so later saves append after it."""
+        if path is None:
+            path = self.config.history_file
+        self.history = CalibrationHistory.load(path)
 
     def get_best_configuration(self) -> Configuration:
         """
@@ -363,18 +655,27 @@ class SeraphicCalibrator:
             raise RuntimeError("Calibrator not initialized")
         return self.current_config
 
-    def run_calibration(self, num_steps: int = 10) -> List[Dict[str, Any]]:
+    def run_calibration(
+        self, num_steps: int = 10, num_workers: int = 1
+    ) -> List[Dict[str, Any]]:
         """
         Run multiple calibration steps.
 
         Args:
             num_steps: Number of calibration steps to run
+            num_workers: Worker processes for evaluating the candidates of
+                each step (only used when config.num_candidates > 1)
 
         Returns:
             List of step results
         """
-        results = []
-        for _ in range(num_steps):
-            result = self.calibration_step()
-            results.append(result)
-        return results
+        if num_workers <= 1 or self.config.num_candidates <= 1:
+            return [self.calibration_step() for _ in range(num_steps)]
+
+        # One pool for the whole run, so workers start only once
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            self._executor = executor
+            try:
+                return [self.calibration_step() for _ in range(num_steps)]
+            finally:
+                self._executor = None
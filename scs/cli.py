@@ -36,8 +36,9 @@ def cmd_init(args) -> int:
 
     calibrator.initialize(initial_config)
 
-    # Save state
+    # Save state; history from an earlier run would otherwise be appended to
     calibrator.save_state()
+    calibrator.clear_history_file()
     print(f"Saved initial state to {config.state_file}")
 
     # Print initial performance
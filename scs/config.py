@@ -5,10 +5,46 @@ A configuration c ∈ C encodes the hyperparameters, ansatz choices, and
 optimizer settings for the quantum-hybrid algorithms.
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, replace
 from typing import Dict, Any, Optional, List
 import json
 import copy
+import random
+import numpy as np
+
+# Optional fast JSON codec
+try:
+    import orjson
+
+    _jsonloads = orjson.loads
+except ImportError:
+    orjson = None
+    _jsonloads = json.loads
+
+# Parameters perturbed by ConfigurationSpace.generate_neighbors
+_NEIGHBOR_PARAMS = (
+    "ansatz_depth",
+    "learning_rate",
+    "max_iterations",
+    "num_random_starts",
+    "optimizer",
+    "ansatz_type",
+)
+
+# Immutable param values that Configuration.copy can share
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+# Integer codes for the discrete choices the kick heuristics test, so the
+# scoring path compares ints instead of strings (-1 for unknown values)
+ANSATZ_CODES = {"Metatron": 0, "HardwareEfficient": 1, "EfficientSU2": 2}
+OPTIMIZER_CODES = {"Adam": 0, "LBFGS": 1, "GradientDescent": 2, "COBYLA": 3}
+
+
+def _copy_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a params dict, deeply only when it holds containers."""
+    if all(isinstance(v, _SCALAR_TYPES) for v in params.values()):
+        return dict(params)
+    return copy.deepcopy(params)
 
 
 @dataclass
@@ -44,26 +80,47 @@ class Configuration:
     name: Optional[str] = None
     timestamp: Optional[str] = None
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Reassigning any field invalidates the cached feature vector
+        object.__setattr__(self, name, value)
+        self.__dict__.pop("_feature_cache", None)
+
+        # Keep the integer codes in step with their string fields
+        if name == "ansatz_type":
+            self.__dict__["_ansatz_code"] = ANSATZ_CODES.get(value, -1)
+        elif name == "optimizer":
+            self.__dict__["_optimizer_code"] = OPTIMIZER_CODES.get(value, -1)
+
     def to_dict(self) -> Dict[str, Any]:
-        """Convert configuration to dictionary."""
-        return asdict(self)
+        """
+        Convert configuration to dictionary.
+
+        Builds a new dict on each call; unlike ``asdict`` only ``params`` is
+        copied, and deeply only when it holds containers.
+        """
+        data = {name: getattr(self, name) for name in self.__dataclass_fields__}
+        data["params"] = _copy_params(self.params)
+        return data
 
     def to_json(self) -> str:
         """Serialize configuration to JSON."""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2).decode()
         return json.dumps(self.to_dict(), indent=2)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Configuration":
         """Create configuration from dictionary."""
-        # Filter out keys not in dataclass fields
-        valid_keys = {f.name for f in cls.__dataclass_fields__.values()}
+        # Filter out keys not in dataclass fields; the fields mapping is
+        # keyed by name, so no per-call set is needed
+        valid_keys = cls.__dataclass_fields__
         filtered = {k: v for k, v in data.items() if k in valid_keys}
         return cls(**filtered)
 
     @classmethod
     def from_json(cls, json_str: str) -> "Configuration":
         """Deserialize configuration from JSON."""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(_jsonloads(json_str))
 
     @classmethod
     def from_file(cls, path: str) -> "Configuration":
@@ -76,9 +133,18 @@ class Configuration:
         with open(path, "w") as f:
             f.write(self.to_json())
 
-    def copy(self) -> "Configuration":
-        """Create a deep copy of the configuration."""
-        return copy.deepcopy(self)
+    def copy(self, **changes: Any) -> "Configuration":
+        """
+        Create a deep copy of the configuration.
+
+        Keyword arguments replace the named fields in the copy, which is
+        built in one construction rather than copied and then mutated.
+        """
+        # All fields but params are immutable scalars, so only params needs
+        # copying
+        if "params" not in changes:
+            changes["params"] = _copy_params(self.params)
+        return replace(self, **changes)
 
     def distance(self, other: "Configuration") -> float:
         """
@@ -105,6 +171,52 @@ class Configuration:
 
         return dist
 
+    def feature_vector(self) -> np.ndarray:
+        """
+        Numeric embedding whose L1 distances equal :meth:`distance`.
+
+        Discrete parameters are one-hot encoded (scaled by 0.5, so a change
+        contributes 1.0) over the values admitted by ConfigurationSpace;
+        continuous parameters use the same normalization as ``distance``.
+        The vector is cached until a field is reassigned.
+        """
+        cached = self.__dict__.get("_feature_cache")
+        if cached is None:
+            discrete = (
+                (self.algorithm, ConfigurationSpace.ALGORITHMS),
+                (self.ansatz_type, ConfigurationSpace.ANSATZ_TYPES),
+                (self.optimizer, ConfigurationSpace.OPTIMIZERS),
+            )
+            cached = np.zeros(sum(len(vocab) for _, vocab in discrete) + 4)
+            offset = 0
+            for value, vocab in discrete:
+                if value in vocab:
+                    cached[offset + vocab.index(value)] = 0.5
+                offset += len(vocab)
+            cached[offset:] = (
+                self.ansatz_depth / 10.0,
+                self.learning_rate / 0.1,
+                self.max_iterations / 100.0,
+                self.num_random_starts / 5.0,
+            )
+            self.__dict__["_feature_cache"] = cached
+        return cached
+
+
+def batch_distance(anchor: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    """
+    Distances from one feature vector to each row of a matrix.
+
+    Args:
+        anchor: Feature vector of the reference configuration
+        vectors: Matrix with one feature vector per row
+
+    Returns:
+        L1 distance per row, matching :meth:`Configuration.distance` for
+        admissible configurations
+    """
+    return np.abs(vectors - anchor).sum(axis=1)
+
 
 class ConfigurationSpace:
     """
@@ -119,10 +231,23 @@ class ConfigurationSpace:
     ANSATZ_TYPES = ["HardwareEfficient", "EfficientSU2", "Metatron"]
     OPTIMIZERS = ["Adam", "LBFGS", "GradientDescent", "COBYLA"]
 
-    def __init__(self):
-        """Initialize configuration space."""
+    # Hash sets of the above for membership tests in is_valid
+    _ALGORITHM_SET = frozenset(ALGORITHMS)
+    _ANSATZ_TYPE_SET = frozenset(ANSATZ_TYPES)
+    _OPTIMIZER_SET = frozenset(OPTIMIZERS)
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize configuration space.
+
+        Args:
+            seed: Seed for neighbor generation (the global ``random`` state,
+                as set by ``random.seed``, is used if None)
+        """
         self.current: Optional[Configuration] = None
         self.history: List[Configuration] = []
+        # The random module has the same interface as a Random instance
+        self._rng = random.Random(seed) if seed is not None else random
 
     def default_configuration(self) -> Configuration:
         """Return a default baseline configuration."""
@@ -139,19 +264,39 @@ class ConfigurationSpace:
 
     def is_valid(self, config: Configuration) -> bool:
         """Check if a configuration is admissible."""
-        if config.algorithm not in self.ALGORITHMS:
-            return False
-        if config.ansatz_type not in self.ANSATZ_TYPES:
-            return False
-        if config.optimizer not in self.OPTIMIZERS:
-            return False
+        # Numeric range checks first: they are cheapest and are what random
+        # neighbors usually violate
         if config.ansatz_depth < 1 or config.ansatz_depth > 10:
             return False
         if config.learning_rate <= 0 or config.learning_rate > 1.0:
             return False
         if config.max_iterations < 1:
             return False
-        return True
+        if config.algorithm not in self._ALGORITHM_SET:
+            return False
+        if config.ansatz_type not in self._ANSATZ_TYPE_SET:
+            return False
+        return config.optimizer in self._OPTIMIZER_SET
+
+    def distances(
+        self, config: Configuration, others: List[Configuration]
+    ) -> np.ndarray:
+        """
+        Distances from one configuration to many in a single array operation.
+
+        Matches ``config.distance(other)`` for admissible configurations.
+
+        Args:
+            config: Reference configuration
+            others: Configurations to measure against
+
+        Returns:
+            Array of distances, one per entry of ``others``
+        """
+        if not others:
+            return np.zeros(0)
+        features = np.stack([other.feature_vector() for other in others])
+        return batch_distance(config.feature_vector(), features)
 
     def set_current(self, config: Configuration) -> None:
         """Set the current active configuration."""
@@ -167,52 +312,42 @@ class ConfigurationSpace:
         Generate neighboring configurations in configuration space.
 
         Used by the double-kick operator to explore local variations.
+        Each neighbor changes one parameter within its admissible range, so
+        neighbors of a valid configuration are valid by construction and
+        are only checked when the input itself is not admissible.
         """
         neighbors = []
+        rng = self._rng
+        check = not self.is_valid(config)
 
-        for _ in range(num_neighbors):
-            neighbor = config.copy()
-
-            # Randomly perturb one parameter
-            import random
-
-            param_choice = random.choice(
-                [
-                    "ansatz_depth",
-                    "learning_rate",
-                    "max_iterations",
-                    "num_random_starts",
-                    "optimizer",
-                    "ansatz_type",
-                ]
-            )
-
+        # Draw which parameter each neighbor perturbs in one call
+        for param_choice in rng.choices(_NEIGHBOR_PARAMS, k=num_neighbors):
             if param_choice == "ansatz_depth":
-                neighbor.ansatz_depth = max(
-                    1, min(10, config.ansatz_depth + random.choice([-1, 0, 1]))
-                )
+                value = max(1, min(10, config.ansatz_depth + rng.choice((-1, 0, 1))))
             elif param_choice == "learning_rate":
-                neighbor.learning_rate = max(
-                    0.001, min(0.1, config.learning_rate * random.uniform(0.8, 1.2))
+                value = max(
+                    0.001, min(0.1, config.learning_rate * rng.uniform(0.8, 1.2))
                 )
             elif param_choice == "max_iterations":
-                neighbor.max_iterations = max(
+                value = max(
                     10,
                     min(
                         500,
-                        config.max_iterations + random.choice([-20, -10, 0, 10, 20]),
+                        config.max_iterations + rng.choice((-20, -10, 0, 10, 20)),
                     ),
                 )
             elif param_choice == "num_random_starts":
-                neighbor.num_random_starts = max(
-                    1, min(5, config.num_random_starts + random.choice([-1, 0, 1]))
+                value = max(
+                    1, min(5, config.num_random_starts + rng.choice((-1, 0, 1)))
                 )
             elif param_choice == "optimizer":
-                neighbor.optimizer = random.choice(self.OPTIMIZERS)
-            elif param_choice == "ansatz_type":
-                neighbor.ansatz_type = random.choice(self.ANSATZ_TYPES)
+                value = rng.choice(self.OPTIMIZERS)
+            else:  # ansatz_type
+                value = rng.choice(self.ANSATZ_TYPES)
+
+            neighbor = config.copy(**{param_choice: value})
 
-            if self.is_valid(neighbor):
+            if not check or self.is_valid(neighbor):
                 neighbors.append(neighbor)
 
         return neighbors
@@ -4,21 +4,29 @@ SCS Auto-Tuner Core API
 Simplified, high-level API for using SCS as a generic auto-tuner.
 """
 
-from typing import Dict, Any, Optional, List, Union
+from collections import deque
+from typing import Dict, Any, Iterable, Optional, List, Tuple, Union
 from pathlib import Path
 from dataclasses import dataclass
+import functools
+import os
 
 from .config import Configuration, ConfigurationSpace
 from .performance import PerformanceTriplet, compute_performance_triplet
 from .field import MandorlaField
 from .calibrator import SeraphicCalibrator, CalibratorConfig
+from ._compat import _DATACLASS_SLOTS
 from .benchmark import (
+    BenchmarkRecord,
+    _benchmark_files,
+    flush_benchmarks,
     load_benchmarks,
     write_benchmark,
+    write_record,
 )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class NewConfigProposal:
     """
     Proposal for a new configuration from SCS auto-tuner.
@@ -74,6 +82,14 @@ class AutoTuner:
         self.history_file = history_file
         self.enabled = enabled
 
+        # Created on first ingest, then never re-checked
+        self._benchmark_dir_ready = False
+        # Whether benchmark writes may still be queued in the background
+        self._pending_writes = False
+        # Default configuration copied into no-op proposals, built on first use
+        self._noop_config: Optional[Configuration] = None
+        self._state_path = Path(state_file)
+
         # Create calibrator config
         config = CalibratorConfig(
             benchmark_dir=str(self.benchmark_dir),
@@ -100,10 +116,10 @@ class AutoTuner:
         """
         if not self.enabled:
             # Return default config without initializing
-            return ConfigurationSpace().default_configuration()
+            return self._disabled_proposal().config
 
         # Load existing state if available
-        if Path(self.state_file).exists():
+        if self._state_path.exists():
             self.calibrator.load_state()
             self._initialized = True
             return self.calibrator.current_config
@@ -112,11 +128,39 @@ class AutoTuner:
         self.calibrator.initialize(initial_config)
         self._initialized = True
 
-        # Save initial state
+        # Save initial state and start a new history
         self.calibrator.save_state()
+        self.calibrator.clear_history_file()
 
         return self.calibrator.current_config
 
+    def _disabled_proposal(self) -> NewConfigProposal:
+        """
+        A fresh no-op proposal for a disabled tuner.
+
+        The default configuration is built once; each proposal gets its own
+        copy, so callers may modify it.
+        """
+        if self._noop_config is None:
+            self._noop_config = ConfigurationSpace().default_configuration()
+        default_perf = PerformanceTriplet(psi=0.5, rho=0.5, omega=0.5)
+        return NewConfigProposal(
+            config=self._noop_config.copy(),
+            current_performance=default_perf,
+            estimated_performance=default_perf,
+            por_accepted=False,
+            cri_triggered=False,
+            delta_phi=0.0,
+            step=0,
+            j_t=0.125,
+        )
+
+    def _ensure_benchmark_dir(self) -> None:
+        """Create the benchmark directory once per tuner."""
+        if not self._benchmark_dir_ready:
+            self.benchmark_dir.mkdir(parents=True, exist_ok=True)
+            self._benchmark_dir_ready = True
+
     def ingest_benchmark(
         self,
         system: str,
@@ -128,6 +172,9 @@ class AutoTuner:
         """
         Ingest a new benchmark result.
 
+        The file is written in the background and flushed by the next
+        propose_new_config or flush call.
+
         Args:
             system: System identifier (e.g., "vqe", "qaoa_maxcut")
             config: Configuration dictionary
@@ -138,8 +185,8 @@ class AutoTuner:
         Returns:
             Path to written benchmark file
         """
-        # Ensure benchmark directory exists
-        self.benchmark_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_benchmark_dir()
+        self._pending_writes = True
 
         # Write benchmark to file
         output_path = write_benchmark(
@@ -149,10 +196,70 @@ class AutoTuner:
             raw_results=raw_results,
             aux=aux,
             output_path=None,  # Auto-generate
+            sync=False,  # Flushed by propose_new_config or flush
         )
 
         return output_path
 
+    def ingest_record(self, record: BenchmarkRecord) -> str:
+        """
+        Ingest a pre-built benchmark record.
+
+        The record gets the hand-written schema checks, not jsonschema.
+
+        Args:
+            record: Benchmark record assembled by trusted code
+
+        Returns:
+            Path to written benchmark file
+
+        Raises:
+            BenchmarkValidationError: If the record fails validation
+        """
+        self._ensure_benchmark_dir()
+        self._pending_writes = True
+
+        return write_record(record, sync=False)
+
+    def ingest_records(self, records: Iterable[BenchmarkRecord]) -> List[str]:
+        """
+        Ingest a batch of pre-built benchmark records.
+
+        All files are queued for the background writer in one pass; they are
+        flushed to disk by the next propose_new_config or flush call.
+
+        Args:
+            records: Benchmark records assembled by trusted code
+
+        Returns:
+            Paths the records are written to
+
+        Raises:
+            BenchmarkValidationError: If a record fails validation; records
+                before it are already queued
+        """
+        self._ensure_benchmark_dir()
+        self._pending_writes = True
+
+        return [write_record(record, sync=False) for record in records]
+
+    def flush(self) -> None:
+        """
+        Wait until ingested benchmarks have been written to disk.
+
+        Benchmark files go through one background writer shared by the
+        process, so this waits for every queued write, including those of
+        other tuners, and raises the first error any writer hit since the
+        last flush. Does nothing if this tuner queued no writes since its
+        own last flush.
+
+        Raises:
+            OSError: If a queued benchmark write failed since the last flush
+        """
+        if self._pending_writes:
+            self._pending_writes = False
+            flush_benchmarks()
+
     def propose_new_config(
         self,
         current_config: Optional[Configuration] = None,
@@ -173,35 +280,20 @@ class AutoTuner:
         """
         if not self.enabled:
             # Return no-op proposal
-            default_config = ConfigurationSpace().default_configuration()
-            default_perf = PerformanceTriplet(psi=0.5, rho=0.5, omega=0.5)
-            return NewConfigProposal(
-                config=default_config,
-                current_performance=default_perf,
-                estimated_performance=default_perf,
-                por_accepted=False,
-                cri_triggered=False,
-                delta_phi=0.0,
-                step=0,
-                j_t=0.125,
-            )
+            return self._disabled_proposal()
 
         if not self._initialized:
             raise RuntimeError("Auto-tuner not initialized. Call initialize() first.")
 
+        # Make ingested benchmarks visible on disk first
+        self.flush()
+
         # Run calibration step
         step_result = self.calibrator.calibration_step()
 
         # Extract proposal information
         current_perf = self.calibrator.current_performance
-        estimated_perf_dict = step_result.get(
-            "current_performance", current_perf.to_dict()
-        )
-        estimated_perf = PerformanceTriplet(
-            psi=estimated_perf_dict["psi"],
-            rho=estimated_perf_dict["rho"],
-            omega=estimated_perf_dict["omega"],
-        )
+        estimated_perf = step_result.get("performance_triplet", current_perf)
 
         # Compute delta
         delta_phi = estimated_perf.norm() - current_perf.norm()
@@ -285,19 +377,35 @@ class AutoTuner:
         """
         proposals = []
 
-        for _ in range(num_steps):
+        # Sliding window of the last 5 ψ values as (step, ψ) monotonic
+        # deques, so the window min/max sit at the front
+        window = 5
+        min_deque: deque = deque()
+        max_deque: deque = deque()
+
+        for step in range(num_steps):
             proposal = self.propose_new_config()
             proposals.append(proposal)
+            psi = proposal.current_performance.psi
 
             # Check convergence
-            if proposal.current_performance.psi >= min_quality_threshold:
+            if psi >= min_quality_threshold:
                 break
 
+            while min_deque and min_deque[-1][1] >= psi:
+                min_deque.pop()
+            min_deque.append((step, psi))
+            while max_deque and max_deque[-1][1] <= psi:
+                max_deque.pop()
+            max_deque.append((step, psi))
+            if min_deque[0][0] <= step - window:
+                min_deque.popleft()
+            if max_deque[0][0] <= step - window:
+                max_deque.popleft()
+
             # Check stagnation (no improvement in 5 steps)
-            if len(proposals) >= 5:
-                recent_psi = [p.current_performance.psi for p in proposals[-5:]]
-                if max(recent_psi) - min(recent_psi) < 0.01:
-                    break  # Stagnated
+            if step >= window - 1 and max_deque[0][1] - min_deque[0][1] < 0.01:
+                break  # Stagnated
 
         return proposals
 
@@ -306,18 +414,13 @@ class AutoTuner:
         Reset auto-tuner state to default configuration.
         """
         # Remove state files
-        if Path(self.state_file).exists():
-            Path(self.state_file).unlink()
+        if self._state_path.exists():
+            self._state_path.unlink()
 
-        # Re-initialize
+        # Re-initialize, keeping the calibrator and its components
         self._initialized = False
-        config = CalibratorConfig(
-            benchmark_dir=str(self.benchmark_dir),
-            state_file=self.state_file,
-            history_file=self.history_file,
-            enabled=self.enabled,
-        )
-        self.calibrator = SeraphicCalibrator(config)
+        self.calibrator.reset_state()
+        self.calibrator.clear_history_file()
 
 
 # Convenience functions
@@ -384,6 +487,29 @@ def load_and_compute_performance(
     Returns:
         Aggregate performance triplet
     """
+    # Reuse the last result while the resolved files are unchanged
+    files = _benchmark_files(benchmark_path)
+    try:
+        signature = tuple(
+            (f, st.st_mtime_ns, st.st_size) for f, st in zip(files, map(os.stat, files))
+        )
+    except OSError:
+        return _compute_performance(str(benchmark_path))
+
+    # PerformanceTriplet is frozen, so the cached instance can be shared
+    return _cached_performance(str(benchmark_path), signature)
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_performance(
+    benchmark_path: str, signature: Tuple[Tuple[str, int, int], ...]
+) -> PerformanceTriplet:
+    """Memoized _compute_performance, keyed on the files' (mtime, size)."""
+    return _compute_performance(benchmark_path)
+
+
+def _compute_performance(benchmark_path: str) -> PerformanceTriplet:
+    """Load benchmarks and compute their aggregate performance triplet."""
     # Load benchmarks
     records = load_benchmarks(benchmark_path)
 
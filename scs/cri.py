@@ -6,16 +6,60 @@ attractor, the CRI mechanism triggers a controlled phase transition to
 a different contraction region.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
-import numpy as np
+from typing import Deque, List, Optional, Dict, Any, Tuple
+import itertools
 
+from ._compat import _DATACLASS_SLOTS
 from .config import Configuration, ConfigurationSpace
 from .performance import PerformanceTriplet
 from .field import MandorlaField
 
 
-@dataclass
+# Regime switch per component: algorithm family (with its typical depth),
+# ansatz type, and optimizer with a learning rate suited to it
+_ALGORITHM_TRANSITIONS: Dict[str, Dict[str, Any]] = {
+    "VQE": {"algorithm": "QAOA", "ansatz_depth": 3},  # QAOA: higher depth
+    "QAOA": {"algorithm": "VQE", "ansatz_depth": 2},  # VQE: lower depth
+}
+_ANSATZ_TRANSITIONS = {
+    "Metatron": "EfficientSU2",
+    "EfficientSU2": "HardwareEfficient",
+    "HardwareEfficient": "Metatron",
+}
+_OPTIMIZER_TRANSITIONS = {
+    "Adam": ("LBFGS", 0.1),  # LBFGS can use larger steps
+    "LBFGS": ("GradientDescent", 0.005),
+    "GradientDescent": ("Adam", 0.01),
+    "COBYLA": ("Adam", 0.01),
+}
+
+
+def _regime_transition(
+    algorithm: str, ansatz_type: str, optimizer: str
+) -> Dict[str, Any]:
+    """Field changes that move a configuration to the alternative regime."""
+    changes = dict(_ALGORITHM_TRANSITIONS.get(algorithm, {"algorithm": "VQE"}))
+    changes["ansatz_type"] = _ANSATZ_TRANSITIONS.get(ansatz_type, "Metatron")
+    changes["optimizer"], changes["learning_rate"] = _OPTIMIZER_TRANSITIONS.get(
+        optimizer, ("Adam", 0.01)
+    )
+    return changes
+
+
+# Every regime of the configuration space, resolved up front
+_REGIME_TRANSITIONS: Dict[Tuple[str, str, str], Dict[str, Any]] = {
+    key: _regime_transition(*key)
+    for key in itertools.product(
+        ConfigurationSpace.ALGORITHMS,
+        ConfigurationSpace.ANSATZ_TYPES,
+        ConfigurationSpace.OPTIMIZERS,
+    )
+}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class GlobalCalibrationState:
     """
     Tracks global calibration functional J(t) over time.
@@ -26,6 +70,41 @@ class GlobalCalibrationState:
     history: List[float] = field(default_factory=list)
     window_size: int = 5  # Number of steps to track for stagnation detection
 
+    # Running statistics over the last window (recent) and the one before
+    # it (older), so the stagnation checks need no array allocation.
+    _recent: Deque[float] = field(init=False, repr=False)
+    _older: Deque[float] = field(init=False, repr=False)
+    _recent_sum: float = field(default=0.0, init=False, repr=False)
+    _recent_sumsq: float = field(default=0.0, init=False, repr=False)
+    _older_sum: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self):
+        """Seed the running windows from any pre-existing history."""
+        self._recent = deque(maxlen=self.window_size)
+        self._older = deque(maxlen=self.window_size)
+        history, self.history = self.history, []
+        for j_t in history:
+            self._push(j_t)
+
+    def _push(self, j_t: float) -> None:
+        """Append J(t) to the history and the running windows."""
+        self.history.append(j_t)
+        if len(self.history) > self.window_size * 2:
+            del self.history[0]
+
+        if len(self._recent) == self.window_size:
+            moved = self._recent.popleft()
+            self._recent_sum -= moved
+            self._recent_sumsq -= moved * moved
+            if len(self._older) == self.window_size:
+                self._older_sum -= self._older.popleft()
+            self._older.append(moved)
+            self._older_sum += moved
+
+        self._recent.append(j_t)
+        self._recent_sum += j_t
+        self._recent_sumsq += j_t * j_t
+
     def update(self, performance: PerformanceTriplet) -> float:
         """
         Update global functional with new performance.
@@ -34,15 +113,18 @@ class GlobalCalibrationState:
             Current J(t) value
         """
         # For single configuration, J(t) = ψ · ρ · ω
-        j_t = performance.psi * performance.rho * performance.omega
-        self.history.append(j_t)
-
-        # Keep only recent window
-        if len(self.history) > self.window_size * 2:
-            self.history = self.history[-self.window_size * 2 :]
+        j_t = performance.product()
+        self._push(j_t)
 
         return j_t
 
+    def clear(self) -> None:
+        """Drop all recorded J(t) values."""
+        self.history.clear()
+        self._recent.clear()
+        self._older.clear()
+        self._recent_sum = self._recent_sumsq = self._older_sum = 0.0
+
     def current_value(self) -> float:
         """Get current J(t) value."""
         return self.history[-1] if self.history else 0.0
@@ -54,21 +136,20 @@ class GlobalCalibrationState:
         Returns True if variance of recent J(t) values is below threshold
         and the trend is not improving.
         """
-        if len(self.history) < self.window_size:
+        n = self.window_size
+        if len(self._recent) < n:
             return False
 
-        recent = self.history[-self.window_size :]
-        variance = np.var(recent)
+        recent_mean = self._recent_sum / n
+        variance = max(self._recent_sumsq / n - recent_mean * recent_mean, 0.0)
 
         # Low variance indicates stagnation
         if variance > threshold:
             return False
 
         # Also check if trend is improving
-        if len(self.history) >= self.window_size * 2:
-            older = self.history[-self.window_size * 2 : -self.window_size]
-            recent_mean = np.mean(recent)
-            older_mean = np.mean(older)
+        if len(self._older) == n:
+            older_mean = self._older_sum / n
 
             # Improving trend → not stagnating
             if recent_mean > older_mean + threshold:
@@ -82,20 +163,44 @@ class GlobalCalibrationState:
 
         Returns True if recent trend shows decline.
         """
-        if len(self.history) < self.window_size * 2:
+        n = self.window_size
+        if len(self._older) < n:
             return False
 
-        recent = self.history[-self.window_size :]
-        older = self.history[-self.window_size * 2 : -self.window_size]
-
-        recent_mean = np.mean(recent)
-        older_mean = np.mean(older)
+        recent_mean = self._recent_sum / n
+        older_mean = self._older_sum / n
 
         # Degrading if recent < older by threshold
         return recent_mean < older_mean - threshold
 
+    def is_stuck(
+        self, stagnation_threshold: float = 0.01, degradation_threshold: float = 0.05
+    ) -> bool:
+        """
+        Check for stagnation or degradation in one pass.
+
+        Equivalent to ``is_stagnating(s) or is_degrading(d)``, with the window
+        means computed once.
+        """
+        n = self.window_size
+        if len(self._recent) < n:
+            return False
 
-@dataclass
+        recent_mean = self._recent_sum / n
+        older_mean = self._older_sum / n if len(self._older) == n else None
+
+        # Degrading if recent < older by threshold
+        if older_mean is not None and recent_mean < older_mean - degradation_threshold:
+            return True
+
+        # Stagnating: low variance and no improving trend
+        variance = max(self._recent_sumsq / n - recent_mean * recent_mean, 0.0)
+        if variance > stagnation_threshold:
+            return False
+        return older_mean is None or recent_mean <= older_mean + stagnation_threshold
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ResonanceImpulseConfig:
     """
     Configuration for CRI-style resonance impulse triggers.
@@ -147,6 +252,11 @@ class ResonanceImpulse:
         self.steps_since_last_impulse += 1
         return self.global_state.update(performance)
 
+    def reset(self) -> None:
+        """Forget the J(t) history and the steps since the last impulse."""
+        self.global_state.clear()
+        self.steps_since_last_impulse = 0
+
     def should_trigger(self, field: MandorlaField) -> bool:
         """
         Determine if resonance impulse should be triggered.
@@ -162,16 +272,16 @@ class ResonanceImpulse:
             return False
 
         # Check for stagnation or degradation
-        is_stuck = self.global_state.is_stagnating(
-            self.config.stagnation_threshold
-        ) or self.global_state.is_degrading(self.config.degradation_threshold)
+        is_stuck = self.global_state.is_stuck(
+            self.config.stagnation_threshold, self.config.degradation_threshold
+        )
 
         if not is_stuck:
             return False
 
         # Check if field resonates with alternative regime
         # For this, we look at field energy distribution
-        field_energy = np.linalg.norm(field.field_state)
+        field_energy = field.field_energy
         if field_energy < self.config.min_field_resonance:
             return False
 
@@ -217,46 +327,11 @@ class ResonanceImpulse:
         2. If in one ansatz family, try another
         3. If using one optimizer, try another
         """
-        new_config = current.copy()
-
-        # Strategy 1: Switch algorithm family
-        if current.algorithm == "VQE":
-            new_config.algorithm = "QAOA"
-            new_config.ansatz_depth = 3  # QAOA typically uses higher depth
-        elif current.algorithm == "QAOA":
-            new_config.algorithm = "VQE"
-            new_config.ansatz_depth = 2  # VQE typically lower depth
-        elif current.algorithm == "QuantumWalk":
-            new_config.algorithm = "VQE"
-        else:
-            new_config.algorithm = "VQE"
-
-        # Strategy 2: Switch ansatz type
-        ansatz_alternatives = {
-            "Metatron": "EfficientSU2",
-            "EfficientSU2": "HardwareEfficient",
-            "HardwareEfficient": "Metatron",
-        }
-        new_config.ansatz_type = ansatz_alternatives.get(
-            current.ansatz_type, "Metatron"
-        )
-
-        # Strategy 3: Switch optimizer
-        optimizer_alternatives = {
-            "Adam": "LBFGS",
-            "LBFGS": "GradientDescent",
-            "GradientDescent": "Adam",
-            "COBYLA": "Adam",
-        }
-        new_config.optimizer = optimizer_alternatives.get(current.optimizer, "Adam")
-
-        # Adjust hyperparameters for new regime
-        if new_config.optimizer == "Adam":
-            new_config.learning_rate = 0.01
-        elif new_config.optimizer == "LBFGS":
-            new_config.learning_rate = 0.1  # LBFGS can use larger steps
-        else:
-            new_config.learning_rate = 0.005
+        key = (current.algorithm, current.ansatz_type, current.optimizer)
+        changes = _REGIME_TRANSITIONS.get(key)
+        if changes is None:
+            changes = _regime_transition(*key)
+        new_config = current.copy(**changes)
 
         # Validate and return
         if config_space.is_valid(new_config):
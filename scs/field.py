@@ -6,14 +6,59 @@ the evolution of configurations through resonance patterns.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import functools
 import numpy as np
 import json
+import os
 
-from .performance import PerformanceTriplet
+from ._compat import _DATACLASS_SLOTS, _cache
+from .performance import PerformanceTriplet, compute_performance_triplet
 
 
-@dataclass
+# Field arrays are float32: M(t) is L2-normalized and only compared by
+# cosine similarity, so float64 precision buys nothing but bandwidth
+_FIELD_DTYPE = np.float32
+
+
+def _compact_floats(array: np.ndarray) -> List[float]:
+    """Floats at their shortest float32 repr, for compact JSON output."""
+    return array.astype(str).astype(float).tolist()
+
+
+@_cache
+def _harmonic_table(dim: int) -> np.ndarray:
+    """Read-only table of sin(2πi/dim) for i in [0, dim)."""
+    table = np.sin(2 * np.pi * np.arange(dim) / dim).astype(_FIELD_DTYPE)
+    table.flags.writeable = False
+    return table
+
+
+@_cache
+def _phase_tables(dim: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Read-only sin(φ), cos(φ), sin(2φ) tables for φ = 2πi/dim."""
+    phase = 2 * np.pi * np.arange(dim) / dim
+    tables = tuple(
+        table.astype(_FIELD_DTYPE)
+        for table in (np.sin(phase), np.cos(phase), np.sin(2 * phase))
+    )
+    for table in tables:
+        table.flags.writeable = False
+    return tables
+
+
+@functools.lru_cache(maxsize=32)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a JSON file once per (path, mtime, size).
+
+    The returned dict is shared between callers and must not be modified.
+    """
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class MandorlaField:
     """
     The Mandorla-like calibration field M(t) ∈ R^m.
@@ -23,25 +68,69 @@ class MandorlaField:
     """
 
     dimension: int = 16  # Dimension m of the field
-    field_state: np.ndarray = field(default_factory=lambda: np.zeros(16))
+    field_state: np.ndarray = field(
+        default_factory=lambda: np.zeros(16, dtype=_FIELD_DTYPE)
+    )
 
     # Update coefficients (α, βᵢ, γ from Eq. 1)
     alpha: float = 0.95  # Memory decay factor
     gamma: float = 0.5  # Injection weight
     beta_weights: List[float] = field(default_factory=lambda: [0.1, 0.1, 0.1])
 
-    # Resonance submodule contributions G_i(t)
+    # Resonance submodule contributions G_i(t); after construction these
+    # are row views into `submodules`
     submodule_states: List[np.ndarray] = field(default_factory=list)
 
+    # All G_i(t) as one contiguous (k, m) array
+    submodules: np.ndarray = field(init=False, repr=False, compare=False)
+
+    # β as an array, and a scratch buffer for the update
+    _beta: np.ndarray = field(init=False, repr=False, compare=False)
+    _buf: np.ndarray = field(init=False, repr=False, compare=False)
+
+    # Cached L2 norm of field_state (None until computed)
+    _norm_cache: Optional[float] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         """Initialize field state if needed."""
         if len(self.field_state) != self.dimension:
-            self.field_state = np.zeros(self.dimension)
-        if not self.submodule_states:
+            self.field_state = np.zeros(self.dimension, dtype=_FIELD_DTYPE)
+        else:
+            self.field_state = np.array(self.field_state, dtype=_FIELD_DTYPE)
+        if len(self.submodule_states) == 0:
             self.submodule_states = [
-                np.zeros(self.dimension) for _ in self.beta_weights
+                np.zeros(self.dimension, dtype=_FIELD_DTYPE) for _ in self.beta_weights
             ]
 
+        self.submodules = np.array(self.submodule_states, dtype=_FIELD_DTYPE).reshape(
+            len(self.submodule_states), self.dimension
+        )
+        self.submodule_states = list(self.submodules)
+        self._beta = np.asarray(self.beta_weights, dtype=_FIELD_DTYPE)
+        self._buf = np.empty(self.dimension, dtype=_FIELD_DTYPE)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Reassigning the field state invalidates its cached norm
+        object.__setattr__(self, name, value)
+        if name == "field_state":
+            object.__setattr__(self, "_norm_cache", None)
+
+    @property
+    def field_energy(self) -> float:
+        """L2 norm of M(t), cached until the field state changes."""
+        norm = self._norm_cache
+        if norm is None:
+            norm = self._norm_cache = float(np.linalg.norm(self.field_state))
+        return norm
+
+    def reset(self) -> None:
+        """Zero the field and submodule states in place."""
+        self.field_state.fill(0.0)
+        self.submodules.fill(0.0)
+        self._norm_cache = 0.0
+
     def update(self, injection: np.ndarray) -> None:
         """
         Update the field according to Eq. (1):
@@ -57,21 +146,18 @@ class MandorlaField:
             )
 
         # Combine: α M(t) + Σᵢ βᵢ Gᵢ(t) + γ Iₜ
-        new_state = self.alpha * self.field_state
-
-        # Add submodule contributions
-        for beta, G_i in zip(self.beta_weights, self.submodule_states):
-            new_state += beta * G_i
-
-        # Add injection
+        new_state = np.multiply(self.field_state, self.alpha, out=self._buf)
+        new_state += self._beta @ self.submodules
         new_state += self.gamma * injection
 
         # Normalize to bounded domain (L2 norm = 1)
         norm = np.linalg.norm(new_state)
         if norm > 0:
-            self.field_state = new_state / norm
+            np.divide(new_state, norm, out=self.field_state)
+            self._norm_cache = 1.0
         else:
-            self.field_state = new_state
+            self.field_state[:] = new_state
+            self._norm_cache = 0.0
 
     def update_submodules(
         self, performance: PerformanceTriplet, algorithm: str
@@ -91,23 +177,29 @@ class MandorlaField:
             "VQC": 2,
         }
 
-        idx = algorithm_map.get(algorithm, 0) % len(self.submodule_states)
+        idx = algorithm_map.get(algorithm, 0) % len(self.submodules)
 
         # Encode performance into submodule
         # Spread the triplet across the field dimension
-        encoded = np.zeros(self.dimension)
-        encoded[0] = performance.psi
-        encoded[1] = performance.rho
-        encoded[2] = performance.omega
-        encoded[3] = performance.harmonic_mean()
-        encoded[4] = performance.geometric_mean()
+        harmonic, geometric, _, _ = performance.derived()
+        encoded = np.empty(self.dimension, dtype=_FIELD_DTYPE)
+        encoded[:5] = (
+            performance.psi,
+            performance.rho,
+            performance.omega,
+            harmonic,
+            geometric,
+        )
 
         # Add some harmonic structure
-        for i in range(5, self.dimension):
-            encoded[i] = np.sin(2 * np.pi * i / self.dimension) * performance.psi
+        np.multiply(
+            _harmonic_table(self.dimension)[5:], performance.psi, out=encoded[5:]
+        )
 
-        # Decay and update submodule
-        self.submodule_states[idx] = 0.8 * self.submodule_states[idx] + 0.2 * encoded
+        # Decay and update submodule (in place, keeping the row views valid)
+        G_i = self.submodules[idx]
+        np.multiply(G_i, 0.8, out=G_i)
+        G_i += 0.2 * encoded
 
     def resonance_with(self, injection: np.ndarray) -> float:
         """
@@ -119,35 +211,52 @@ class MandorlaField:
         if len(injection) != self.dimension:
             raise ValueError("Injection dimension mismatch")
 
-        # Normalize both vectors
-        field_norm = self.field_state / (np.linalg.norm(self.field_state) + 1e-10)
-        injection_norm = injection / (np.linalg.norm(injection) + 1e-10)
-
-        # Compute dot product (cosine similarity)
-        resonance = float(np.dot(field_norm, injection_norm))
+        # Cosine similarity; the field norm is cached (1 after update)
+        scale = (self.field_energy + 1e-10) * (np.linalg.norm(injection) + 1e-10)
+        resonance = float(np.dot(self.field_state, injection) / scale)
         return resonance
 
+    def resonance_with_batch(self, injections: np.ndarray) -> np.ndarray:
+        """
+        Compute resonance_with for a stack of injections.
+
+        Args:
+            injections: (n, m) array, one injection per row
+
+        Returns:
+            (n,) array of correlations in [-1, 1]
+        """
+        injections = np.asarray(injections)
+        if injections.ndim != 2 or injections.shape[1] != self.dimension:
+            raise ValueError("Injection dimension mismatch")
+
+        scale = (self.field_energy + 1e-10) * (
+            np.linalg.norm(injections, axis=1) + 1e-10
+        )
+        return injections @ self.field_state / scale
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize field state to dictionary."""
         return {
             "dimension": self.dimension,
-            "field_state": self.field_state.tolist(),
+            "field_state": _compact_floats(self.field_state),
             "alpha": self.alpha,
             "gamma": self.gamma,
             "beta_weights": self.beta_weights,
-            "submodule_states": [s.tolist() for s in self.submodule_states],
+            "submodule_states": _compact_floats(self.submodules),
         }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MandorlaField":
         """Deserialize field from dictionary."""
-        field = cls(dimension=data["dimension"])
-        field.field_state = np.array(data["field_state"])
-        field.alpha = data["alpha"]
-        field.gamma = data["gamma"]
-        field.beta_weights = data["beta_weights"]
-        field.submodule_states = [np.array(s) for s in data["submodule_states"]]
-        return field
+        return cls(
+            dimension=data["dimension"],
+            field_state=np.asarray(data["field_state"], dtype=_FIELD_DTYPE),
+            alpha=data["alpha"],
+            gamma=data["gamma"],
+            beta_weights=list(data["beta_weights"]),
+            submodule_states=data["submodule_states"],
+        )
 
     def save(self, path: str) -> None:
         """Save field state to file."""
@@ -156,9 +265,35 @@ class MandorlaField:
 
     @classmethod
     def load(cls, path: str) -> "MandorlaField":
-        """Load field state from file."""
-        with open(path, "r") as f:
-            return cls.from_dict(json.load(f))
+        """Load field state from file, reusing the parse while it is unchanged."""
+        st = os.stat(path)
+        return cls.from_dict(_load_json_cached(path, st.st_mtime_ns, st.st_size))
+
+    def save_binary(self, path: str) -> None:
+        """Save field state as raw arrays in NumPy's .npz format."""
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                field_state=self.field_state,
+                submodule_states=self.submodules,
+                beta_weights=np.asarray(self.beta_weights, dtype=float),
+                alpha=self.alpha,
+                gamma=self.gamma,
+            )
+
+    @classmethod
+    def load_binary(cls, path: str) -> "MandorlaField":
+        """Load field state written by save_binary."""
+        with np.load(path) as data:
+            field_state = data["field_state"]
+            return cls(
+                dimension=len(field_state),
+                field_state=field_state,
+                alpha=float(data["alpha"]),
+                gamma=float(data["gamma"]),
+                beta_weights=data["beta_weights"].tolist(),
+                submodule_states=data["submodule_states"],
+            )
 
 
 class SeraphicFeedback:
@@ -171,6 +306,7 @@ class SeraphicFeedback:
     def __init__(self, field_dimension: int = 16):
         """Initialize seraphic feedback encoder."""
         self.field_dimension = field_dimension
+        self._sin_p, self._cos_p, self._sin_2p = _phase_tables(field_dimension)
 
     def encode(
         self,
@@ -187,35 +323,29 @@ class SeraphicFeedback:
         Returns:
             Injection vector Iₜ ∈ R^m
         """
-        injection = np.zeros(self.field_dimension)
-
-        # Primary encoding: performance triplet
-        injection[0] = performance.psi
-        injection[1] = performance.rho
-        injection[2] = performance.omega
-
-        # Derived features
-        injection[3] = performance.harmonic_mean()
-        injection[4] = performance.geometric_mean()
-        injection[5] = performance.norm()
-
-        # Quality-stability product (desired resonance)
-        injection[6] = performance.psi * performance.rho
-
-        # Quality-efficiency product
-        injection[7] = performance.psi * performance.omega
-
-        # All three combined
-        injection[8] = performance.psi * performance.rho * performance.omega
+        psi, rho, omega = performance.psi, performance.rho, performance.omega
+        harmonic, geometric, norm, product = performance.derived()
+        injection = np.empty(self.field_dimension, dtype=_FIELD_DTYPE)
+
+        # Primary encoding (ψ, ρ, ω), derived means and norm, then the
+        # quality-stability, quality-efficiency and combined products
+        injection[:9] = (
+            psi,
+            rho,
+            omega,
+            harmonic,
+            geometric,
+            norm,
+            psi * rho,
+            psi * omega,
+            product,
+        )
 
         # Add harmonic structure to create resonance patterns
-        for i in range(9, self.field_dimension):
-            phase = 2 * np.pi * i / self.field_dimension
-            injection[i] = (
-                0.4 * np.sin(phase) * performance.psi
-                + 0.3 * np.cos(phase) * performance.rho
-                + 0.3 * np.sin(2 * phase) * performance.omega
-            )
+        tail = injection[9:]
+        np.multiply(self._sin_p[9:], 0.4 * psi, out=tail)
+        tail += (0.3 * rho) * self._cos_p[9:]
+        tail += (0.3 * omega) * self._sin_2p[9:]
 
         return injection
 
@@ -231,8 +361,6 @@ class SeraphicFeedback:
         Returns:
             Injection vector Iₜ ∈ R^m
         """
-        from .performance import compute_performance_triplet
-
         # Compute performance triplet
         performance = compute_performance_triplet(benchmarks)
 
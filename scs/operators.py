@@ -7,12 +7,49 @@ towards fixpoint attractors through:
 - Φ_V: stabilization kick (improves stability ρ and efficiency ω)
 """
 
-from typing import Optional, Tuple
-
-from .config import Configuration, ConfigurationSpace
+from typing import List, Optional, Tuple
+import numpy as np
+
+from ._kick_kernels import (
+    best_quality,
+    best_stability,
+    quality_scores,
+    stability_scores,
+)
+from .config import ANSATZ_CODES, OPTIMIZER_CODES, Configuration, ConfigurationSpace
 from .performance import PerformanceTriplet
 from .field import MandorlaField
 
+# Codes the quality heuristics test for
+_METATRON = ANSATZ_CODES["Metatron"]
+_ADAM = OPTIMIZER_CODES["Adam"]
+
+
+def _neighbor_columns(neighbors: List[Configuration]) -> np.ndarray:
+    """
+    Gather the neighbor fields the kick heuristics read into one array.
+
+    The scoring itself lives in ``_kick_kernels``.
+
+    Returns:
+        Array of shape (6, k) whose rows are ansatz_depth, learning_rate,
+        max_iterations, num_random_starts, is-Metatron and is-Adam
+    """
+    return np.array(
+        [
+            (
+                n.ansatz_depth,
+                n.learning_rate,
+                n.max_iterations,
+                n.num_random_starts,
+                n._ansatz_code == _METATRON,
+                n._optimizer_code == _ADAM,
+            )
+            for n in neighbors
+        ],
+        dtype=float,
+    ).T
+
 
 class UpdateKick:
     """
@@ -23,14 +60,16 @@ class UpdateKick:
     Moves configuration along ascent direction of quality.
     """
 
-    def __init__(self, step_size: float = 0.3):
+    def __init__(self, step_size: float = 0.3, num_neighbors: int = 8):
         """
         Initialize update kick.
 
         Args:
             step_size: η_U, step size for quality improvement
+            num_neighbors: Candidates scored per application
         """
         self.step_size = step_size
+        self.num_neighbors = num_neighbors
 
     def apply(
         self,
@@ -38,6 +77,7 @@ class UpdateKick:
         current_performance: PerformanceTriplet,
         config_space: ConfigurationSpace,
         field: Optional[MandorlaField] = None,
+        precomputed_neighbors: Optional[List[Configuration]] = None,
     ) -> Configuration:
         """
         Apply update kick to improve quality.
@@ -47,66 +87,35 @@ class UpdateKick:
             current_performance: Performance triplet Φ(c)
             config_space: Configuration space for neighbor generation
             field: Optional Mandorla field for resonance guidance
+            precomputed_neighbors: Neighbors of ``config`` to score instead
+                of generating a fresh set
 
         Returns:
             Updated configuration c' = Φ_U(c)
         """
         # Generate candidate neighbors
-        neighbors = config_space.generate_neighbors(config, num_neighbors=8)
+        neighbors = precomputed_neighbors
+        if neighbors is None:
+            neighbors = config_space.generate_neighbors(
+                config, num_neighbors=self.num_neighbors
+            )
 
         if not neighbors:
             return config
 
         # Select neighbor that would improve quality
         # In practice, this is a gradient estimation via finite differences
-        best_neighbor = config
-        best_score = current_performance.psi
-
-        for neighbor in neighbors:
-            # Heuristic score: prefer changes that might increase quality
-            # For now, use a simple heuristic based on configuration parameters
-            score = self._estimate_quality_improvement(
-                config, neighbor, current_performance
-            )
-
-            if score > best_score:
-                best_score = score
-                best_neighbor = neighbor
-
-        return best_neighbor
-
-    def _estimate_quality_improvement(
-        self,
-        current: Configuration,
-        candidate: Configuration,
-        current_perf: PerformanceTriplet,
-    ) -> float:
-        """
-        Estimate quality improvement heuristically.
-
-        In a full implementation, this would run a partial benchmark.
-        Here we use heuristics based on known good configurations.
-        """
-        score = current_perf.psi
-
-        # Heuristics for quality improvement:
-        # 1. Metatron ansatz with depth 1-3 is generally good
-        if candidate.ansatz_type == "Metatron" and 1 <= candidate.ansatz_depth <= 3:
-            score += 0.05
-
-        # 2. Adam optimizer is generally reliable
-        if candidate.optimizer == "Adam":
-            score += 0.02
-
-        # 3. Multiple random starts can improve quality
-        if candidate.num_random_starts > current.num_random_starts:
-            score += 0.01 * (candidate.num_random_starts - current.num_random_starts)
-
-        # 4. Moderate learning rate is good
-        if 0.005 <= candidate.learning_rate <= 0.02:
-            score += 0.02
+        # Heuristic score: prefer changes that might increase quality
+        best, score = best_quality(
+            _neighbor_columns(neighbors),
+            current_performance.psi,
+            config.num_random_starts,
+        )
 
-        return min(1.0, score)
+        # First best neighbor, if it beats the current quality
+        if score > current_performance.psi:
+            return neighbors[best]
+        return config
 
 
 class StabilizationKick:
@@ -118,14 +127,16 @@ class StabilizationKick:
     where R(c) points towards higher stability and efficiency.
     """
 
-    def __init__(self, step_size: float = 0.2):
+    def __init__(self, step_size: float = 0.2, num_neighbors: int = 8):
         """
         Initialize stabilization kick.
 
         Args:
             step_size: η_V, step size for stability/efficiency improvement
+            num_neighbors: Candidates scored per application
         """
         self.step_size = step_size
+        self.num_neighbors = num_neighbors
 
     def apply(
         self,
@@ -133,6 +144,7 @@ class StabilizationKick:
         current_performance: PerformanceTriplet,
         config_space: ConfigurationSpace,
         field: Optional[MandorlaField] = None,
+        precomputed_neighbors: Optional[List[Configuration]] = None,
     ) -> Configuration:
         """
         Apply stabilization kick to improve stability and efficiency.
@@ -142,63 +154,34 @@ class StabilizationKick:
             current_performance: Performance triplet Φ(c)
             config_space: Configuration space
             field: Optional Mandorla field
+            precomputed_neighbors: Neighbors of ``config`` to score instead
+                of generating a fresh set
 
         Returns:
             Stabilized configuration c' = Φ_V(c)
         """
         # Generate candidates
-        neighbors = config_space.generate_neighbors(config, num_neighbors=8)
+        neighbors = precomputed_neighbors
+        if neighbors is None:
+            neighbors = config_space.generate_neighbors(
+                config, num_neighbors=self.num_neighbors
+            )
 
         if not neighbors:
             return config
 
         # Select neighbor that improves stability/efficiency without hurting quality
-        best_neighbor = config
-        best_score = current_performance.rho * 0.6 + current_performance.omega * 0.4
-
-        for neighbor in neighbors:
-            score = self._estimate_stability_improvement(
-                config, neighbor, current_performance
-            )
-
-            if score > best_score:
-                best_score = score
-                best_neighbor = neighbor
-
-        return best_neighbor
-
-    def _estimate_stability_improvement(
-        self,
-        current: Configuration,
-        candidate: Configuration,
-        current_perf: PerformanceTriplet,
-    ) -> float:
-        """
-        Estimate stability and efficiency improvement heuristically.
-        """
-        rho_score = current_perf.rho
-        omega_score = current_perf.omega
-
-        # Heuristics for stability:
-        # 1. Multiple random starts increase stability
-        if candidate.num_random_starts >= 3:
-            rho_score += 0.05
-
-        # 2. Lower depth can be more stable (less overparameterization)
-        if candidate.ansatz_depth <= 2:
-            rho_score += 0.03
-
-        # Heuristics for efficiency:
-        # 1. Lower depth is more efficient
-        if candidate.ansatz_depth < current.ansatz_depth:
-            omega_score += 0.05
-
-        # 2. Fewer iterations can be more efficient if quality is maintained
-        if candidate.max_iterations < current.max_iterations:
-            omega_score += 0.02
+        best, score = best_stability(
+            _neighbor_columns(neighbors),
+            current_performance.rho,
+            current_performance.omega,
+            config.ansatz_depth,
+            config.max_iterations,
+        )
 
-        # Combined score (weighted)
-        return min(1.0, 0.6 * rho_score + 0.4 * omega_score)
+        if score > current_performance.rho * 0.6 + current_performance.omega * 0.4:
+            return neighbors[best]
+        return config
 
 
 class DoubleKickOperator:
@@ -209,16 +192,31 @@ class DoubleKickOperator:
     locally contractive dynamics towards fixpoint attractors.
     """
 
-    def __init__(self, update_step: float = 0.3, stabilization_step: float = 0.2):
+    def __init__(
+        self,
+        update_step: float = 0.3,
+        stabilization_step: float = 0.2,
+        fused: bool = False,
+        num_neighbors: int = 8,
+    ):
         """
         Initialize double-kick operator.
 
         Args:
             update_step: Step size η_U for quality improvement
             stabilization_step: Step size η_V for stability improvement
+            fused: Without a field, replace the two kicks by one sweep that
+                scores quality and stability together (see _apply_fused)
+            num_neighbors: Candidates scored per kick; with Numba, sets of
+                64 or more are scored in parallel
         """
-        self.update_kick = UpdateKick(step_size=update_step)
-        self.stabilization_kick = StabilizationKick(step_size=stabilization_step)
+        self.update_kick = UpdateKick(
+            step_size=update_step, num_neighbors=num_neighbors
+        )
+        self.stabilization_kick = StabilizationKick(
+            step_size=stabilization_step, num_neighbors=num_neighbors
+        )
+        self.fused = fused
 
     def apply(
         self,
@@ -239,18 +237,67 @@ class DoubleKickOperator:
         Returns:
             New configuration c' = T(c) = Φ_V(Φ_U(c))
         """
+        if self.fused and field is None:
+            return self._apply_fused(config, current_performance, config_space)
+
+        # One neighbor set of c serves both kicks when Φ_U keeps c
+        neighbors = config_space.generate_neighbors(
+            config, num_neighbors=self.update_kick.num_neighbors
+        )
+
         # First: update kick (improve quality)
         intermediate = self.update_kick.apply(
-            config, current_performance, config_space, field
+            config, current_performance, config_space, field, neighbors
         )
 
         # Second: stabilization kick (improve stability and efficiency)
+        shared = (
+            intermediate is config
+            and self.stabilization_kick.num_neighbors == self.update_kick.num_neighbors
+        )
         result = self.stabilization_kick.apply(
-            intermediate, current_performance, config_space, field
+            intermediate,
+            current_performance,
+            config_space,
+            field,
+            neighbors if shared else None,
         )
 
         return result
 
+    def _apply_fused(
+        self,
+        config: Configuration,
+        current_performance: PerformanceTriplet,
+        config_space: ConfigurationSpace,
+    ) -> Configuration:
+        """
+        Approximate T with a single neighbor sweep.
+
+        One set of twice the per-kick neighbor count is scored by the sum
+        of the Φ_U quality and Φ_V stability/efficiency heuristics, and the
+        first best neighbor is taken if it beats the current configuration
+        on that sum.
+        """
+        neighbors = config_space.generate_neighbors(
+            config, num_neighbors=2 * self.update_kick.num_neighbors
+        )
+
+        if not neighbors:
+            return config
+
+        perf = current_performance
+        columns = _neighbor_columns(neighbors)
+        scores = quality_scores(columns, perf.psi, config.num_random_starts)
+        scores += stability_scores(
+            columns, perf.rho, perf.omega, config.ansatz_depth, config.max_iterations
+        )
+
+        best = int(np.argmax(scores))
+        if scores[best] > perf.psi + perf.rho * 0.6 + perf.omega * 0.4:
+            return neighbors[best]
+        return config
+
     def iterate(
         self,
         config: Configuration,
@@ -273,14 +320,20 @@ class DoubleKickOperator:
             Tuple of (final_config, convergence_rate)
         """
         current = config
-        distances = []
+        # Only the first and latest step lengths feed the rate estimate
+        first_dist = last_dist = 0.0
+        steps = 0
 
         for i in range(num_iterations):
             next_config = self.apply(current, performance, config_space, field)
 
-            # Measure distance moved
-            dist = current.distance(next_config)
-            distances.append(dist)
+            # Measure distance moved; a kick that found nothing better hands
+            # back the same object
+            dist = 0.0 if next_config is current else current.distance(next_config)
+            if steps == 0:
+                first_dist = dist
+            last_dist = dist
+            steps += 1
 
             # Check for fixpoint convergence
             if dist < 0.01:
@@ -289,8 +342,8 @@ class DoubleKickOperator:
             current = next_config
 
         # Estimate convergence rate (Lipschitz constant approximation)
-        if len(distances) >= 2:
-            convergence_rate = distances[-1] / (distances[0] + 1e-10)
+        if steps >= 2:
+            convergence_rate = last_dist / (first_dist + 1e-10)
         else:
             convergence_rate = 0.0
 
@@ -10,16 +10,35 @@ All components are normalized to [0, 1].
 """
 
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+import functools
 import json
+import math
+import os
 import numpy as np
 from pathlib import Path
 
+from ._compat import _DATACLASS_SLOTS, _cache
 
-@dataclass
+# Optional fast JSON codec for the benchmark baselines
+try:
+    import orjson
+
+    _jsonloads = orjson.loads
+except ImportError:
+    orjson = None
+    _jsonloads = json.loads
+
+# Exponent for the geometric mean of the three components
+_ONE_THIRD = 1.0 / 3.0
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class PerformanceTriplet:
     """
     The performance triplet Φ(c) = (ψ, ρ, ω) for a configuration.
+
+    Immutable, so instances can be shared between callers and caches.
     """
 
     psi: float  # ψ: semantic quality [0, 1]
@@ -38,7 +57,11 @@ class PerformanceTriplet:
 
     def norm(self) -> float:
         """Compute Euclidean norm of the triplet."""
-        return np.sqrt(self.psi**2 + self.rho**2 + self.omega**2)
+        return math.hypot(self.psi, self.rho, self.omega)
+
+    def product(self) -> float:
+        """Compute the product ψ · ρ · ω."""
+        return self.psi * self.rho * self.omega
 
     def harmonic_mean(self) -> float:
         """Compute harmonic mean of components (overall quality indicator)."""
@@ -48,38 +71,111 @@ class PerformanceTriplet:
 
     def geometric_mean(self) -> float:
         """Compute geometric mean of components."""
-        return (self.psi * self.rho * self.omega) ** (1.0 / 3.0)
+        return (self.psi * self.rho * self.omega) ** _ONE_THIRD
+
+    def derived(self) -> Tuple[float, float, float, float]:
+        """
+        Compute all derived quantities in one pass.
+
+        Returns:
+            Tuple of (harmonic mean, geometric mean, norm, product)
+        """
+        psi, rho, omega = self.psi, self.rho, self.omega
+        product = psi * rho * omega
+        if psi == 0 or rho == 0 or omega == 0:
+            harmonic = 0.0
+        else:
+            harmonic = 3.0 / (1.0 / psi + 1.0 / rho + 1.0 / omega)
+        norm = math.hypot(psi, rho, omega)
+        return harmonic, product**_ONE_THIRD, norm, product
+
+
+# Baseline files read by BenchmarkLoader.load_all_benchmarks
+_BASELINE_FILES = (
+    "vqe_baseline.json",
+    "qaoa_baseline.json",
+    "quantum_walk_baseline.json",
+    "advanced_algorithms_baseline.json",
+    "vqc_baseline.json",
+    "cross_system_baseline.json",
+    "integration_baseline.json",
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a benchmark file once per (path, mtime, size).
+
+    The returned dict is shared between callers and must not be modified.
+    """
+    with open(path, "rb") as f:
+        return _jsonloads(f.read())
+
+
+def _load_json(path) -> Dict[str, Any]:
+    """Load a JSON file through the parse cache, keyed by its current stat."""
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    return _load_json_cached(path, st.st_mtime_ns, st.st_size)
 
 
 class BenchmarkLoader:
     """
     Loads benchmark JSON files and extracts metrics.
+
+    Parsed files are cached by absolute path, mtime and size; the returned
+    dicts are shared and must be treated as read-only.
     """
 
     def __init__(self, benchmark_dir: str = "metatron-qso-rs/ci"):
         """Initialize with path to benchmark directory."""
         self.benchmark_dir = Path(benchmark_dir)
 
+        # Last load_all_benchmarks result and the fingerprint it was read at
+        self._cache_key: Optional[Tuple] = None
+        self._cache: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def fingerprint(self) -> Tuple:
+        """
+        Cheap change marker for the baseline files.
+
+        Returns:
+            Tuple of (mtime_ns, size) per baseline file, None for missing ones
+        """
+        key = []
+        for name in _BASELINE_FILES:
+            try:
+                st = os.stat(self.benchmark_dir / name)
+            except FileNotFoundError:
+                key.append(None)
+            else:
+                key.append((st.st_mtime_ns, st.st_size))
+        return tuple(key)
+
+    def clear_cache(self) -> None:
+        """Drop cached benchmark parses so the next load rereads the files."""
+        _load_json_cached.cache_clear()
+        self._cache_key = None
+        self._cache = None
+
     def load_vqe_benchmark(self, path: Optional[str] = None) -> Dict[str, Any]:
         """Load VQE benchmark results."""
         if path is None:
             path = self.benchmark_dir / "vqe_baseline.json"
-        with open(path, "r") as f:
-            return json.load(f)
+        return _load_json(path)
 
     def load_qaoa_benchmark(self, path: Optional[str] = None) -> Dict[str, Any]:
         """Load QAOA benchmark results."""
         if path is None:
             path = self.benchmark_dir / "qaoa_baseline.json"
-        with open(path, "r") as f:
-            return json.load(f)
+        return _load_json(path)
 
     def load_quantum_walk_benchmark(self, path: Optional[str] = None) -> Dict[str, Any]:
         """Load Quantum Walk benchmark results."""
         if path is None:
             path = self.benchmark_dir / "quantum_walk_baseline.json"
-        with open(path, "r") as f:
-            return json.load(f)
+        return _load_json(path)
 
     def load_advanced_algorithms_benchmark(
         self, path: Optional[str] = None
@@ -87,32 +183,37 @@ class BenchmarkLoader:
         """Load advanced algorithms (Grover, Boson, QML) benchmark results."""
         if path is None:
             path = self.benchmark_dir / "advanced_algorithms_baseline.json"
-        with open(path, "r") as f:
-            return json.load(f)
+        return _load_json(path)
 
     def load_vqc_benchmark(self, path: Optional[str] = None) -> Dict[str, Any]:
         """Load VQC/QML benchmark results."""
         if path is None:
             path = self.benchmark_dir / "vqc_baseline.json"
-        with open(path, "r") as f:
-            return json.load(f)
+        return _load_json(path)
 
     def load_cross_system_benchmark(self, path: Optional[str] = None) -> Dict[str, Any]:
         """Load cross-system comparison benchmark."""
         if path is None:
             path = self.benchmark_dir / "cross_system_baseline.json"
-        with open(path, "r") as f:
-            return json.load(f)
+        return _load_json(path)
 
     def load_integration_benchmark(self, path: Optional[str] = None) -> Dict[str, Any]:
         """Load integration benchmark results."""
         if path is None:
             path = self.benchmark_dir / "integration_baseline.json"
-        with open(path, "r") as f:
-            return json.load(f)
+        return _load_json(path)
 
     def load_all_benchmarks(self) -> Dict[str, Dict[str, Any]]:
-        """Load all available benchmark results."""
+        """
+        Load all available benchmark results.
+
+        The result is reused while no baseline file has changed (same
+        mtime and size), so callers must treat it as read-only.
+        """
+        key = self.fingerprint()
+        if key == self._cache_key:
+            return self._cache
+
         benchmarks = {}
         loaders = {
             "vqe": self.load_vqe_benchmark,
@@ -130,9 +231,20 @@ class BenchmarkLoader:
             except FileNotFoundError:
                 pass  # Skip missing benchmarks
 
+        self._cache_key = key
+        self._cache = benchmarks
         return benchmarks
 
 
+def _small_var(xs) -> float:
+    """Population variance; a scalar two-pass beats np.var on short lists."""
+    n = len(xs)
+    if n >= 32:
+        return float(np.var(xs))
+    m = sum(xs) / n
+    return sum((x - m) * (x - m) for x in xs) / n
+
+
 def compute_vqe_quality(data: Dict[str, Any]) -> float:
     """
     Compute quality score ψ for VQE benchmarks.
@@ -163,7 +275,7 @@ def compute_vqe_stability(data: Dict[str, Any]) -> float:
     """
     if "results" in data and len(data["results"]) > 1:
         quality_scores = [r.get("quality_score", 0.0) for r in data["results"]]
-        variance = np.var(quality_scores)
+        variance = _small_var(quality_scores)
         # Low variance → high stability
         # Map variance [0, 0.1] → stability [1, 0]
         stability = max(0.0, 1.0 - variance * 10.0)
@@ -201,7 +313,7 @@ def compute_qaoa_quality(data: Dict[str, Any]) -> float:
         if isinstance(val, dict) and "approximation_ratio" in val:
             ratios.append(val["approximation_ratio"])
 
-    return np.mean(ratios) if ratios else 0.5
+    return sum(ratios) / len(ratios) if ratios else 0.5
 
 
 def compute_qaoa_stability(data: Dict[str, Any]) -> float:
@@ -259,6 +371,59 @@ def compute_cross_system_efficiency(data: Dict[str, Any]) -> float:
     return 0.5
 
 
+def _vqe_triplet(data: Dict[str, Any]) -> Tuple[float, float, float]:
+    return (
+        compute_vqe_quality(data),
+        compute_vqe_stability(data),
+        compute_vqe_efficiency(data),
+    )
+
+
+def _qaoa_triplet(data: Dict[str, Any]) -> Tuple[float, float, float]:
+    return (
+        compute_qaoa_quality(data),
+        compute_qaoa_stability(data),
+        compute_qaoa_efficiency(data),
+    )
+
+
+def _cross_system_triplet(data: Dict[str, Any]) -> Tuple[float, float, float]:
+    return (
+        compute_cross_system_quality(data),
+        compute_cross_system_stability(data),
+        compute_cross_system_efficiency(data),
+    )
+
+
+# Benchmarks that contribute to Φ(c), each mapped to its (ψ, ρ, ω) scorer
+_TRIPLET_HANDLERS = {
+    "vqe": _vqe_triplet,
+    "qaoa": _qaoa_triplet,
+    "cross_system": _cross_system_triplet,
+}
+
+
+# Default per-algorithm weights for compute_performance_triplet
+_DEFAULT_WEIGHTS = {
+    "vqe": 1.0,
+    "qaoa": 1.0,
+    "quantum_walk": 0.5,
+    "advanced": 0.5,
+    "vqc": 0.5,
+    "cross_system": 1.5,
+    "integration": 0.5,
+}
+
+
+@_cache
+def _default_weight_vec(algos: Tuple[str, ...]) -> np.ndarray:
+    """Normalized default weights for the given algorithms, in order (read-only)."""
+    w = np.array([_DEFAULT_WEIGHTS.get(name, 0.5) for name in algos], dtype=float)
+    w /= w.sum()
+    w.flags.writeable = False
+    return w
+
+
 def compute_performance_triplet(
     benchmarks: Dict[str, Dict[str, Any]],
     algorithm_weights: Optional[Dict[str, float]] = None,
@@ -273,59 +438,37 @@ def compute_performance_triplet(
     Returns:
         PerformanceTriplet with computed (ψ, ρ, ω)
     """
-    if algorithm_weights is None:
-        algorithm_weights = {
-            "vqe": 1.0,
-            "qaoa": 1.0,
-            "quantum_walk": 0.5,
-            "advanced": 0.5,
-            "vqc": 0.5,
-            "cross_system": 1.5,
-            "integration": 0.5,
-        }
-
-    psi_values = []
-    rho_values = []
-    omega_values = []
+    rows = []
+    names = []
     weights = []
 
     # Process each benchmark
     for name, data in benchmarks.items():
-        weight = algorithm_weights.get(name, 0.5)
-        if weight <= 0:
-            continue
-
-        if name == "vqe":
-            psi_values.append(compute_vqe_quality(data))
-            rho_values.append(compute_vqe_stability(data))
-            omega_values.append(compute_vqe_efficiency(data))
-            weights.append(weight)
-        elif name == "qaoa":
-            psi_values.append(compute_qaoa_quality(data))
-            rho_values.append(compute_qaoa_stability(data))
-            omega_values.append(compute_qaoa_efficiency(data))
-            weights.append(weight)
-        elif name == "cross_system":
-            psi_values.append(compute_cross_system_quality(data))
-            rho_values.append(compute_cross_system_stability(data))
-            omega_values.append(compute_cross_system_efficiency(data))
+        handler = _TRIPLET_HANDLERS.get(name)
+        if handler is None:
+            continue  # Add more algorithm handlers as needed
+        if algorithm_weights is None:
+            if _DEFAULT_WEIGHTS.get(name, 0.5) <= 0:
+                continue
+            names.append(name)
+        else:
+            weight = algorithm_weights.get(name, 0.5)
+            if weight <= 0:
+                continue
             weights.append(weight)
-        # Add more algorithm handlers as needed
+        rows.append(handler(data))
 
     # Compute weighted averages
-    if not psi_values:
+    if not rows:
         return PerformanceTriplet(psi=0.5, rho=0.5, omega=0.5)
 
-    weights = np.array(weights)
-    weights = weights / weights.sum()  # Normalize
-
-    psi = float(np.average(psi_values, weights=weights))
-    rho = float(np.average(rho_values, weights=weights))
-    omega = float(np.average(omega_values, weights=weights))
+    if algorithm_weights is None:
+        triplet = _default_weight_vec(tuple(names)) @ np.array(rows, dtype=float)
+    else:
+        w = np.array(weights, dtype=float)
+        triplet = w @ np.array(rows, dtype=float) / w.sum()
 
     # Ensure all values are in [0, 1]
-    psi = max(0.0, min(1.0, psi))
-    rho = max(0.0, min(1.0, rho))
-    omega = max(0.0, min(1.0, omega))
+    psi, rho, omega = np.clip(triplet, 0.0, 1.0).tolist()
 
     return PerformanceTriplet(psi=psi, rho=rho, omega=omega)
@@ -9,12 +9,13 @@ from dataclasses import dataclass
 from typing import Optional
 import numpy as np
 
+from ._compat import _DATACLASS_SLOTS
 from .config import Configuration
 from .performance import PerformanceTriplet
 from .field import MandorlaField
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class PoRCriteria:
     """
     Thresholds and tolerances for Proof-of-Resonance test.
@@ -53,6 +54,22 @@ class ProofOfResonance:
         """
         self.criteria = criteria or PoRCriteria()
 
+    @property
+    def criteria(self) -> PoRCriteria:
+        """Acceptance criteria thresholds."""
+        return self._criteria
+
+    @criteria.setter
+    def criteria(self, criteria: PoRCriteria) -> None:
+        self._criteria = criteria
+
+        # Thresholds hoisted for check/check_batch; PoRCriteria is frozen,
+        # so they only change when criteria is reassigned
+        self._min_q = criteria.min_quality_delta
+        self._tol = criteria.stability_tolerance
+        self._min_eff = criteria.min_efficiency
+        self._min_res = criteria.min_field_resonance
+
     def check(
         self,
         current_config: Configuration,
@@ -76,24 +93,54 @@ class ProofOfResonance:
         Returns:
             True if candidate passes PoR, False otherwise
         """
-        # (i) Non-decrease of quality
-        if not self._check_quality(current_performance, candidate_performance):
-            return False
+        return (
+            # (i) Non-decrease of quality
+            candidate_performance.psi >= current_performance.psi + self._min_q
+            # (ii) Stability consistency
+            and candidate_performance.rho >= current_performance.rho - self._tol
+            # (iii) Efficiency consistency
+            and candidate_performance.omega >= self._min_eff
+            # (iv) Field-level resonance
+            and (
+                field is None
+                or candidate_injection is None
+                or field.resonance_with(candidate_injection) >= self._min_res
+            )
+        )
+
+    def check_batch(
+        self,
+        current_performance: PerformanceTriplet,
+        candidate_psi: np.ndarray,
+        candidate_rho: np.ndarray,
+        candidate_omega: np.ndarray,
+        field: Optional[MandorlaField] = None,
+        candidate_injections: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Check many candidates against the same current configuration.
 
-        # (ii) Stability consistency
-        if not self._check_stability(current_performance, candidate_performance):
-            return False
+        Args:
+            current_performance: Φ(c)
+            candidate_psi: ψ(c') per candidate
+            candidate_rho: ρ(c') per candidate
+            candidate_omega: ω(c') per candidate
+            field: Mandorla field M(t)
+            candidate_injections: Optional (n, m) injections, one row per candidate
 
-        # (iii) Efficiency consistency
-        if not self._check_efficiency(candidate_performance):
-            return False
+        Returns:
+            Boolean array, True where the candidate passes PoR
+        """
+        mask = (
+            (np.asarray(candidate_psi) >= current_performance.psi + self._min_q)
+            & (np.asarray(candidate_rho) >= current_performance.rho - self._tol)
+            & (np.asarray(candidate_omega) >= self._min_eff)
+        )
 
-        # (iv) Field-level resonance
-        if field is not None and candidate_injection is not None:
-            if not self._check_field_resonance(field, candidate_injection):
-                return False
+        if field is not None and candidate_injections is not None:
+            mask &= field.resonance_with_batch(candidate_injections) >= self._min_res
 
-        return True
+        return mask
 
     def _check_quality(
         self, current: PerformanceTriplet, candidate: PerformanceTriplet